@@ -13,15 +13,18 @@ import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from rdflib import Graph
+
 from src.config import get_settings
 from src.matching.registry import IntentMatcherRegistry
+from src.models.signifier import Signifier
 from src.storage.registry import SignifierRegistry
 from src.validation.context_builder import ContextGraphBuilder
-from src.validation.shacl_validator import SHACLValidator
+from src.validation.shacl_validator import SHACLValidator, ValidationResult
 
 import warnings
 warnings.filterwarnings("ignore")
@@ -67,6 +70,12 @@ class ScenarioTestRunner:
         self.matcher_registry = None
         self.context_builder = None
         self.shacl_validator = None
+        self._signifier_cache: Optional[
+            Tuple[List[Dict[str, Any]], Dict[str, Signifier]]
+        ] = None
+        self._context_graph_cache: Dict[str, Graph] = {}
+        self._shapes_graph_by_id: Dict[str, Graph] = {}
+        self._validation_memo: Dict[Tuple[str, int], ValidationResult] = {}
 
     def print_header(self, text: str) -> None:
         """Print a section header.
@@ -115,6 +124,9 @@ class ScenarioTestRunner:
             List of loaded signifier IDs
         """
         self.print_header("STEP 3: Loading Signifiers")
+        self._signifier_cache = None
+        self._shapes_graph_by_id.clear()
+        self._validation_memo.clear()
 
         signifier_files = sorted(self.signifiers_dir.glob("*.ttl"))
         print(f"Found {len(signifier_files)} signifier files\n")
@@ -139,6 +151,78 @@ class ScenarioTestRunner:
         print(f"\nLoaded {len(loaded_ids)} signifiers")
         return loaded_ids
 
+    def _get_signifiers(self) -> Tuple[List[Dict[str, Any]], Dict[str, Signifier]]:
+        """Get the registry's signifiers as dicts and by ID.
+
+        The signifier set does not change while queries run, so the
+        model_dump pass is done once and reused until signifiers are
+        loaded again.
+
+        Returns:
+            Tuple of (signifier dicts, signifiers by ID)
+        """
+        if self._signifier_cache is None:
+            all_signifiers = self.registry.list_signifiers(limit=10000)
+            self._signifier_cache = (
+                [s.model_dump() for s in all_signifiers],
+                {s.signifier_id: s for s in all_signifiers},
+            )
+        return self._signifier_cache
+
+    def _build_context_graph(self, context: Dict[str, Any]) -> Graph:
+        """Get the context graph for a query context.
+
+        Queries in a scenario often share a context, so graphs are memoized
+        by the context's canonical JSON. Validation never modifies the
+        data graph, so cached graphs can be shared.
+
+        Args:
+            context: Query context in any format normalize_context accepts
+
+        Returns:
+            Context RDF graph
+        """
+        key = json.dumps(context, sort_keys=True)
+        context_graph = self._context_graph_cache.get(key)
+        if context_graph is None:
+            context_graph, _ = self.context_builder.normalize_context(context)
+            self._context_graph_cache[key] = context_graph
+        return context_graph
+
+    def _validate(
+        self, signifier: Signifier, context_graph: Graph
+    ) -> ValidationResult:
+        """Validate a context graph against a signifier's SHACL shapes.
+
+        Each signifier's shapes are parsed once and the parsed graph is
+        reused for every later query. Results are memoized per signifier
+        and context graph; context graphs are kept in _context_graph_cache
+        for the whole run, so their ids identify them.
+
+        Args:
+            signifier: Signifier with SHACL shapes
+            context_graph: Context graph from _build_context_graph
+
+        Returns:
+            ValidationResult
+        """
+        memo_key = (signifier.signifier_id, id(context_graph))
+        result = self._validation_memo.get(memo_key)
+        if result is not None:
+            return result
+
+        shapes_graph = self._shapes_graph_by_id.get(signifier.signifier_id)
+        if shapes_graph is None:
+            shapes_graph = self.shacl_validator.parse_shapes(
+                signifier.context.shacl_shapes, format="turtle"
+            )
+            self._shapes_graph_by_id[signifier.signifier_id] = shapes_graph
+        result = self.shacl_validator.validate(
+            context_graph, shapes_graph, stable_identity=True
+        )
+        self._validation_memo[memo_key] = result
+        return result
+
     def run_queries(self) -> Dict[str, Any]:
         """Run all queries from queries.json.
 
@@ -190,8 +274,7 @@ class ScenarioTestRunner:
         }
 
         try:
-            all_signifiers = self.registry.list_signifiers(limit=10000)
-            signifier_dicts = [s.model_dump() for s in all_signifiers]
+            signifier_dicts, id_to_sig = self._get_signifiers()
             print(f"Total signifiers in registry: {len(signifier_dicts)}")
 
             print(f"\nPhase 1: Intent Matching")
@@ -199,14 +282,15 @@ class ScenarioTestRunner:
                 intent_query=intent,
                 signifiers=signifier_dicts,
                 k=10,
-                version="v1"
+                version="v1",
+                corpus_version=self.registry.epoch,
             )
 
-            context_graph, _ = self.context_builder.normalize_context(context)
+            context_graph = self._build_context_graph(context)
 
             matches = []
             for match in match_results:
-                signifier = self.registry.get(match.signifier_id)
+                signifier = id_to_sig.get(match.signifier_id)
                 if not signifier:
                     continue
 
@@ -216,11 +300,7 @@ class ScenarioTestRunner:
                 shacl_result = {"conforms": True, "violations": []}
 
                 if signifier.context.shacl_shapes:
-                    validation = self.shacl_validator.validate_signifier_context(
-                        context_graph,
-                        signifier.context.shacl_shapes,
-                        format="turtle"
-                    )
+                    validation = self._validate(signifier, context_graph)
                     shacl_result = {
                         "conforms": validation.conforms,
                         "violations": [v.message for v in validation.violations]
@@ -33,6 +33,15 @@ async def lifespan(app: FastAPI):
     logger.info(f"Storage directory: {settings.storage_dir}")
     logger.info(f"Enabled modules: {settings.enabled_modules}")
     logger.info(f"Authoring validation: {settings.enable_authoring_validation}")
+
+    if settings.embedding_warmup:
+        for matcher_registry in (
+            simple_signifiers.matcher_registry,
+            retrieval.orchestrator.matcher_registry,
+            matching.matcher_registry,
+        ):
+            matcher_registry.warm_up(num_threads=settings.embedding_num_threads)
+
     yield
     logger.info(f"Shutting down {settings.app_name}")
 
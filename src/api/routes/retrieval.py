@@ -224,3 +224,18 @@ async def retrieve_match(request: MatchRequest) -> MatchResponse:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Retrieval failed: {str(e)}",
         )
+
+
+@router.post("/clear-cache")
+async def clear_cache() -> dict:
+    """Clear cached retrieval responses and the SHACL validation cache.
+
+    Retrieval responses embed SHACL outcomes, so both are dropped together.
+
+    Returns:
+        Success message
+    """
+    orchestrator.shacl_validator.clear_cache()
+    orchestrator.clear_cache()
+    logger.info("Retrieval caches cleared")
+    return {"message": "Cache cleared successfully"}
@@ -5,16 +5,23 @@ This module provides simplified endpoints:
 - POST /signifiers - Create signifier from RDF
 - DELETE /signifiers - Delete all signifiers (clear memory)
 - GET /signifiers/match - Match query with intent and context
+- POST /validate/shacl/batch - Validate one context against stored signifiers
 """
 
+import hashlib
 import logging
 import shutil
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
+from src.api.routes.validation import (
+    BatchValidateSHACLRequest,
+    BatchValidateSHACLResponse,
+    BatchValidationResult,
+)
 from src.config import get_settings
 from src.matching.registry import IntentMatcherRegistry
 from src.storage.registry import SignifierRegistry
@@ -231,18 +238,20 @@ async def delete_all_signifiers() -> DeleteAllResponse:
     try:
         all_signifiers = registry.list_signifiers(limit=10000)
         deleted_count = len(all_signifiers)
-
-        storage_dir = Path(settings.storage_dir)
-        if storage_dir.exists():
-            for subdir in ["rdf", "json", "indexes"]:
-                subdir_path = storage_dir / subdir
-                if subdir_path.exists():
-                    shutil.rmtree(subdir_path)
-
-        registry = SignifierRegistry(
-            storage_dir=settings.storage_dir,
-            enable_authoring_validation=False,
-        )
+        registry.close()
+
+        try:
+            storage_dir = Path(settings.storage_dir)
+            if storage_dir.exists():
+                for subdir in ["rdf", "json", "indexes"]:
+                    subdir_path = storage_dir / subdir
+                    if subdir_path.exists():
+                        shutil.rmtree(subdir_path)
+        finally:
+            registry = SignifierRegistry(
+                storage_dir=settings.storage_dir,
+                enable_authoring_validation=False,
+            )
 
         logger.info(f"Deleted all signifiers (count: {deleted_count})")
 
@@ -293,6 +302,7 @@ async def match_signifiers(
 
         all_signifiers = registry.list_signifiers(limit=10000)
         signifier_dicts = [s.model_dump() for s in all_signifiers]
+        id_to_sig = {s.signifier_id: s for s in all_signifiers}
 
         logger.info(f"Matching intent: '{intent}' against {len(signifier_dicts)} signifiers")
 
@@ -307,7 +317,7 @@ async def match_signifiers(
 
         matches = []
         for match in match_results:
-            signifier = registry.get(match.signifier_id)
+            signifier = id_to_sig.get(match.signifier_id)
             if not signifier:
                 continue
 
@@ -352,3 +362,108 @@ async def match_signifiers(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Matching failed: {str(e)}"
         )
+
+
+@router.post(
+    "/validate/shacl/batch",
+    response_model=BatchValidateSHACLResponse,
+    status_code=status.HTTP_200_OK,
+)
+def validate_shacl_batch(
+    request: BatchValidateSHACLRequest,
+) -> BatchValidateSHACLResponse:
+    """Validate one context against the shapes of several signifiers.
+
+    The context is normalized once and signifiers are grouped by their
+    SHACL shapes text, so pyshacl runs once per unique shapes graph rather
+    than once per signifier. Signifiers without shapes trivially conform.
+
+    Args:
+        request: Batch SHACL validation request
+
+    Returns:
+        Validation result per requested signifier
+
+    Raises:
+        HTTPException: If a signifier is missing or validation fails
+    """
+    try:
+        shape_groups: Dict[str, Tuple[str, List[str]]] = {}
+        no_shapes: List[str] = []
+        missing: List[str] = []
+
+        for signifier_id in request.signifier_ids:
+            signifier = registry.get(signifier_id)
+            if not signifier:
+                missing.append(signifier_id)
+                continue
+
+            shapes = signifier.context.shacl_shapes
+            if not shapes:
+                no_shapes.append(signifier_id)
+                continue
+
+            shape_hash = hashlib.sha256(shapes.encode("utf-8")).hexdigest()
+            if shape_hash not in shape_groups:
+                shape_groups[shape_hash] = (shapes, [])
+            shape_groups[shape_hash][1].append(signifier_id)
+
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Signifiers not found: {', '.join(missing)}",
+            )
+
+        context_graph, _ = context_builder.normalize_context(request.context)
+
+        if request.artifact_types:
+            context_graph = context_builder.add_type_information(
+                context_graph, request.artifact_types
+            )
+
+        results_by_id: Dict[str, BatchValidationResult] = {}
+        for signifier_id in no_shapes:
+            results_by_id[signifier_id] = BatchValidationResult(
+                signifier_id=signifier_id, conforms=True, violations=[]
+            )
+
+        for shapes, signifier_ids in shape_groups.values():
+            result = shacl_validator.validate_signifier_context(
+                context_graph, shapes
+            )
+            violations = [v.to_dict() for v in result.violations]
+            for signifier_id in signifier_ids:
+                results_by_id[signifier_id] = BatchValidationResult(
+                    signifier_id=signifier_id,
+                    conforms=result.conforms,
+                    violations=violations,
+                )
+
+        results = [results_by_id[sid] for sid in request.signifier_ids]
+        conforming_count = sum(1 for r in results if r.conforms)
+
+        logger.info(
+            f"Batch SHACL validation: {len(results)} signifiers, "
+            f"{len(shape_groups)} unique shapes, {conforming_count} conforming"
+        )
+
+        return BatchValidateSHACLResponse(
+            results=results,
+            total_count=len(results),
+            conforming_count=conforming_count,
+        )
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.error(f"Batch SHACL validation failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error in batch SHACL validation: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
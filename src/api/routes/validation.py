@@ -273,6 +273,13 @@ async def normalize_context(
             request.context
         )
 
+        # Group features before type triples are added to the graph.
+        features_dict = {}
+        for (artifact, prop), value in features.items():
+            if artifact not in features_dict:
+                features_dict[artifact] = {}
+            features_dict[artifact][prop] = value
+
         if request.artifact_types:
             context_graph = context_builder.add_type_information(
                 context_graph, request.artifact_types
@@ -280,12 +287,6 @@ async def normalize_context(
 
         rdf_turtle = context_graph.serialize(format="turtle")
 
-        features_dict = {}
-        for (artifact, prop), value in features.items():
-            if artifact not in features_dict:
-                features_dict[artifact] = {}
-            features_dict[artifact][prop] = value
-
         logger.info(
             f"Normalized context: {len(features)} features, "
             f"{len(context_graph)} triples"
@@ -3,16 +3,27 @@
 This module defines global configuration for the RD4 signifier system.
 """
 
+import json
 import logging
+import os
+from dataclasses import dataclass, field, fields
 from functools import lru_cache
-from typing import List
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union, get_args, get_origin
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+# Boolean strings accepted by pydantic, matched case-insensitively.
+_TRUE_VALUES = {"1", "t", "true", "y", "yes", "on"}
+_FALSE_VALUES = {"0", "f", "false", "n", "no", "off"}
+_NONE_VALUES = {"", "none", "null"}
 
 
-class Settings(BaseSettings):
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application settings.
 
+    Values are read once from the environment (and an optional ``.env``
+    file) by :meth:`from_env`; the resulting instance is immutable.
+
     Args:
         app_name: Application name
         version: API version
@@ -20,6 +31,8 @@ class Settings(BaseSettings):
         rdf_format: Default RDF serialization format
         enable_authoring_validation: Enable SHACL validation at ingest
         log_level: Logging level
+        embedding_warmup: Load embedding models at startup
+        embedding_num_threads: Torch thread count (None keeps torch default)
         enabled_modules: List of enabled module versions
         latency_budgets_ms: Latency budgets per module
     """
@@ -34,21 +47,123 @@ class Settings(BaseSettings):
 
     log_level: str = "INFO"
 
-    enabled_modules: List[str] = ["sr:v1", "ms:v1", "rs:v1"]
+    embedding_warmup: bool = True
+    embedding_num_threads: Optional[int] = None
 
-    latency_budgets_ms: dict = {
-        "total": 150,
-        "im": 30,
-        "sse": 20,
-        "sv": 80,
-        "rp": 10,
-    }
+    enabled_modules: List[str] = field(
+        default_factory=lambda: ["sr:v1", "ms:v1", "rs:v1"]
+    )
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
+    latency_budgets_ms: Dict[str, int] = field(
+        default_factory=lambda: {
+            "total": 150,
+            "im": 30,
+            "sse": 20,
+            "sv": 80,
+            "rp": 10,
+        }
     )
 
+    @classmethod
+    def from_env(cls, env_file: Optional[str] = ".env") -> "Settings":
+        """Build settings from environment variables.
+
+        Variable names match field names case-insensitively. Process
+        environment variables take precedence over the ``.env`` file.
+        Lists and dicts are given as JSON.
+
+        Args:
+            env_file: Path to an optional dotenv file
+
+        Returns:
+            Application settings
+
+        Raises:
+            ValueError: If a variable cannot be converted to its field type
+        """
+        environ = _read_env_file(env_file) if env_file else {}
+        environ.update({key.lower(): value for key, value in os.environ.items()})
+
+        values: Dict[str, Any] = {}
+        for settings_field in fields(cls):
+            raw = environ.get(settings_field.name)
+            if raw is None:
+                continue
+            try:
+                values[settings_field.name] = _coerce(raw, settings_field.type)
+            except (TypeError, ValueError) as e:
+                raise ValueError(
+                    f"Invalid value for setting {settings_field.name}: {e}"
+                )
+
+        return cls(**values)
+
+
+def _read_env_file(env_file: str) -> Dict[str, str]:
+    """Read KEY=VALUE pairs from a dotenv file.
+
+    Args:
+        env_file: Path to the dotenv file
+
+    Returns:
+        Mapping of lower-cased keys to raw values (empty if file is missing)
+    """
+    path = Path(env_file)
+    if not path.is_file():
+        return {}
+
+    values = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        key = key.strip()
+        if key.startswith("export "):
+            key = key[len("export "):].strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        values[key.lower()] = value
+    return values
+
+
+def _coerce(raw: str, annotation: Any) -> Any:
+    """Convert a raw environment string to the annotated field type.
+
+    Args:
+        raw: Raw string value
+        annotation: Field type annotation
+
+    Returns:
+        Converted value
+
+    Raises:
+        ValueError: If the value cannot be converted
+    """
+    origin = get_origin(annotation)
+
+    if origin is Union:
+        if raw.strip().lower() in _NONE_VALUES:
+            return None
+        inner = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _coerce(raw, inner[0])
+
+    if annotation is bool:
+        value = raw.strip().lower()
+        if value in _TRUE_VALUES:
+            return True
+        if value in _FALSE_VALUES:
+            return False
+        raise ValueError(f"{raw!r} is not a valid boolean")
+    if annotation is int:
+        return int(raw)
+    if annotation is float:
+        return float(raw)
+    if origin in (list, dict) or annotation in (list, dict):
+        return json.loads(raw)
+    return raw
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -57,7 +172,7 @@ def get_settings() -> Settings:
     Returns:
         Application settings
     """
-    return Settings()
+    return Settings.from_env()
 
 
 def setup_logging(settings: Settings) -> None:
@@ -6,7 +6,10 @@ with version management.
 
 from src.matching.base import IntentMatcher, MatchResult
 from src.matching.registry import IntentMatcherRegistry
-from src.matching.string_matcher import StringContainsMatcher
+from src.matching.string_matcher import (
+    IndexedStringContainsMatcher,
+    StringContainsMatcher,
+)
 from src.matching.embedding_matcher import EmbeddingMatcher
 
 __all__ = [
@@ -14,5 +17,6 @@ __all__ = [
     "MatchResult",
     "IntentMatcherRegistry",
     "StringContainsMatcher",
+    "IndexedStringContainsMatcher",
     "EmbeddingMatcher",
 ]
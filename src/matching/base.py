@@ -7,12 +7,65 @@ versions must implement.
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Union
+
+from src.models.signifier import Signifier
 
 logger = logging.getLogger(__name__)
 
+SignifierLike = Union[Signifier, Dict[str, Any]]
+
+
+class SignifierView(NamedTuple):
+    """The signifier fields intent matchers read.
+
+    Args:
+        signifier_id: Signifier identifier
+        nl_text: Natural language intent text
+        structured: Structured intent description (empty if absent)
+        match_text: Text precomputed at ingestion, if any
+    """
+
+    signifier_id: str
+    nl_text: str
+    structured: Dict[str, Any]
+    match_text: Optional[str]
+
 
-@dataclass
+def signifier_view(signifier: Union[SignifierLike, SignifierView]) -> SignifierView:
+    """Project a signifier onto the fields used for matching.
+
+    Signifier models are read attribute-wise, so callers can pass them
+    directly instead of dumping them to dictionaries first.
+
+    Args:
+        signifier: Signifier model, signifier dictionary or existing view
+
+    Returns:
+        Signifier view
+    """
+    if isinstance(signifier, SignifierView):
+        return signifier
+
+    if isinstance(signifier, Signifier):
+        intent = signifier.intent
+        return SignifierView(
+            signifier_id=signifier.signifier_id,
+            nl_text=intent.nl_text,
+            structured=intent.structured or {},
+            match_text=signifier.indexes.get("match_text"),
+        )
+
+    intent = signifier.get("intent") or {}
+    return SignifierView(
+        signifier_id=signifier.get("signifier_id", "unknown"),
+        nl_text=intent.get("nl_text", ""),
+        structured=intent.get("structured") or {},
+        match_text=(signifier.get("indexes") or {}).get("match_text"),
+    )
+
+
+@dataclass(slots=True)
 class MatchResult:
     """Result of intent matching for a single signifier.
 
@@ -61,7 +114,7 @@ class IntentMatcher(ABC):
     def match(
         self,
         intent_query: str,
-        signifiers: List[Dict[str, Any]],
+        signifiers: Sequence[SignifierLike],
         k: int = 10,
         **kwargs,
     ) -> List[MatchResult]:
@@ -69,7 +122,7 @@ class IntentMatcher(ABC):
 
         Args:
             intent_query: Natural language intent query
-            signifiers: List of signifier dictionaries
+            signifiers: Signifier models or signifier dictionaries
             k: Number of top results to return
             **kwargs: Additional algorithm-specific parameters
 
@@ -97,3 +150,14 @@ class IntentMatcher(ABC):
             Version string
         """
         return self.version
+
+    def warm_up(self, **kwargs) -> None:
+        """Load any expensive resources ahead of the first match.
+
+        The default implementation does nothing; matchers backed by
+        models override it so startup absorbs the loading cost.
+
+        Args:
+            **kwargs: Matcher-specific warm-up options
+        """
+        return None
@@ -7,18 +7,34 @@ using sentence transformers for semantic similarity.
 import hashlib
 import logging
 import numpy as np
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Sequence, Union
 
-from src.matching.base import IntentMatcher, MatchResult
+from src.matching.base import (
+    IntentMatcher,
+    MatchResult,
+    SignifierLike,
+    SignifierView,
+    signifier_view,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class _EmbeddingIndex(NamedTuple):
+    """Stacked signifier embeddings for one signifier list."""
+
+    key: Hashable
+    signifier_ids: List[str]
+    matrix: np.ndarray
+
+
 class EmbeddingMatcher(IntentMatcher):
     """Intent Matcher v1 - Embedding Similarity.
 
     Uses sentence embeddings to compute semantic similarity between
-    intent queries and signifiers.
+    intent queries and signifiers. The stacked embedding matrix is
+    reused while the ``corpus_version`` passed to :meth:`match` stays
+    the same.
     """
 
     def __init__(self, model_name: str = "all-MiniLM-L6-v2", cache_embeddings: bool = True):
@@ -33,6 +49,7 @@ class EmbeddingMatcher(IntentMatcher):
         self.cache_embeddings = cache_embeddings
         self._embedding_cache: Dict[str, np.ndarray] = {}
         self._model: Optional[Any] = None
+        self._index: Optional[_EmbeddingIndex] = None
 
     def _get_model(self):
         """Lazy load the sentence transformer model.
@@ -57,21 +74,47 @@ class EmbeddingMatcher(IntentMatcher):
                 )
         return self._model
 
+    def warm_up(self, num_threads: Optional[int] = None, **kwargs) -> None:
+        """Load the model and run one encode so the first request is fast.
+
+        Args:
+            num_threads: Optional torch intra-op thread count
+            **kwargs: Additional parameters (ignored)
+
+        Raises:
+            ImportError: If sentence-transformers is not installed
+        """
+        model = self._get_model()
+
+        if num_threads:
+            import torch
+
+            torch.set_num_threads(num_threads)
+            logger.info(f"Set torch intra-op threads to {num_threads}")
+
+        model.eval()
+        model.encode("warm up", convert_to_numpy=True, normalize_embeddings=True)
+        logger.info(f"Embedding model {self.model_name} warmed up")
+
     def match(
         self,
         intent_query: str,
-        signifiers: List[Dict[str, Any]],
+        signifiers: Sequence[SignifierLike],
         k: int = 10,
         min_similarity: float = 0.0,
+        corpus_version: Optional[Hashable] = None,
         **kwargs,
     ) -> List[MatchResult]:
         """Match intent query using embedding similarity.
 
         Args:
             intent_query: Natural language intent query
-            signifiers: List of signifier dictionaries
+            signifiers: Signifier models or signifier dictionaries
             k: Number of top results to return
             min_similarity: Minimum similarity threshold (0.0 to 1.0)
+            corpus_version: Identifier of the signifier list (e.g. the
+                storage epoch); the embedding matrix is rebuilt when it
+                changes or is None
             **kwargs: Additional parameters (ignored)
 
         Returns:
@@ -89,87 +132,176 @@ class EmbeddingMatcher(IntentMatcher):
 
         model = self._get_model()
 
-        query_embedding = model.encode(intent_query, convert_to_numpy=True)
+        query_embedding = model.encode(
+            intent_query, convert_to_numpy=True, normalize_embeddings=True
+        )
 
-        results = []
-        for signifier in signifiers:
-            signifier_id = signifier.get("signifier_id", "unknown")
+        index = self._index
+        if (
+            index is None
+            or corpus_version is None
+            or index.key != corpus_version
+            or len(index.signifier_ids) != len(signifiers)
+        ):
+            index = self._build_index(signifiers, model, corpus_version)
+
+        similarities = np.clip(
+            (index.matrix @ query_embedding + 1.0) * 0.5,
+            0.0,
+            1.0,
+        )
 
-            signifier_embedding = self._get_signifier_embedding(
-                signifier, model
+        scored = [
+            (signifier_id, float(similarity))
+            for signifier_id, similarity in zip(index.signifier_ids, similarities)
+            if similarity >= min_similarity
+        ]
+
+        scored.sort(key=lambda x: x[1], reverse=True)
+
+        embedding_dim = len(query_embedding)
+        results = [
+            MatchResult(
+                signifier_id=signifier_id,
+                similarity=similarity,
+                metadata={
+                    "matcher_version": self.version,
+                    "model_name": self.model_name,
+                    "embedding_dim": embedding_dim,
+                },
             )
+            for signifier_id, similarity in scored[:k]
+        ]
 
-            similarity = self._cosine_similarity(
-                query_embedding, signifier_embedding
-            )
+        logger.info(
+            f"Embedding matching found {len(scored)} matches "
+            f"(min_similarity={min_similarity}), returning top {k}"
+        )
+        return results
 
-            if similarity >= min_similarity:
-                results.append(
-                    MatchResult(
-                        signifier_id=signifier_id,
-                        similarity=float(similarity),
-                        metadata={
-                            "matcher_version": self.version,
-                            "model_name": self.model_name,
-                            "embedding_dim": len(query_embedding),
-                        },
-                    )
-                )
+    def _build_index(
+        self,
+        signifiers: Sequence[SignifierLike],
+        model: Any,
+        corpus_version: Optional[Hashable],
+    ) -> _EmbeddingIndex:
+        """Stack the embeddings of a signifier list into one matrix.
 
-        results.sort(key=lambda x: x.similarity, reverse=True)
+        Args:
+            signifiers: Signifier models or signifier dictionaries
+            model: Sentence transformer model
+            corpus_version: Identifier of this signifier list; None
+                disables reuse, as does disabling embedding caching
 
-        logger.info(
-            f"Embedding matching found {len(results)} matches "
-            f"(min_similarity={min_similarity}), returning top {k}"
+        Returns:
+            Embedding index for the signifier list
+        """
+        views = [signifier_view(signifier) for signifier in signifiers]
+        index = _EmbeddingIndex(
+            key=corpus_version,
+            signifier_ids=[view.signifier_id for view in views],
+            matrix=np.stack(self._get_signifier_embeddings(views, model)),
         )
-        return results[:k]
+        if corpus_version is not None and self.cache_embeddings:
+            self._index = index
+        return index
+
+    def _get_signifier_embeddings(
+        self,
+        signifiers: Sequence[Union[SignifierLike, SignifierView]],
+        model: Any,
+    ) -> List[np.ndarray]:
+        """Get or compute embeddings for a list of signifiers.
+
+        Cached embeddings are reused; all cache misses are encoded in a
+        single batched model call. Embeddings are unit-normalized so
+        cosine similarity reduces to a dot product.
+
+        Args:
+            signifiers: Signifier models, dictionaries or views
+            model: Sentence transformer model
+
+        Returns:
+            Embedding vectors aligned with the input signifiers
+        """
+        embeddings: List[Optional[np.ndarray]] = []
+        miss_positions: List[int] = []
+        miss_texts: List[str] = []
+        miss_keys: List[Optional[str]] = []
+
+        for position, signifier in enumerate(signifiers):
+            view = signifier_view(signifier)
+            cache_key = None
+            if self.cache_embeddings:
+                cache_key = self._compute_cache_key(view.signifier_id, view.nl_text)
+
+                cached = self._embedding_cache.get(cache_key)
+                if cached is not None:
+                    embeddings.append(cached)
+                    continue
+
+            embeddings.append(None)
+            miss_positions.append(position)
+            miss_texts.append(self._get_match_text(view))
+            miss_keys.append(cache_key)
+
+        if miss_texts:
+            logger.debug(f"Encoding {len(miss_texts)} uncached signifier texts")
+            encoded = model.encode(
+                miss_texts, convert_to_numpy=True, normalize_embeddings=True
+            )
+
+            for position, cache_key, embedding in zip(
+                miss_positions, miss_keys, encoded
+            ):
+                embeddings[position] = embedding
+                if cache_key is not None:
+                    self._embedding_cache[cache_key] = embedding
+
+        return embeddings
 
     def _get_signifier_embedding(
-        self, signifier: Dict[str, Any], model: Any
+        self, signifier: Union[SignifierLike, SignifierView], model: Any
     ) -> np.ndarray:
         """Get or compute embedding for a signifier.
 
         Args:
-            signifier: Signifier dictionary
+            signifier: Signifier model, dictionary or view
             model: Sentence transformer model
 
         Returns:
             Embedding vector as numpy array
         """
-        signifier_id = signifier.get("signifier_id", "unknown")
-
-        if self.cache_embeddings:
-            intent = signifier.get("intent", {})
-            nl_text = intent.get("nl_text", "")
-
-            cache_key = self._compute_cache_key(signifier_id, nl_text)
-
-            if cache_key in self._embedding_cache:
-                logger.debug(f"Using cached embedding for {signifier_id}")
-                return self._embedding_cache[cache_key]
+        return self._get_signifier_embeddings([signifier], model)[0]
 
-        text_to_encode = self._extract_signifier_text(signifier)
+    def _get_match_text(self, signifier: Union[SignifierLike, SignifierView]) -> str:
+        """Get the text to embed for a signifier.
 
-        embedding = model.encode(text_to_encode, convert_to_numpy=True)
+        Uses the text precomputed at ingestion when available.
 
-        if self.cache_embeddings:
-            self._embedding_cache[cache_key] = embedding
-            logger.debug(f"Cached embedding for {signifier_id}")
+        Args:
+            signifier: Signifier model, dictionary or view
 
-        return embedding
+        Returns:
+            Text for embedding
+        """
+        view = signifier_view(signifier)
+        return view.match_text or self._extract_signifier_text(view)
 
-    def _extract_signifier_text(self, signifier: Dict[str, Any]) -> str:
+    def _extract_signifier_text(
+        self, signifier: Union[SignifierLike, SignifierView]
+    ) -> str:
         """Extract text from signifier for embedding.
 
         Args:
-            signifier: Signifier dictionary
+            signifier: Signifier model, dictionary or view
 
         Returns:
             Combined text for embedding
         """
-        intent = signifier.get("intent", {})
-        nl_text = intent.get("nl_text", "")
-        structured = intent.get("structured", {})
+        view = signifier_view(signifier)
+        nl_text = view.nl_text
+        structured = view.structured
 
         text_parts = [nl_text]
 
@@ -185,25 +317,16 @@ class EmbeddingMatcher(IntentMatcher):
     def _cosine_similarity(
         self, vec1: np.ndarray, vec2: np.ndarray
     ) -> float:
-        """Compute cosine similarity between two vectors.
+        """Compute cosine similarity between two unit-normalized vectors.
 
         Args:
-            vec1: First vector
-            vec2: Second vector
+            vec1: First vector (unit length)
+            vec2: Second vector (unit length)
 
         Returns:
             Cosine similarity (-1 to 1, normalized to 0 to 1)
         """
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        cosine_sim = dot_product / (norm1 * norm2)
-
-        normalized_sim = (cosine_sim + 1) / 2
+        normalized_sim = (np.dot(vec1, vec2) + 1.0) * 0.5
 
         return float(np.clip(normalized_sim, 0.0, 1.0))
 
@@ -223,6 +346,7 @@ class EmbeddingMatcher(IntentMatcher):
     def clear_cache(self) -> None:
         """Clear the embedding cache."""
         self._embedding_cache.clear()
+        self._index = None
         logger.info("Embedding cache cleared")
 
     def get_cache_stats(self) -> Dict[str, Any]:
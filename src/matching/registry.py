@@ -5,11 +5,14 @@ versions and selecting them at runtime.
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence
 
-from src.matching.base import IntentMatcher, MatchResult
+from src.matching.base import IntentMatcher, MatchResult, SignifierLike
 from src.matching.embedding_matcher import EmbeddingMatcher
-from src.matching.string_matcher import StringContainsMatcher
+from src.matching.string_matcher import (
+    IndexedStringContainsMatcher,
+    StringContainsMatcher,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +32,8 @@ class IntentMatcherRegistry:
         """
         self.default_version = default_version
         self._matchers: Dict[str, IntentMatcher] = {}
+        self._default_matcher: Optional[IntentMatcher] = None
+        self._default_match: Optional[Callable[..., List[MatchResult]]] = None
         self._initialize_default_matchers()
         logger.info(
             f"Initialized Intent Matcher Registry "
@@ -38,6 +43,7 @@ class IntentMatcherRegistry:
     def _initialize_default_matchers(self) -> None:
         """Initialize and register default matchers."""
         self.register(StringContainsMatcher())
+        self.register(IndexedStringContainsMatcher())
 
         try:
             self.register(EmbeddingMatcher())
@@ -63,10 +69,33 @@ class IntentMatcherRegistry:
             logger.warning(f"Overwriting existing matcher version: {version}")
 
         self._matchers[version] = matcher
+        if version == self.default_version:
+            self._bind_default_matcher()
         logger.info(
             f"Registered matcher {matcher.__class__.__name__} as {version}"
         )
 
+    def _bind_default_matcher(self) -> None:
+        """Bind the default matcher and its match method for fast dispatch."""
+        matcher = self._matchers.get(self.default_version)
+        self._default_matcher = matcher
+        self._default_match = matcher.match if matcher is not None else None
+
+    def warm_up(self, **kwargs) -> None:
+        """Warm up all registered matchers.
+
+        Failures are logged rather than raised so a missing optional
+        dependency does not prevent startup.
+
+        Args:
+            **kwargs: Options forwarded to each matcher's warm_up
+        """
+        for version, matcher in self._matchers.items():
+            try:
+                matcher.warm_up(**kwargs)
+            except Exception as e:
+                logger.warning(f"Warm-up failed for matcher {version}: {e}")
+
     def get_matcher(self, version: Optional[str] = None) -> IntentMatcher:
         """Get a matcher by version.
 
@@ -112,7 +141,7 @@ class IntentMatcherRegistry:
     def match(
         self,
         intent_query: str,
-        signifiers: List[Dict],
+        signifiers: Sequence[SignifierLike],
         k: int = 10,
         version: Optional[str] = None,
         **kwargs,
@@ -121,7 +150,7 @@ class IntentMatcherRegistry:
 
         Args:
             intent_query: Natural language intent query
-            signifiers: List of signifier dictionaries
+            signifiers: Signifier models or signifier dictionaries
             k: Number of top results to return
             version: Matcher version to use (optional)
             **kwargs: Additional matcher-specific parameters
@@ -132,13 +161,20 @@ class IntentMatcherRegistry:
         Raises:
             ValueError: If version is invalid or matching fails
         """
-        matcher = self.get_matcher(version)
+        if self._default_match is not None and (
+            version is None or version == self.default_version
+        ):
+            matcher = self._default_matcher
+            match_fn = self._default_match
+        else:
+            matcher = self.get_matcher(version)
+            match_fn = matcher.match
 
         logger.info(
             f"Matching with {matcher.__class__.__name__} ({matcher.version})"
         )
 
-        results = matcher.match(intent_query, signifiers, k=k, **kwargs)
+        results = match_fn(intent_query, signifiers, k=k, **kwargs)
 
         logger.info(
             f"Matched {len(results)} signifiers using {matcher.version}"
@@ -163,6 +199,7 @@ class IntentMatcherRegistry:
             )
 
         self.default_version = version
+        self._bind_default_matcher()
         logger.info(f"Set default matcher version to: {version}")
 
     def get_default_version(self) -> str:
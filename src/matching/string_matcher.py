@@ -4,14 +4,112 @@ This module implements a simple string-based intent matching algorithm
 using token containment.
 """
 
+import heapq
 import logging
 import re
-from typing import Any, Dict, List
-
-from src.matching.base import IntentMatcher, MatchResult
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from src.matching.base import (
+    IntentMatcher,
+    MatchResult,
+    SignifierLike,
+    SignifierView,
+    signifier_view,
+)
 
 logger = logging.getLogger(__name__)
 
+# Whole words of at least three characters; shorter words are never tokens.
+_TOKEN_RE = re.compile(r"\b\w{3,}\b")
+_MAX_TRIE_TOKEN_LENGTH = 200
+
+
+def _flatten_strings(obj: Any) -> Iterator[str]:
+    """Yield the scalar leaf values of a structured description as strings.
+
+    Dict keys are skipped so field names do not leak into the token set.
+
+    Args:
+        obj: Structured value (dict, list, or scalar)
+
+    Yields:
+        String form of each str, int, or float leaf
+    """
+    if isinstance(obj, dict):
+        for value in obj.values():
+            yield from _flatten_strings(value)
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            yield from _flatten_strings(item)
+    elif isinstance(obj, (str, int, float)):
+        yield str(obj)
+
+
+def _trie_pattern(node: Dict[str, Dict]) -> str:
+    """Render a character trie as a prefix-factored regex fragment.
+
+    Args:
+        node: Trie node mapping characters to child nodes; the empty key
+            marks the end of a token
+
+    Returns:
+        Regex fragment matching exactly the tokens below this node
+    """
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+
+    pattern = "(?:" + "|".join(branches) + ")"
+    return pattern + "?" if "" in node else pattern
+
+
+def _compile_token_matcher(tokens: Set[str]) -> "re.Pattern[str]":
+    """Compile a whole-word regex matching any of the given tokens.
+
+    Tokens are inserted into a character trie that is rendered as one
+    prefix-factored alternation, so each position of the scanned text is
+    tested against all tokens in a single descent.
+
+    Args:
+        tokens: Tokens to match
+
+    Returns:
+        Compiled pattern whose matches are exactly the given tokens
+    """
+    if max(len(token) for token in tokens) > _MAX_TRIE_TOKEN_LENGTH:
+        body = "|".join(re.escape(token) for token in sorted(tokens))
+        return re.compile(r"\b(?:" + body + r")\b")
+
+    trie: Dict[str, Dict] = {}
+    for token in tokens:
+        node = trie
+        for char in token:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    return re.compile(r"\b(?:" + _trie_pattern(trie) + r")\b")
+
 
 class StringContainsMatcher(IntentMatcher):
     """Intent Matcher v0 - String Contains.
@@ -20,14 +118,18 @@ class StringContainsMatcher(IntentMatcher):
     in the intent natural language text and structured JSON.
     """
 
-    def __init__(self):
-        """Initialize the String Contains Matcher."""
-        super().__init__(version="v0")
+    def __init__(self, version: str = "v0"):
+        """Initialize the String Contains Matcher.
+
+        Args:
+            version: Version identifier
+        """
+        super().__init__(version=version)
 
     def match(
         self,
         intent_query: str,
-        signifiers: List[Dict[str, Any]],
+        signifiers: Sequence[SignifierLike],
         k: int = 10,
         case_sensitive: bool = False,
         **kwargs,
@@ -36,7 +138,7 @@ class StringContainsMatcher(IntentMatcher):
 
         Args:
             intent_query: Natural language intent query
-            signifiers: List of signifier dictionaries
+            signifiers: Signifier models or signifier dictionaries
             k: Number of top results to return
             case_sensitive: Whether matching should be case-sensitive
             **kwargs: Additional parameters (ignored)
@@ -56,32 +158,35 @@ class StringContainsMatcher(IntentMatcher):
 
         query_tokens = self._tokenize(intent_query, case_sensitive)
 
-        results = []
-        for signifier in signifiers:
-            similarity = self._compute_similarity(
-                query_tokens, signifier, case_sensitive
+        scored = []
+        if query_tokens:
+            query_matcher = _compile_token_matcher(set(query_tokens))
+
+            for position, signifier in enumerate(signifiers):
+                view = signifier_view(signifier)
+                found = self._find_query_tokens(view, query_matcher, case_sensitive)
+                if found:
+                    matched = [t for t in query_tokens if t in found]
+                    scored.append((len(matched), -position, view, matched))
+
+        top = heapq.nlargest(k, scored, key=lambda item: item[:2])
+
+        results = [
+            MatchResult(
+                signifier_id=view.signifier_id,
+                similarity=match_count / len(query_tokens),
+                metadata={
+                    "matcher_version": self.version,
+                    "matched_tokens": matched,
+                },
             )
-
-            if similarity > 0:
-                results.append(
-                    MatchResult(
-                        signifier_id=signifier.get("signifier_id", "unknown"),
-                        similarity=similarity,
-                        metadata={
-                            "matcher_version": self.version,
-                            "matched_tokens": self._get_matched_tokens(
-                                query_tokens, signifier, case_sensitive
-                            ),
-                        },
-                    )
-                )
-
-        results.sort(key=lambda x: x.similarity, reverse=True)
+            for match_count, _, view, matched in top
+        ]
 
         logger.info(
-            f"String matching found {len(results)} matches, returning top {k}"
+            f"String matching found {len(scored)} matches, returning top {k}"
         )
-        return results[:k]
+        return results
 
     def _tokenize(self, text: str, case_sensitive: bool) -> List[str]:
         """Tokenize text into words.
@@ -93,75 +198,59 @@ class StringContainsMatcher(IntentMatcher):
         Returns:
             List of tokens
         """
-        text = text if case_sensitive else text.lower()
-        tokens = re.findall(r'\b\w+\b', text)
-        return [t for t in tokens if len(t) > 2]
+        if not case_sensitive:
+            text = text.lower()
+        return _TOKEN_RE.findall(text)
 
-    def _compute_similarity(
+    def _find_query_tokens(
         self,
-        query_tokens: List[str],
-        signifier: Dict[str, Any],
+        signifier: Union[SignifierLike, SignifierView],
+        query_matcher: "re.Pattern[str]",
         case_sensitive: bool,
-    ) -> float:
-        """Compute similarity score for a signifier.
+    ) -> Set[str]:
+        """Find which query tokens occur as whole words in a signifier.
+
+        Only occurrences of query tokens are collected, so no per-signifier
+        token list or set of all words is built.
 
         Args:
-            query_tokens: Tokenized query
-            signifier: Signifier dictionary
+            signifier: Signifier model, dictionary or view
+            query_matcher: Pattern from _compile_token_matcher
             case_sensitive: Whether matching is case-sensitive
 
         Returns:
-            Similarity score between 0 and 1
+            Set of query tokens present in the signifier
         """
-        intent = signifier.get("intent", {})
-        nl_text = intent.get("nl_text", "")
-        structured = intent.get("structured", {})
-
-        nl_tokens = self._tokenize(nl_text, case_sensitive)
-
-        structured_text = str(structured) if structured else ""
-        structured_tokens = self._tokenize(structured_text, case_sensitive)
-
-        all_signifier_tokens = set(nl_tokens + structured_tokens)
+        view = signifier_view(signifier)
+        text = view.nl_text
+        if view.structured:
+            text = f"{text} {' '.join(_flatten_strings(view.structured))}"
 
-        if not all_signifier_tokens:
-            return 0.0
+        if not case_sensitive:
+            text = text.lower()
 
-        matches = sum(1 for token in query_tokens if token in all_signifier_tokens)
+        return set(query_matcher.findall(text))
 
-        similarity = matches / len(query_tokens) if query_tokens else 0.0
-
-        return similarity
-
-    def _get_matched_tokens(
-        self,
-        query_tokens: List[str],
-        signifier: Dict[str, Any],
-        case_sensitive: bool,
-    ) -> List[str]:
-        """Get list of matched tokens.
+    def _signifier_tokens(
+        self, signifier: Union[SignifierLike, SignifierView], case_sensitive: bool
+    ) -> Set[str]:
+        """Tokenize a signifier's intent text and structured description once.
 
         Args:
-            query_tokens: Tokenized query
-            signifier: Signifier dictionary
+            signifier: Signifier model, dictionary or view
             case_sensitive: Whether matching is case-sensitive
 
         Returns:
-            List of tokens that matched
+            Set of signifier tokens
         """
-        intent = signifier.get("intent", {})
-        nl_text = intent.get("nl_text", "")
-        structured = intent.get("structured", {})
+        view = signifier_view(signifier)
+        tokens = set(self._tokenize(view.nl_text, case_sensitive))
 
-        nl_tokens = self._tokenize(nl_text, case_sensitive)
-        structured_text = str(structured) if structured else ""
-        structured_tokens = self._tokenize(structured_text, case_sensitive)
+        if view.structured:
+            structured_text = " ".join(_flatten_strings(view.structured))
+            tokens.update(self._tokenize(structured_text, case_sensitive))
 
-        all_signifier_tokens = set(nl_tokens + structured_tokens)
-
-        matched = [token for token in query_tokens if token in all_signifier_tokens]
-
-        return matched
+        return tokens
 
     def get_info(self) -> Dict[str, Any]:
         """Get information about this matcher.
@@ -182,3 +271,182 @@ class StringContainsMatcher(IntentMatcher):
             },
             "latency_budget_ms": 30,
         }
+
+
+class _TokenIndex(NamedTuple):
+    """CSR layout of signifier token IDs.
+
+    Tokens of signifier ``i`` are ``sig_tokens[sig_ptr[i]:sig_ptr[i + 1]]``.
+    """
+
+    key: Optional[Tuple[Hashable, bool]]
+    signifier_ids: List[str]
+    token_to_id: Dict[str, int]
+    sig_ptr: np.ndarray
+    sig_tokens: np.ndarray
+
+
+class IndexedStringContainsMatcher(StringContainsMatcher):
+    """Intent Matcher v2 - Indexed String Contains.
+
+    Scores exactly like v0, but keeps every signifier's token set as
+    integer IDs in one contiguous CSR array and computes all containment
+    counts for a query with vectorized numpy operations instead of a
+    Python loop over signifiers. The index is reused while the
+    ``corpus_version`` passed to :meth:`match` stays the same.
+    """
+
+    def __init__(self):
+        """Initialize the Indexed String Contains Matcher."""
+        super().__init__(version="v2")
+        self._index: Optional[_TokenIndex] = None
+
+    def build_index(
+        self,
+        signifiers: Sequence[SignifierLike],
+        case_sensitive: bool = False,
+        corpus_version: Optional[Hashable] = None,
+    ) -> None:
+        """Build the token index for a list of signifiers.
+
+        Args:
+            signifiers: Signifier models or signifier dictionaries
+            case_sensitive: Whether tokens keep their case
+            corpus_version: Identifier of this signifier list (e.g. the
+                storage epoch); None disables reuse
+        """
+        signifier_ids = []
+        token_to_id: Dict[str, int] = {}
+        sig_ptr = [0]
+        sig_tokens: List[int] = []
+
+        for signifier in signifiers:
+            view = signifier_view(signifier)
+            signifier_ids.append(view.signifier_id)
+            for token in self._signifier_tokens(view, case_sensitive):
+                sig_tokens.append(token_to_id.setdefault(token, len(token_to_id)))
+            sig_ptr.append(len(sig_tokens))
+
+        index_key = None
+        if corpus_version is not None:
+            index_key = (corpus_version, case_sensitive)
+
+        self._index = _TokenIndex(
+            key=index_key,
+            signifier_ids=signifier_ids,
+            token_to_id=token_to_id,
+            sig_ptr=np.asarray(sig_ptr, dtype=np.int64),
+            sig_tokens=np.asarray(sig_tokens, dtype=np.int32),
+        )
+
+        logger.debug(
+            f"Built string index: {len(signifier_ids)} signifiers, "
+            f"{len(token_to_id)} distinct tokens"
+        )
+
+    def match(
+        self,
+        intent_query: str,
+        signifiers: Sequence[SignifierLike],
+        k: int = 10,
+        case_sensitive: bool = False,
+        corpus_version: Optional[Hashable] = None,
+        **kwargs,
+    ) -> List[MatchResult]:
+        """Match intent query using the vectorized token index.
+
+        Args:
+            intent_query: Natural language intent query
+            signifiers: Signifier models or signifier dictionaries
+            k: Number of top results to return
+            case_sensitive: Whether matching should be case-sensitive
+            corpus_version: Identifier of the signifier list; the index is
+                rebuilt when it changes or is None
+            **kwargs: Additional parameters (ignored)
+
+        Returns:
+            List of MatchResult objects sorted by similarity
+
+        Raises:
+            ValueError: If inputs are invalid
+        """
+        if not intent_query:
+            raise ValueError("intent_query cannot be empty")
+
+        if not signifiers:
+            logger.warning("No signifiers provided for matching")
+            return []
+
+        index = self._index
+        if (
+            index is None
+            or corpus_version is None
+            or index.key != (corpus_version, case_sensitive)
+            or len(index.signifier_ids) != len(signifiers)
+        ):
+            self.build_index(signifiers, case_sensitive, corpus_version)
+            index = self._index
+
+        query_tokens = self._tokenize(intent_query, case_sensitive)
+        query_ids = [index.token_to_id.get(token) for token in query_tokens]
+
+        present = np.zeros(len(index.token_to_id) + 1, dtype=np.int32)
+        for token_id in query_ids:
+            if token_id is not None:
+                present[token_id] += 1
+
+        running = np.concatenate(([0], np.cumsum(present[index.sig_tokens])))
+        counts = running[index.sig_ptr[1:]] - running[index.sig_ptr[:-1]]
+
+        positions = np.flatnonzero(counts)
+        order = np.lexsort((positions, -counts[positions]))
+        top = positions[order[:k]] if k > 0 else positions[:0]
+
+        results = []
+        for position in top.tolist():
+            start, end = index.sig_ptr[position], index.sig_ptr[position + 1]
+            signifier_token_ids = set(index.sig_tokens[start:end].tolist())
+            matched = [
+                token
+                for token, token_id in zip(query_tokens, query_ids)
+                if token_id in signifier_token_ids
+            ]
+            results.append(
+                MatchResult(
+                    signifier_id=index.signifier_ids[position],
+                    similarity=len(matched) / len(query_tokens),
+                    metadata={
+                        "matcher_version": self.version,
+                        "matched_tokens": matched,
+                    },
+                )
+            )
+
+        logger.info(
+            f"Indexed string matching found {len(positions)} matches, "
+            f"returning top {k}"
+        )
+        return results
+
+    def get_info(self) -> Dict[str, Any]:
+        """Get information about this matcher.
+
+        Returns:
+            Matcher information dictionary
+        """
+        info = super().get_info()
+        info.update(
+            {
+                "version": self.version,
+                "name": "Indexed String Contains Matcher",
+                "description": (
+                    "Token-based string matching backed by an inverted index"
+                ),
+            }
+        )
+        info["parameters"]["corpus_version"] = {
+            "type": "hashable",
+            "default": None,
+            "description": "Identifier of the signifier list for index reuse",
+        }
+        return info
@@ -4,15 +4,48 @@ This module defines the core data structures for storing and managing
 signifiers with dual representation (NL + structured).
 """
 
+import json
 import logging
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+
+try:
+    import orjson
+    from orjson import loads as _json_loads
+except ImportError:
+    orjson = None
+    from json import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
+_SH_PROPERTY_IRI = "<http://www.w3.org/ns/shacl#property>"
+_SH_CLASS_IRI = "<http://www.w3.org/ns/shacl#class>"
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a value as compact JSON text.
+
+    Uses orjson when it is installed, falling back to the standard library
+    for values orjson rejects (e.g. integers wider than 64 bits).
+
+    Args:
+        value: JSON-compatible value
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value)
+
 
 class SignifierStatus(str, Enum):
     """Status of a signifier."""
@@ -21,21 +54,57 @@ class SignifierStatus(str, Enum):
     DEPRECATED = "deprecated"
 
 
-class Provenance(BaseModel):
+_ALLOWED_OPERATORS = frozenset(
+    {
+        "greaterThan",
+        "lessThan",
+        "greaterEqual",
+        "lessEqual",
+        "equals",
+        "notEquals",
+    }
+)
+
+
+def _require_non_empty(name: str, value: str) -> None:
+    """Check that a required string field is not empty.
+
+    Args:
+        name: Field name (for the error message)
+        value: Field value
+
+    Raises:
+        ValueError: If the value is empty
+    """
+    if not value:
+        raise ValueError(f"{name} must be a non-empty string")
+
+
+@dataclass(slots=True)
+class Provenance:
     """Provenance information for a signifier.
 
     Args:
-        created_at: Timestamp when signifier was created
         created_by: Identifier of creator
+        created_at: Timestamp when signifier was created
         source: Source of the signifier (e.g., "manual", "imported")
     """
 
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    created_by: str = Field(..., min_length=1)
-    source: str = Field(default="manual")
+    created_by: str
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    source: str = "manual"
+
+    def __post_init__(self) -> None:
+        """Validate required fields.
+
+        Raises:
+            ValueError: If created_by is empty
+        """
+        _require_non_empty("created_by", self.created_by)
 
 
-class ValueCondition(BaseModel):
+@dataclass(slots=True)
+class ValueCondition:
     """Value condition for structured context.
 
     Args:
@@ -44,40 +113,30 @@ class ValueCondition(BaseModel):
         datatype: Optional XSD datatype (e.g., "xsd:integer")
     """
 
-    operator: str = Field(..., min_length=1)
+    operator: str
     value: Any
     datatype: Optional[str] = None
 
-    @field_validator("operator")
-    @classmethod
-    def validate_operator(cls, v: str) -> str:
-        """Validate operator is one of the allowed types.
-
-        Args:
-            v: The operator value
+    def __post_init__(self) -> None:
+        """Validate operator is one of the allowed types and intern it.
 
-        Returns:
-            The validated operator
+        The datatype is interned too, as it comes from a small vocabulary.
 
         Raises:
             ValueError: If operator is not valid
         """
-        allowed_operators = {
-            "greaterThan",
-            "lessThan",
-            "greaterEqual",
-            "lessEqual",
-            "equals",
-            "notEquals",
-        }
-        if v not in allowed_operators:
+        if self.operator not in _ALLOWED_OPERATORS:
             raise ValueError(
-                f"Operator must be one of {allowed_operators}, got: {v}"
+                f"Operator must be one of {set(_ALLOWED_OPERATORS)}, "
+                f"got: {self.operator}"
             )
-        return v
+        self.operator = sys.intern(self.operator)
+        if type(self.datatype) is str:
+            self.datatype = sys.intern(self.datatype)
 
 
-class StructuredCondition(BaseModel):
+@dataclass(slots=True)
+class StructuredCondition:
     """Structured condition for context matching.
 
     Args:
@@ -86,9 +145,46 @@ class StructuredCondition(BaseModel):
         value_conditions: List of value conditions to check
     """
 
-    artifact: str = Field(..., min_length=1)
-    property_affordance: str = Field(..., min_length=1)
-    value_conditions: List[ValueCondition] = Field(default_factory=list)
+    artifact: str
+    property_affordance: str
+    value_conditions: List[ValueCondition] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        """Validate required fields and intern the URIs.
+
+        Interned URIs hash and compare by identity in context lookups.
+
+        Raises:
+            ValueError: If artifact or property_affordance is empty
+        """
+        _require_non_empty("artifact", self.artifact)
+        _require_non_empty("property_affordance", self.property_affordance)
+        if type(self.artifact) is str:
+            self.artifact = sys.intern(self.artifact)
+        if type(self.property_affordance) is str:
+            self.property_affordance = sys.intern(self.property_affordance)
+
+
+class _CachingModel(BaseModel):
+    """Base for models that memoize derived values in private attributes.
+
+    Pydantic includes private attributes in equality, so a filled cache
+    would make otherwise identical models compare unequal. Equality here
+    compares the model type and declared fields only.
+    """
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare models by type and field values, ignoring private caches.
+
+        Args:
+            other: Object to compare with
+
+        Returns:
+            Whether both models have the same type and field values
+        """
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
 
 
 class IntentionDescription(BaseModel):
@@ -118,17 +214,46 @@ class IntentionDescription(BaseModel):
         if isinstance(v, dict):
             return v
         if isinstance(v, str):
-            import json
-
             try:
-                return json.loads(v)
-            except json.JSONDecodeError as e:
+                return _json_loads(v)
+            except ValueError as e:
                 logger.warning(f"Failed to parse structured intent: {e}")
                 return None
         return None
 
+    def match_text(self) -> str:
+        """Build the text used by intent matchers for this description.
+
+        Combines the natural language text with the structured "intent"
+        value when present.
+
+        Returns:
+            Combined text, or "unknown intent" if both are empty
+        """
+        text_parts = [self.nl_text]
+
+        if self.structured and isinstance(self.structured, dict):
+            intent_value = self.structured.get("intent", "")
+            if intent_value:
+                text_parts.append(intent_value)
+
+        combined_text = " ".join(text_parts).strip()
 
-class IntentContext(BaseModel):
+        return combined_text if combined_text else "unknown intent"
+
+    def structured_json(self) -> str:
+        """Serialize the structured description for the RDF representation.
+
+        Falls back to ``{"intent": nl_text}`` when there is no structured
+        value.
+
+        Returns:
+            JSON text of the structured description
+        """
+        return _json_dumps(self.structured or {"intent": self.nl_text})
+
+
+class IntentContext(_CachingModel):
     """Context requirements for signifier applicability.
 
     Args:
@@ -141,6 +266,88 @@ class IntentContext(BaseModel):
     shacl_shapes: Optional[str] = None
     nl_description: Optional[str] = None
 
+    _constraint_count_cache: Optional[Tuple[str, int]] = PrivateAttr(default=None)
+    _shapes_graph_cache: Optional[Tuple[str, Any]] = PrivateAttr(default=None)
+    _property_keys_cache: Optional[
+        Tuple[List[StructuredCondition], int, FrozenSet[Tuple[str, str]]]
+    ] = PrivateAttr(default=None)
+
+    @property
+    def property_keys(self) -> FrozenSet[Tuple[str, str]]:
+        """(artifact, property) pairs referenced by the structured conditions.
+
+        The set is cached against the current conditions list and rebuilt
+        when the list is reassigned or changes length.
+
+        Returns:
+            Frozen set of (artifact_uri, property_uri) tuples
+        """
+        conditions = self.structured_conditions
+        cached = self._property_keys_cache
+        if (
+            cached is not None
+            and cached[0] is conditions
+            and cached[1] == len(conditions)
+        ):
+            return cached[2]
+        keys = frozenset(
+            (condition.artifact, condition.property_affordance)
+            for condition in conditions
+        )
+        self._property_keys_cache = (conditions, len(conditions), keys)
+        return keys
+
+    @property
+    def shapes_graph(self) -> Optional[Any]:
+        """Parsed rdflib graph of the SHACL shapes, if one was attached.
+
+        The graph is only returned while shacl_shapes is still the string
+        it was attached for. It is shared and must not be modified.
+
+        Returns:
+            Shapes graph, or None when shapes must be parsed from Turtle
+        """
+        shapes = self.shacl_shapes
+        cached = self._shapes_graph_cache
+        if shapes and cached is not None and cached[0] is shapes:
+            return cached[1]
+        return None
+
+    def attach_shapes_graph(self, shapes_graph: Any) -> None:
+        """Attach the parsed graph the current shacl_shapes were built from.
+
+        Args:
+            shapes_graph: rdflib Graph holding the same shapes
+        """
+        self._shapes_graph_cache = (self.shacl_shapes, shapes_graph)
+
+    @property
+    def constraint_count(self) -> int:
+        """Number of sh:property and sh:class constraints in the shapes.
+
+        Both prefixed (``sh:property``) and full IRI forms are counted, so
+        Turtle and N-Triples shapes are handled alike. The count is cached
+        against the current shapes string and recomputed only when
+        shacl_shapes is reassigned.
+
+        Returns:
+            Constraint count (0 when there are no shapes)
+        """
+        shapes = self.shacl_shapes
+        if not shapes:
+            return 0
+        cached = self._constraint_count_cache
+        if cached is not None and cached[0] is shapes:
+            return cached[1]
+        count = (
+            shapes.count("sh:property")
+            + shapes.count("sh:class")
+            + shapes.count(_SH_PROPERTY_IRI)
+            + shapes.count(_SH_CLASS_IRI)
+        )
+        self._constraint_count_cache = (shapes, count)
+        return count
+
 
 class Signifier(BaseModel):
     """Canonical signifier with dual representation.
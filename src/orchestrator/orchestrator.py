@@ -5,20 +5,53 @@ retrieval pipelines with multiple stages (IM -> SV -> RP) and tracks
 per-module performance metrics.
 """
 
+import copy
+import json
 import logging
+import os
 import time
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from src.matching.registry import IntentMatcherRegistry
+from src.models.signifier import IntentContext, Signifier
 from src.ranking.ranker import Ranker, RankedResult
 from src.storage.registry import SignifierRegistry
-from src.subsumption.sse import SSE
+from src.subsumption.sse import SSE, SSEResult
 from src.validation.context_builder import ContextGraphBuilder
-from src.validation.shacl_validator import SHACLValidator
+from src.validation.shacl_validator import SHACLValidator, ValidationResult
 
 logger = logging.getLogger(__name__)
 
+_RANKER_CACHE_SIZE = 32
+
+
+def _canonical_json(value: Any) -> Union[str, bytes]:
+    """Serialize a value to JSON with sorted keys for use in cache keys.
+
+    Uses orjson when it is installed and the standard library otherwise;
+    the two encodings are never mixed within one process.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        Canonical JSON encoding
+
+    Raises:
+        TypeError: If the value is not JSON-serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(value, sort_keys=True)
+
 
 @dataclass
 class RetrievalRequest:
@@ -81,12 +114,15 @@ class RetrievalResponse:
         module_results: Per-module execution results
         total_latency_ms: Total pipeline latency
         request: Original request
+        cached: Whether the response was served from the response cache;
+            module latencies then describe the run that filled the cache
     """
 
     results: List[RankedResult]
     module_results: List[ModuleResult]
     total_latency_ms: float
     request: RetrievalRequest
+    cached: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation.
@@ -98,6 +134,7 @@ class RetrievalResponse:
             "results": [r.to_dict() for r in self.results],
             "module_results": [m.to_dict() for m in self.module_results],
             "total_latency_ms": round(self.total_latency_ms, 2),
+            "cached": self.cached,
             "request": {
                 "intent_query": self.request.intent_query,
                 "context_input": self.request.context_input,
@@ -124,6 +161,8 @@ class RetrievalOrchestrator:
         shacl_validator: Optional[SHACLValidator] = None,
         ranker: Optional[Ranker] = None,
         default_pipeline: Optional[List[str]] = None,
+        response_cache_size: int = 128,
+        sv_max_workers: Optional[int] = None,
     ):
         """Initialize the retrieval orchestrator.
 
@@ -135,6 +174,9 @@ class RetrievalOrchestrator:
             shacl_validator: SHACL validator
             ranker: Ranker & policy module
             default_pipeline: Default pipeline modules
+            response_cache_size: Maximum cached responses (0 disables)
+            sv_max_workers: Threads for parallel SHACL validation
+                (default: CPU count; 1 validates sequentially)
         """
         self.registry = registry
         self.matcher_registry = matcher_registry or IntentMatcherRegistry(
@@ -143,11 +185,30 @@ class RetrievalOrchestrator:
         self.context_builder = context_builder or ContextGraphBuilder()
         self.sse = sse or SSE(missing_value_policy="fail")
         self.shacl_validator = shacl_validator or SHACLValidator(
-            enable_caching=False
+            enable_caching=True
         )
         self.ranker = ranker or Ranker()
+        self._ranker_cache: Dict[FrozenSet[Tuple[str, float]], Ranker] = {}
         self.default_pipeline = default_pipeline or ["IM", "SSE", "SV", "RP"]
 
+        self._snapshot: Tuple[
+            Optional[int], List[Signifier], Dict[str, Signifier]
+        ] = (None, [], {})
+
+        self.sv_max_workers = sv_max_workers or os.cpu_count() or 1
+        self._sv_pool = (
+            ThreadPoolExecutor(
+                max_workers=self.sv_max_workers, thread_name_prefix="sv"
+            )
+            if self.sv_max_workers > 1
+            else None
+        )
+
+        self.response_cache_size = response_cache_size
+        self._response_cache: "OrderedDict[Tuple, RetrievalResponse]" = (
+            OrderedDict()
+        )
+
         logger.info(
             f"Initialized Retrieval Orchestrator "
             f"(default_pipeline={self.default_pipeline})"
@@ -156,13 +217,116 @@ class RetrievalOrchestrator:
     def retrieve(self, request: RetrievalRequest) -> RetrievalResponse:
         """Execute retrieval pipeline for a request.
 
+        Responses are cached in an LRU keyed on the request contents and the
+        registry epoch, so identical requests against unchanged storage
+        skip the pipeline entirely. A cache hit returns a copy marked as
+        cached, with the total latency measured for the lookup.
+
         Args:
             request: Retrieval request with intent and context
 
         Returns:
             Retrieval response with ranked results and metrics
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        cache_key = self._compute_cache_key(request)
+
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                logger.info(
+                    f"Serving cached retrieval for intent: '{request.intent_query}'"
+                )
+                return self._copy_cached_response(cached, start_ns)
+
+        response = self._run_pipeline(request)
+
+        if cache_key is not None:
+            self._response_cache[cache_key] = response
+            if len(self._response_cache) > self.response_cache_size:
+                self._response_cache.popitem(last=False)
+
+        return response
+
+    def clear_cache(self) -> None:
+        """Clear cached retrieval responses."""
+        self._response_cache.clear()
+        logger.info("Retrieval response cache cleared")
+
+    @staticmethod
+    def _copy_cached_response(
+        response: RetrievalResponse, start_ns: int
+    ) -> RetrievalResponse:
+        """Copy a cached response so callers cannot modify the cache.
+
+        Result and module objects and their metadata dicts are copied;
+        nested metadata values are shared and must not be mutated in place.
+
+        Args:
+            response: Cached response
+            start_ns: perf_counter_ns() at the start of the lookup
+
+        Returns:
+            Response copy marked as cached
+        """
+        results = []
+        for result in response.results:
+            result = copy.copy(result)
+            result.metadata = dict(result.metadata)
+            results.append(result)
+        module_results = [
+            replace(module_result, metadata=dict(module_result.metadata))
+            for module_result in response.module_results
+        ]
+        return replace(
+            response,
+            results=results,
+            module_results=module_results,
+            total_latency_ms=(time.perf_counter_ns() - start_ns) / 1e6,
+            cached=True,
+        )
+
+    def _compute_cache_key(self, request: RetrievalRequest) -> Optional[Tuple]:
+        """Compute the response cache key for a request.
+
+        Args:
+            request: Retrieval request
+
+        Returns:
+            Hashable cache key, or None if caching is disabled or the
+            request cannot be canonicalized
+        """
+        if self.response_cache_size <= 0:
+            return None
+
+        try:
+            context_key = _canonical_json(request.context_input)
+            weights_key = _canonical_json(request.ranking_weights)
+        except (TypeError, ValueError):
+            return None
+
+        return (
+            request.intent_query,
+            context_key,
+            tuple(request.pipeline or self.default_pipeline),
+            request.matcher_version,
+            request.k,
+            weights_key,
+            request.enable_sse,
+            self.registry.epoch,
+        )
+
+    def _run_pipeline(self, request: RetrievalRequest) -> RetrievalResponse:
+        """Run the configured pipeline modules for a request.
+
+        Args:
+            request: Retrieval request with intent and context
+
+        Returns:
+            Retrieval response with ranked results and metrics
+        """
+        start_ns = time.perf_counter_ns()
         pipeline = request.pipeline or self.default_pipeline
         module_results = []
 
@@ -178,15 +342,22 @@ class RetrievalOrchestrator:
             module_results.append(im_result)
             candidates = im_result.metadata.get("candidates", [])
 
-        if "SSE" in pipeline and candidates and request.enable_sse:
-            sse_result = self._execute_sse(request, candidates)
-            module_results.append(sse_result)
-            candidates = sse_result.metadata.get("candidates", [])
+        run_sse = "SSE" in pipeline and request.enable_sse
+
+        if run_sse and "SV" in pipeline and candidates:
+            fused_results = self._execute_fused(request, candidates)
+            module_results.extend(fused_results)
+            candidates = fused_results[-1].metadata.get("candidates", [])
+        else:
+            if run_sse and candidates:
+                sse_result = self._execute_sse(request, candidates)
+                module_results.append(sse_result)
+                candidates = sse_result.metadata.get("candidates", [])
 
-        if "SV" in pipeline and candidates:
-            sv_result = self._execute_shacl_validation(request, candidates)
-            module_results.append(sv_result)
-            candidates = sv_result.metadata.get("candidates", [])
+            if "SV" in pipeline and candidates:
+                sv_result = self._execute_shacl_validation(request, candidates)
+                module_results.append(sv_result)
+                candidates = sv_result.metadata.get("candidates", [])
 
         if "RP" in pipeline and candidates:
             rp_result = self._execute_ranking(request, candidates)
@@ -195,7 +366,7 @@ class RetrievalOrchestrator:
         else:
             ranked_results = []
 
-        total_latency_ms = (time.time() - start_time) * 1000
+        total_latency_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         logger.info(
             f"Pipeline complete: {len(ranked_results)} results, "
@@ -209,6 +380,30 @@ class RetrievalOrchestrator:
             request=request,
         )
 
+    def _get_signifier_snapshot(
+        self,
+    ) -> Tuple[int, List[Signifier], Dict[str, Signifier]]:
+        """Get signifiers and an ID lookup for the current epoch.
+
+        The registry is only re-listed when its epoch changes.
+
+        Returns:
+            Tuple of (epoch, signifiers, signifiers by ID)
+        """
+        epoch = self.registry.epoch
+        if self._snapshot[0] != epoch:
+            all_signifiers = self.registry.list_signifiers(limit=10000)
+            self._snapshot = (
+                epoch,
+                all_signifiers,
+                {s.signifier_id: s for s in all_signifiers},
+            )
+            logger.debug(
+                f"Refreshed signifier snapshot: {len(all_signifiers)} "
+                f"signifiers at epoch {epoch}"
+            )
+        return self._snapshot
+
     def _execute_intent_matching(
         self, request: RetrievalRequest
     ) -> ModuleResult:
@@ -220,21 +415,21 @@ class RetrievalOrchestrator:
         Returns:
             Module result with candidates
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
-        all_signifiers = self.registry.list_signifiers(limit=10000)
-        signifier_dicts = [s.model_dump() for s in all_signifiers]
+        epoch, all_signifiers, signifiers_by_id = self._get_signifier_snapshot()
 
         match_results = self.matcher_registry.match(
             intent_query=request.intent_query,
-            signifiers=signifier_dicts,
+            signifiers=all_signifiers,
             k=request.k,
             version=request.matcher_version,
+            corpus_version=epoch,
         )
 
         candidates = []
         for match in match_results:
-            signifier = self.registry.get(match.signifier_id)
+            signifier = signifiers_by_id.get(match.signifier_id)
             if signifier:
                 candidates.append(
                     {
@@ -244,7 +439,7 @@ class RetrievalOrchestrator:
                     }
                 )
 
-        latency_ms = (time.time() - start_time) * 1000
+        latency_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         logger.info(
             f"IM: {len(candidates)} candidates in {latency_ms:.2f}ms"
@@ -273,9 +468,10 @@ class RetrievalOrchestrator:
         Returns:
             Module result with SSE-filtered candidates
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         context_features = request.context_input
+        context_keys = self._context_keys(context_features)
         sse_candidates = []
 
         for candidate in candidates:
@@ -292,8 +488,8 @@ class RetrievalOrchestrator:
                 )
                 continue
 
-            sse_result = self.sse.evaluate(
-                structured_conditions, context_features
+            sse_result = self._evaluate_sse(
+                signifier.context, context_features, context_keys
             )
 
             sse_candidates.append(
@@ -305,7 +501,7 @@ class RetrievalOrchestrator:
                 }
             )
 
-        latency_ms = (time.time() - start_time) * 1000
+        latency_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         passed_count = sum(1 for c in sse_candidates if c["sse_pass"])
 
@@ -324,6 +520,171 @@ class RetrievalOrchestrator:
             },
         )
 
+    @staticmethod
+    def _context_keys(
+        context_features: Dict[str, Dict[str, Any]],
+    ) -> Set[Tuple[str, str]]:
+        """Collect the (artifact, property) pairs present in a context.
+
+        Args:
+            context_features: Context as {artifact_uri: {property_uri: value}}
+
+        Returns:
+            Set of (artifact_uri, property_uri) tuples
+        """
+        return {
+            (artifact, property_uri)
+            for artifact, properties in context_features.items()
+            if isinstance(properties, dict)
+            for property_uri in properties
+        }
+
+    def _evaluate_sse(
+        self,
+        intent_context: IntentContext,
+        context_features: Dict[str, Dict[str, Any]],
+        context_keys: Set[Tuple[str, str]],
+    ) -> SSEResult:
+        """Evaluate a signifier's structured conditions.
+
+        Signifiers none of whose properties occur in the context are
+        answered from the condition list alone, skipping the per-condition
+        context lookups.
+
+        Args:
+            intent_context: Signifier context with structured conditions
+            context_features: Context as {artifact_uri: {property_uri: value}}
+            context_keys: Result of _context_keys for context_features
+
+        Returns:
+            SSE result
+        """
+        if context_keys.isdisjoint(intent_context.property_keys):
+            return self.sse.missing_result(intent_context.structured_conditions)
+        return self.sse.evaluate(
+            intent_context.structured_conditions, context_features
+        )
+
+    def _execute_fused(
+        self, request: RetrievalRequest, candidates: List[Dict[str, Any]]
+    ) -> List[ModuleResult]:
+        """Execute SSE and SV in a single pass over the candidates.
+
+        Each IM candidate is copied once and the SSE and SV fields are
+        written into that copy instead of copying it per module, leaving
+        the IM candidates untouched; the SSE module result gets a shallow
+        snapshot taken before the SV fields are added. When the ranker
+        gates on SSE, candidates failing SSE are not SHACL-validated since
+        they cannot score anyway; they are marked with
+        ``shacl_conforms=None`` and not counted by SV. Candidates with
+        shapes are validated in one batch so the SV thread pool is still
+        used.
+
+        Args:
+            request: Retrieval request
+            candidates: Candidates from IM module
+
+        Returns:
+            SSE and SV module results, in that order
+        """
+        sse_start_ns = time.perf_counter_ns()
+
+        candidates = [dict(candidate) for candidate in candidates]
+
+        context_features = request.context_input
+        context_keys = self._context_keys(context_features)
+        skip_failed_sse = self._get_ranker(request).enable_sse_gate
+        sse_passed = 0
+
+        for candidate in candidates:
+            signifier = candidate["signifier"]
+            structured_conditions = signifier.context.structured_conditions
+
+            if structured_conditions:
+                sse_result = self._evaluate_sse(
+                    signifier.context, context_features, context_keys
+                )
+                candidate["sse_pass"] = sse_result.sse_pass
+                candidate["sse_violations"] = [
+                    v.message for v in sse_result.violations
+                ]
+                candidate["sse_checked"] = sse_result.conditions_checked
+            else:
+                candidate["sse_pass"] = True
+                candidate["sse_violations"] = []
+
+            if candidate["sse_pass"]:
+                sse_passed += 1
+
+        sse_candidates = [dict(candidate) for candidate in candidates]
+        sse_end_ns = time.perf_counter_ns()
+
+        sv_checked = 0
+        pending: List[Tuple[Dict[str, Any], str]] = []
+        for candidate in candidates:
+            validated = candidate["sse_pass"] or not skip_failed_sse
+            candidate["shacl_conforms"] = True if validated else None
+            candidate["shacl_violations"] = []
+            candidate["shacl_has_shapes"] = False
+            candidate["constraint_count"] = 0
+            if not validated:
+                continue
+
+            sv_checked += 1
+            shapes = candidate["signifier"].context.shacl_shapes
+            if shapes:
+                pending.append((candidate, shapes))
+
+        if pending:
+            context_graph, _ = self.context_builder.normalize_context(
+                request.context_input
+            )
+            validations = self._validate_shapes(
+                context_graph,
+                [shapes for _, shapes in pending],
+                stable_identity=context_graph is not request.context_input,
+            )
+            for (candidate, _), validation in zip(pending, validations):
+                candidate["shacl_conforms"] = validation.conforms
+                candidate["shacl_violations"] = [
+                    v.message for v in validation.violations
+                ]
+                candidate["shacl_has_shapes"] = True
+                candidate["constraint_count"] = (
+                    candidate["signifier"].context.constraint_count
+                )
+
+        sse_latency_ms = (sse_end_ns - sse_start_ns) / 1e6
+        sv_latency_ms = (time.perf_counter_ns() - sse_end_ns) / 1e6
+        sv_passed = sum(1 for c in candidates if c["shacl_conforms"] is True)
+
+        logger.info(
+            f"SSE: {sse_passed}/{len(candidates)} passed in "
+            f"{sse_latency_ms:.2f}ms; SV: {sv_passed}/{sv_checked} "
+            f"passed in {sv_latency_ms:.2f}ms ({len(pending)} validated)"
+        )
+
+        return [
+            ModuleResult(
+                module_name="SSE",
+                latency_ms=sse_latency_ms,
+                candidate_count=len(candidates),
+                metadata={
+                    "candidates": sse_candidates,
+                    "passed_count": sse_passed,
+                },
+            ),
+            ModuleResult(
+                module_name="SV",
+                latency_ms=sv_latency_ms,
+                candidate_count=sv_checked,
+                metadata={
+                    "candidates": candidates,
+                    "passed_count": sv_passed,
+                },
+            ),
+        ]
+
     def _execute_shacl_validation(
         self, request: RetrievalRequest, candidates: List[Dict[str, Any]]
     ) -> ModuleResult:
@@ -336,34 +697,33 @@ class RetrievalOrchestrator:
         Returns:
             Module result with validated candidates
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         context_graph, _ = self.context_builder.normalize_context(
             request.context_input
         )
 
+        shapes_list = [
+            candidate["signifier"].context.shacl_shapes for candidate in candidates
+        ]
+        validations = self._validate_shapes(
+            context_graph,
+            shapes_list,
+            stable_identity=context_graph is not request.context_input,
+        )
+
         validated_candidates = []
-        for candidate in candidates:
-            signifier = candidate["signifier"]
+        for candidate, validation in zip(candidates, validations):
             shacl_conforms = True
             shacl_violations = []
             shacl_has_shapes = False
             constraint_count = 0
 
-            if signifier.context.shacl_shapes:
+            if validation is not None:
                 shacl_has_shapes = True
-                validation = self.shacl_validator.validate_signifier_context(
-                    context_graph,
-                    signifier.context.shacl_shapes,
-                    format="turtle",
-                )
                 shacl_conforms = validation.conforms
                 shacl_violations = [v.message for v in validation.violations]
-
-                if signifier.context.shacl_shapes:
-                    constraint_count = signifier.context.shacl_shapes.count(
-                        "sh:property"
-                    ) + signifier.context.shacl_shapes.count("sh:class")
+                constraint_count = candidate["signifier"].context.constraint_count
 
             validated_candidates.append(
                 {
@@ -375,7 +735,7 @@ class RetrievalOrchestrator:
                 }
             )
 
-        latency_ms = (time.time() - start_time) * 1000
+        latency_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         passed_count = sum(
             1 for c in validated_candidates if c["shacl_conforms"]
@@ -396,6 +756,80 @@ class RetrievalOrchestrator:
             },
         )
 
+    def _validate_shapes(
+        self,
+        context_graph: Any,
+        shapes_list: List[Optional[str]],
+        stable_identity: bool = False,
+    ) -> List[Optional[ValidationResult]]:
+        """Validate a context graph against several shapes strings.
+
+        Candidates without shapes get None and never reach the pool; the
+        rest are validated concurrently when more than one needs it.
+
+        Args:
+            context_graph: Normalized context graph
+            shapes_list: SHACL shapes (Turtle) per candidate, or None
+            stable_identity: The graph was built for this request and is
+                not modified, so its cache-key hash is computed only once
+
+        Returns:
+            Validation results aligned with shapes_list
+        """
+        results: List[Optional[ValidationResult]] = [None] * len(shapes_list)
+        pending = [(i, shapes) for i, shapes in enumerate(shapes_list) if shapes]
+
+        if self._sv_pool is not None and len(pending) > 1:
+            futures = [
+                (
+                    i,
+                    self._sv_pool.submit(
+                        self.shacl_validator.validate_signifier_context,
+                        context_graph,
+                        shapes,
+                        format="turtle",
+                        stable_identity=stable_identity,
+                    ),
+                )
+                for i, shapes in pending
+            ]
+            for i, future in futures:
+                results[i] = future.result()
+        else:
+            for i, shapes in pending:
+                results[i] = self.shacl_validator.validate_signifier_context(
+                    context_graph,
+                    shapes,
+                    format="turtle",
+                    stable_identity=stable_identity,
+                )
+
+        return results
+
+    def _get_ranker(self, request: RetrievalRequest) -> Ranker:
+        """Get the ranker for a request.
+
+        Rankers for custom weights are cached, so requests repeating the
+        same weights share one instance.
+
+        Args:
+            request: Retrieval request
+
+        Returns:
+            A ranker with the request's custom weights, or the default one
+        """
+        if not request.ranking_weights:
+            return self.ranker
+
+        key = frozenset(request.ranking_weights.items())
+        ranker = self._ranker_cache.get(key)
+        if ranker is None:
+            if len(self._ranker_cache) >= _RANKER_CACHE_SIZE:
+                self._ranker_cache.pop(next(iter(self._ranker_cache)))
+            ranker = Ranker(weights=request.ranking_weights)
+            self._ranker_cache[key] = ranker
+        return ranker
+
     def _execute_ranking(
         self, request: RetrievalRequest, candidates: List[Dict[str, Any]]
     ) -> ModuleResult:
@@ -408,16 +842,19 @@ class RetrievalOrchestrator:
         Returns:
             Module result with ranked results
         """
-        start_time = time.time()
+        if not candidates:
+            return ModuleResult(
+                module_name="RP",
+                latency_ms=0.0,
+                candidate_count=0,
+                metadata={"ranked_results": []},
+            )
 
-        if request.ranking_weights:
-            ranker = Ranker(weights=request.ranking_weights)
-        else:
-            ranker = self.ranker
+        start_ns = time.perf_counter_ns()
 
-        ranked_results = ranker.rank(candidates)
+        ranked_results = self._get_ranker(request).rank_batch(candidates)
 
-        latency_ms = (time.time() - start_time) * 1000
+        latency_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         logger.info(
             f"RP: Ranked {len(ranked_results)} candidates in {latency_ms:.2f}ms"
@@ -7,7 +7,10 @@ into final scores with explainability.
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -29,25 +32,199 @@ class RankingSignal:
     is_gate: bool = False
 
 
+class _RankingInputs(NamedTuple):
+    """Raw candidate signals and the ranker policy they were scored with."""
+
+    intent_similarity: Any
+    shacl_conforms: Any
+    shacl_has_shapes: Any
+    sse_pass: Any
+    sse_present: bool
+    constraint_count: int
+    passed_gates: bool
+    intent_weight: float
+    shacl_weight: float
+    sse_weight: float
+    enable_shacl_gate: bool
+    enable_sse_gate: bool
+    specificity_boost: float
+
+
+def _signal_value(value: Any) -> float:
+    """Convert a signal value to a number for weighting.
+
+    Args:
+        value: Score or boolean outcome
+
+    Returns:
+        1.0/0.0 for booleans, otherwise the value as float
+    """
+    if isinstance(value, bool):
+        return 1.0 if value else 0.0
+    return float(value)
+
+
+def _make_scorer(
+    w_intent: float,
+    w_shacl: float,
+    w_sse: float,
+    weight_totals: Tuple[float, float, float, float],
+    count_shacl: bool,
+    count_sse: bool,
+    specificity_boost: float,
+) -> Callable[[_RankingInputs], float]:
+    """Build a scoring function specialized to a fixed ranker configuration.
+
+    The weights and policy are bound as closure constants. Gate signals
+    do not contribute to the weighted average; SHACL and SSE only count
+    when present and not configured as gates.
+
+    Args:
+        w_intent: Intent similarity weight
+        w_shacl: SHACL weight
+        w_sse: SSE weight
+        weight_totals: Denominators indexed by SHACL counted + 2 * SSE counted
+        count_shacl: Whether SHACL contributes to the score (not a gate)
+        count_sse: Whether SSE contributes to the score (not a gate)
+        specificity_boost: Score boost per constraint
+
+    Returns:
+        Function mapping ranking inputs to the final score
+    """
+
+    def score(raw: _RankingInputs) -> float:
+        if not raw.passed_gates:
+            return 0.0
+
+        weighted_sum = _signal_value(raw.intent_similarity) * w_intent
+        index = 0
+        if count_shacl and raw.shacl_has_shapes:
+            weighted_sum += _signal_value(raw.shacl_conforms) * w_shacl
+            index += 1
+        if count_sse and raw.sse_present:
+            weighted_sum += _signal_value(raw.sse_pass) * w_sse
+            index += 2
+
+        total_weight = weight_totals[index]
+        final_score = weighted_sum / total_weight if total_weight != 0 else 0.0
+
+        if raw.constraint_count > 0:
+            boost = raw.constraint_count * specificity_boost
+            final_score = min(1.0, final_score + boost)
+        return final_score
+
+    return score
+
+
+def _build_signals(raw: _RankingInputs) -> List[RankingSignal]:
+    """Build the ranking signals for a candidate.
+
+    Args:
+        raw: Candidate signals and ranker policy
+
+    Returns:
+        Signals in intent, SHACL, SSE order
+    """
+    signals = [
+        RankingSignal(
+            name="intent_similarity",
+            value=raw.intent_similarity,
+            weight=raw.intent_weight,
+            is_gate=False,
+        )
+    ]
+    if raw.shacl_has_shapes:
+        signals.append(
+            RankingSignal(
+                name="shacl_conforms",
+                value=raw.shacl_conforms,
+                weight=raw.shacl_weight,
+                is_gate=raw.enable_shacl_gate,
+            )
+        )
+    if raw.sse_present:
+        signals.append(
+            RankingSignal(
+                name="sse_pass",
+                value=raw.sse_pass,
+                weight=raw.sse_weight,
+                is_gate=raw.enable_sse_gate,
+            )
+        )
+    return signals
+
+
+def _build_explanation(raw: _RankingInputs) -> List[str]:
+    """Build the human-readable explanation for a candidate.
+
+    Args:
+        raw: Candidate signals and ranker policy
+
+    Returns:
+        Explanation lines
+    """
+    explanation = [
+        f"Intent similarity: {raw.intent_similarity:.4f} "
+        f"(weight: {raw.intent_weight})"
+    ]
+
+    if raw.shacl_has_shapes:
+        if raw.shacl_conforms:
+            explanation.append(
+                f"SHACL validation: PASS (weight: {raw.shacl_weight})"
+            )
+        else:
+            explanation.append("SHACL validation: FAIL (hard gate)")
+
+    if raw.sse_present:
+        if raw.sse_pass:
+            explanation.append(f"SSE check: PASS (weight: {raw.sse_weight})")
+        else:
+            explanation.append("SSE check: FAIL")
+
+    if raw.passed_gates:
+        if raw.constraint_count > 0:
+            boost = raw.constraint_count * raw.specificity_boost
+            explanation.append(
+                f"Specificity boost: +{boost:.4f} "
+                f"({raw.constraint_count} constraints)"
+            )
+    else:
+        explanation.append("Final score: 0.0 (failed hard gates)")
+
+    return explanation
+
+
 @dataclass
 class RankedResult:
     """Ranked signifier result with score and explanation.
 
+    Signals and explanation are built from the raw candidate signals on
+    first access, so results that are only sorted or counted never pay
+    for them.
+
     Args:
         signifier_id: Signifier identifier
         final_score: Final combined score (0.0 to 1.0)
-        signals: List of signals that contributed to the score
         passed_gates: Whether all hard gates passed
-        explanation: Human-readable explanation of the score
         metadata: Additional metadata
     """
 
     signifier_id: str
     final_score: float
-    signals: List[RankingSignal]
     passed_gates: bool
-    explanation: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _raw: Optional[_RankingInputs] = field(default=None, repr=False, compare=False)
+
+    @cached_property
+    def signals(self) -> List[RankingSignal]:
+        """Signals that contributed to the score."""
+        return _build_signals(self._raw) if self._raw is not None else []
+
+    @cached_property
+    def explanation(self) -> List[str]:
+        """Human-readable explanation of the score."""
+        return _build_explanation(self._raw) if self._raw is not None else []
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation.
@@ -105,6 +282,31 @@ class Ranker:
         self.enable_sse_gate = enable_sse_gate
         self.specificity_boost = specificity_boost
 
+        # Weights are resolved once; the ranker is not meant to be
+        # reconfigured after construction.
+        self._w_intent = self.weights.get("intent_similarity", 0.7)
+        self._w_shacl = self.weights.get("shacl", 0.2)
+        self._w_sse = self.weights.get("sse", 0.1)
+
+        # Score denominators indexed by (SHACL counted) + 2 * (SSE counted),
+        # summed in signal order.
+        self._weight_totals = (
+            0.0 + self._w_intent,
+            0.0 + self._w_intent + self._w_shacl,
+            0.0 + self._w_intent + self._w_sse,
+            0.0 + self._w_intent + self._w_shacl + self._w_sse,
+        )
+
+        self._score_fn = _make_scorer(
+            self._w_intent,
+            self._w_shacl,
+            self._w_sse,
+            self._weight_totals,
+            count_shacl=not enable_shacl_gate,
+            count_sse=not enable_sse_gate,
+            specificity_boost=specificity_boost,
+        )
+
         logger.info(
             f"Initialized Ranker (weights={self.weights}, "
             f"shacl_gate={enable_shacl_gate}, sse_gate={enable_sse_gate})"
@@ -122,96 +324,7 @@ class Ranker:
         Returns:
             List of RankedResult objects sorted by final_score (descending)
         """
-        ranked_results = []
-
-        for candidate in candidates:
-            signifier_id = candidate.get("signifier_id")
-            intent_similarity = candidate.get("intent_similarity", 0.0)
-            shacl_conforms = candidate.get("shacl_conforms", True)
-            shacl_has_shapes = candidate.get("shacl_has_shapes", False)
-            sse_pass = candidate.get("sse_pass", True)
-            constraint_count = candidate.get("constraint_count", 0)
-
-            signals = []
-            explanation = []
-
-            intent_signal = RankingSignal(
-                name="intent_similarity",
-                value=intent_similarity,
-                weight=self.weights.get("intent_similarity", 0.7),
-                is_gate=False,
-            )
-            signals.append(intent_signal)
-            explanation.append(
-                f"Intent similarity: {intent_similarity:.4f} "
-                f"(weight: {intent_signal.weight})"
-            )
-
-            passed_gates = True
-
-            if shacl_has_shapes:
-                shacl_signal = RankingSignal(
-                    name="shacl_conforms",
-                    value=shacl_conforms,
-                    weight=self.weights.get("shacl", 0.2),
-                    is_gate=self.enable_shacl_gate,
-                )
-                signals.append(shacl_signal)
-
-                if shacl_conforms:
-                    explanation.append(
-                        f"SHACL validation: PASS (weight: {shacl_signal.weight})"
-                    )
-                else:
-                    explanation.append("SHACL validation: FAIL (hard gate)")
-                    if self.enable_shacl_gate:
-                        passed_gates = False
-
-            if "sse_pass" in candidate:
-                sse_signal = RankingSignal(
-                    name="sse_pass",
-                    value=sse_pass,
-                    weight=self.weights.get("sse", 0.1),
-                    is_gate=self.enable_sse_gate,
-                )
-                signals.append(sse_signal)
-
-                if sse_pass:
-                    explanation.append(
-                        f"SSE check: PASS (weight: {sse_signal.weight})"
-                    )
-                else:
-                    explanation.append("SSE check: FAIL")
-                    if self.enable_sse_gate:
-                        passed_gates = False
-
-            final_score = 0.0
-            if passed_gates:
-                final_score = self._calculate_weighted_score(signals)
-
-                if constraint_count > 0:
-                    boost = constraint_count * self.specificity_boost
-                    final_score = min(1.0, final_score + boost)
-                    explanation.append(
-                        f"Specificity boost: +{boost:.4f} "
-                        f"({constraint_count} constraints)"
-                    )
-            else:
-                explanation.append("Final score: 0.0 (failed hard gates)")
-
-            ranked_result = RankedResult(
-                signifier_id=signifier_id,
-                final_score=final_score,
-                signals=signals,
-                passed_gates=passed_gates,
-                explanation=explanation,
-                metadata={
-                    "constraint_count": constraint_count,
-                    "shacl_has_shapes": shacl_has_shapes,
-                },
-            )
-            ranked_results.append(ranked_result)
-
+        ranked_results = self._score_all(candidates)
         ranked_results.sort(key=lambda r: r.final_score, reverse=True)
 
         logger.info(
@@ -221,31 +334,177 @@ class Ranker:
 
         return ranked_results
 
-    def _calculate_weighted_score(self, signals: List[RankingSignal]) -> float:
-        """Calculate weighted score from signals.
+    def rank_batch(
+        self,
+        candidates: List[Dict[str, Any]],
+    ) -> List[RankedResult]:
+        """Rank candidates with vectorized scoring.
+
+        Produces the same results as :meth:`rank`, but computes gates and
+        weighted scores for all candidates as NumPy column operations and
+        orders them with one stable argsort. Boolean signals are read by
+        truthiness.
 
         Args:
-            signals: List of ranking signals
+            candidates: List of candidate dictionaries with signals
 
         Returns:
-            Weighted score (0.0 to 1.0)
+            List of RankedResult objects sorted by final_score (descending)
         """
-        total_weight = 0.0
-        weighted_sum = 0.0
+        n = len(candidates)
+        if n == 0:
+            return []
+
+        sims = np.fromiter(
+            (float(c.get("intent_similarity", 0.0)) for c in candidates),
+            dtype=np.float64,
+            count=n,
+        )
+        shacl = np.fromiter(
+            (bool(c.get("shacl_conforms", True)) for c in candidates),
+            dtype=bool,
+            count=n,
+        )
+        has_shapes = np.fromiter(
+            (bool(c.get("shacl_has_shapes", False)) for c in candidates),
+            dtype=bool,
+            count=n,
+        )
+        sse = np.fromiter(
+            (bool(c.get("sse_pass", True)) for c in candidates),
+            dtype=bool,
+            count=n,
+        )
+        sse_present = np.fromiter(
+            ("sse_pass" in c for c in candidates), dtype=bool, count=n
+        )
+        constraint_counts = np.fromiter(
+            (c.get("constraint_count", 0) for c in candidates),
+            dtype=np.float64,
+            count=n,
+        )
 
-        for signal in signals:
-            if signal.is_gate:
-                continue
+        shacl_counted = has_shapes & (not self.enable_shacl_gate)
+        sse_counted = sse_present & (not self.enable_sse_gate)
 
-            if isinstance(signal.value, bool):
-                signal_value = 1.0 if signal.value else 0.0
-            else:
-                signal_value = float(signal.value)
+        weighted = (
+            sims * self._w_intent
+            + shacl * np.where(shacl_counted, self._w_shacl, 0.0)
+            + sse * np.where(sse_counted, self._w_sse, 0.0)
+        )
+        total = np.asarray(self._weight_totals)[
+            shacl_counted.astype(np.intp) + 2 * sse_counted.astype(np.intp)
+        ]
+        scores = np.divide(
+            weighted, total, out=np.zeros(n, dtype=np.float64), where=total != 0
+        )
 
-            weighted_sum += signal_value * signal.weight
-            total_weight += signal.weight
+        boosted = constraint_counts > 0
+        scores = np.where(
+            boosted,
+            np.minimum(1.0, scores + constraint_counts * self.specificity_boost),
+            scores,
+        )
 
-        if total_weight == 0:
-            return 0.0
+        failed = np.zeros(n, dtype=bool)
+        if self.enable_shacl_gate:
+            failed |= has_shapes & ~shacl
+        if self.enable_sse_gate:
+            failed |= sse_present & ~sse
+        scores[failed] = 0.0
+
+        ranked_results = []
+        for i in np.argsort(-scores, kind="stable").tolist():
+            candidate = candidates[i]
+            raw = self._raw_inputs(candidate)
+            ranked_results.append(
+                self._build_result(candidate, raw, float(scores[i]))
+            )
+
+        logger.info(
+            f"Ranked {n} candidates, "
+            f"{n - int(failed.sum())} passed gates"
+        )
+
+        return ranked_results
+
+    def _score_all(self, candidates: List[Dict[str, Any]]) -> List[RankedResult]:
+        """Score candidates one by one, in input order.
 
-        return weighted_sum / total_weight
+        Args:
+            candidates: List of candidate dictionaries with signals
+
+        Returns:
+            Unsorted ranked results
+        """
+        ranked_results = []
+
+        for candidate in candidates:
+            raw = self._raw_inputs(candidate)
+            ranked_results.append(
+                self._build_result(candidate, raw, self._score_fn(raw))
+            )
+
+        return ranked_results
+
+    def _raw_inputs(self, candidate: Dict[str, Any]) -> _RankingInputs:
+        """Read a candidate's signals and evaluate its hard gates.
+
+        Args:
+            candidate: Candidate dictionary with signals
+
+        Returns:
+            Raw ranking inputs under the current policy
+        """
+        shacl_conforms = candidate.get("shacl_conforms", True)
+        shacl_has_shapes = candidate.get("shacl_has_shapes", False)
+        sse_pass = candidate.get("sse_pass", True)
+        sse_present = "sse_pass" in candidate
+
+        passed_gates = not (
+            (self.enable_shacl_gate and shacl_has_shapes and not shacl_conforms)
+            or (self.enable_sse_gate and sse_present and not sse_pass)
+        )
+
+        return _RankingInputs(
+            intent_similarity=candidate.get("intent_similarity", 0.0),
+            shacl_conforms=shacl_conforms,
+            shacl_has_shapes=shacl_has_shapes,
+            sse_pass=sse_pass,
+            sse_present=sse_present,
+            constraint_count=candidate.get("constraint_count", 0),
+            passed_gates=passed_gates,
+            intent_weight=self._w_intent,
+            shacl_weight=self._w_shacl,
+            sse_weight=self._w_sse,
+            enable_shacl_gate=self.enable_shacl_gate,
+            enable_sse_gate=self.enable_sse_gate,
+            specificity_boost=self.specificity_boost,
+        )
+
+    def _build_result(
+        self,
+        candidate: Dict[str, Any],
+        raw: _RankingInputs,
+        final_score: float,
+    ) -> RankedResult:
+        """Assemble a ranked result with deferred signals and explanation.
+
+        Args:
+            candidate: Candidate dictionary with signals
+            raw: Raw ranking inputs from _raw_inputs
+            final_score: Final combined score
+
+        Returns:
+            Ranked result
+        """
+        return RankedResult(
+            signifier_id=candidate.get("signifier_id"),
+            final_score=final_score,
+            passed_gates=raw.passed_gates,
+            metadata={
+                "constraint_count": raw.constraint_count,
+                "shacl_has_shapes": raw.shacl_has_shapes,
+            },
+            _raw=raw,
+        )
@@ -6,18 +6,64 @@ This module provides dual storage:
 - Property index catalog for fast candidate prefiltering
 """
 
+import itertools
 import json
 import logging
+import os
+import sqlite3
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from rdflib import Graph, Namespace, URIRef
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.config import get_settings
 from src.models.signifier import Signifier
 
 logger = logging.getLogger(__name__)
 
+_EPOCH_COUNTER = itertools.count(1)
+_STORE_EPOCHS: Dict[str, int] = {}
+
+_INDEX_MMAP_SIZE = 256 * 1024 * 1024
+
+_RDF_CACHE_SIZE = 256
+
+
+def _dump_document(doc: Dict) -> bytes:
+    """Encode a JSON document as indented UTF-8 JSON.
+
+    Uses orjson when it is installed and the standard library otherwise.
+
+    Args:
+        doc: JSON document
+
+    Returns:
+        Encoded document
+    """
+    if orjson is not None:
+        return orjson.dumps(doc, option=orjson.OPT_INDENT_2)
+    return json.dumps(doc, indent=2).encode("utf-8")
+
+
+def _load_document(data: bytes) -> Dict:
+    """Decode a JSON document.
+
+    Args:
+        data: Encoded document
+
+    Returns:
+        JSON document
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class MemoryStore:
     """Memory store for signifiers with dual RDF and JSON storage.
@@ -44,11 +90,43 @@ class MemoryStore:
         self.json_dir.mkdir(parents=True, exist_ok=True)
         self.index_dir.mkdir(parents=True, exist_ok=True)
 
-        self.property_index: Dict[Tuple[str, str], Set[str]] = {}
-        self._load_property_index()
+        self._epoch_key = str(self.storage_dir.resolve())
+        self._bump_epoch()
+
+        self._open_property_index()
+
+        # Secondary document indexes, built on first use and rebuilt when
+        # another store sharing this directory changes the documents.
+        self.status_index: Dict[str, Set[str]] = {}
+        self.affordance_index: Dict[str, Set[str]] = {}
+        self._document_fields: Dict[str, Tuple[str, str]] = {}
+        self._document_index_epoch: Optional[int] = None
+
+        # Parsed RDF graphs keyed by (signifier_id, version), validated
+        # against the file's (mtime_ns, size).
+        self._rdf_cache: OrderedDict[
+            Tuple[str, int], Tuple[Tuple[int, int], Graph]
+        ] = OrderedDict()
 
         logger.info(f"Initialized MemoryStore at {self.storage_dir}")
 
+    @property
+    def epoch(self) -> int:
+        """Version counter for the signifier documents in this storage dir.
+
+        The counter changes on every document write or delete made by any
+        MemoryStore in this process that shares the same storage directory,
+        so it can be used to invalidate derived indexes and caches.
+
+        Returns:
+            Current epoch
+        """
+        return _STORE_EPOCHS.get(self._epoch_key, 0)
+
+    def _bump_epoch(self) -> None:
+        """Advance the shared epoch for this storage directory."""
+        _STORE_EPOCHS[self._epoch_key] = next(_EPOCH_COUNTER)
+
     def _get_graph_uri(self, signifier_id: str, version: int) -> str:
         """Generate named graph URI for a signifier version.
 
@@ -84,41 +162,111 @@ class MemoryStore:
         """
         return self.json_dir / f"{signifier_id}.json"
 
-    def _load_property_index(self) -> None:
-        """Load property index from disk."""
-        index_path = self.index_dir / "property_index.json"
-        if index_path.exists():
-            try:
-                with open(index_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.property_index = {
-                        tuple(k.split("|")): set(v) for k, v in data.items()
-                    }
-                logger.info(
-                    f"Loaded property index with {len(self.property_index)} entries"
-                )
-            except Exception as e:
-                logger.error(f"Failed to load property index: {e}")
-                self.property_index = {}
+    def _open_property_index(self) -> None:
+        """Open the sqlite property index, importing the legacy JSON index.
+
+        On first use the index is seeded from the property_index.json file
+        written by earlier versions, if present.
+        """
+        self._index_db = sqlite3.connect(
+            self.index_dir / "property_index.db",
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._index_db.execute("PRAGMA journal_mode=WAL")
+        self._index_db.execute("PRAGMA synchronous=NORMAL")
+        self._index_db.execute(f"PRAGMA mmap_size={_INDEX_MMAP_SIZE}")
+
+        exists = self._index_db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'prop_idx'"
+        ).fetchone()
+        if exists:
+            return
+
+        self._index_db.execute("BEGIN")
+        self._index_db.execute(
+            "CREATE TABLE prop_idx ("
+            "artifact TEXT, property TEXT, sig TEXT, "
+            "PRIMARY KEY (artifact, property, sig)) WITHOUT ROWID"
+        )
+        self._index_db.execute("CREATE INDEX prop_idx_sig ON prop_idx (sig)")
+        legacy = self._read_legacy_index()
+        self._index_db.executemany(
+            "INSERT INTO prop_idx VALUES (?, ?, ?)",
+            (
+                (artifact, prop, signifier_id)
+                for (artifact, prop), ids in legacy.items()
+                for signifier_id in ids
+            ),
+        )
+        self._index_db.execute("COMMIT")
+        if legacy:
+            logger.info(f"Imported legacy property index ({len(legacy)} entries)")
+
+    def _read_legacy_index(self) -> Dict[Tuple[str, str], Set[str]]:
+        """Read the JSON property index written by earlier versions.
 
-    def _save_property_index(self) -> None:
-        """Save property index to disk."""
-        index_path = self.index_dir / "property_index.json"
+        Returns:
+            Mapping of (artifact, property) to signifier IDs (empty if none)
+        """
+        index: Dict[Tuple[str, str], Set[str]] = {}
+        json_path = self.index_dir / "property_index.json"
+        if not json_path.exists():
+            return index
         try:
-            data = {
-                "|".join(k): list(v) for k, v in self.property_index.items()
-            }
-            with open(index_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-            logger.debug("Saved property index to disk")
+            with open(json_path, "r", encoding="utf-8") as f:
+                data: Dict[str, List[str]] = json.load(f)
+            for k, v in data.items():
+                artifact, prop = k.split("|")
+                index[(artifact, prop)] = set(v)
         except Exception as e:
-            logger.error(f"Failed to save property index: {e}")
+            logger.error(f"Failed to read legacy property index: {e}")
+            return {}
+        return index
+
+    @property
+    def property_index(self) -> Dict[Tuple[str, str], Set[str]]:
+        """Snapshot of the whole property index.
+
+        Reads every row; use :meth:`find_by_property` for lookups.
+
+        Returns:
+            Mapping of (artifact, property) to signifier IDs
+        """
+        index: Dict[Tuple[str, str], Set[str]] = {}
+        for artifact, prop, signifier_id in self._index_db.execute(
+            "SELECT artifact, property, sig FROM prop_idx"
+        ):
+            index.setdefault((artifact, prop), set()).add(signifier_id)
+        return index
+
+    def _begin_index_write(self) -> None:
+        """Start a property index transaction unless one is already open."""
+        if not self._index_db.in_transaction:
+            self._index_db.execute("BEGIN")
+
+    def flush(self) -> None:
+        """Commit pending property index changes.
+
+        Index updates are collected in one transaction; callers flush once
+        after a write operation (or a batch of them).
+        """
+        if self._index_db.in_transaction:
+            self._index_db.execute("COMMIT")
+
+    def close(self) -> None:
+        """Commit pending property index changes and close the index."""
+        self.flush()
+        self._index_db.close()
 
     def store_rdf_graph(
         self, signifier_id: str, version: int, rdf_data: str, format: str = "turtle"
     ) -> str:
         """Store RDF graph for a signifier version.
 
+        The data is always parsed for validation. Turtle is written to disk
+        unchanged; other formats are converted to Turtle.
+
         Args:
             signifier_id: Signifier identifier
             version: Version number
@@ -131,29 +279,125 @@ class MemoryStore:
         Raises:
             ValueError: If RDF data is invalid
         """
-        graph_uri = self._get_graph_uri(signifier_id, version)
-
         try:
-            graph = Graph()
-            graph.parse(data=rdf_data, format=format)
+            turtle = self._to_turtle(rdf_data, format)
+            self._write_rdf(signifier_id, version, turtle)
+        except Exception as e:
+            logger.error(f"Failed to store RDF graph: {e}")
+            raise ValueError(f"Invalid RDF data: {e}")
 
-            rdf_path = self._get_rdf_path(signifier_id, version)
-            graph.serialize(destination=str(rdf_path), format="turtle")
+        return self._get_graph_uri(signifier_id, version)
 
-            logger.info(
-                f"Stored RDF graph for {signifier_id} v{version} at {rdf_path}"
-            )
-            return graph_uri
+    def _to_turtle(self, rdf_data: str, format: str, validated: bool = False) -> bytes:
+        """Validate RDF data by parsing it and encode it as Turtle.
+
+        Turtle input is only parsed to validate it; it is kept as given
+        instead of being re-serialized from the parsed graph.
 
+        Args:
+            rdf_data: RDF data as string
+            format: RDF serialization format
+            validated: Whether the caller already parsed ``rdf_data``
+                successfully, so Turtle input need not be parsed again
+
+        Returns:
+            UTF-8 encoded Turtle
+        """
+        if validated and format == "turtle":
+            return rdf_data.encode("utf-8")
+        graph = Graph()
+        graph.parse(data=rdf_data, format=format)
+        if format == "turtle":
+            return rdf_data.encode("utf-8")
+        return graph.serialize(format="turtle", encoding="utf-8")
+
+    def _write_rdf(self, signifier_id: str, version: int, turtle: bytes) -> None:
+        """Write a signifier version's Turtle file.
+
+        Args:
+            signifier_id: Signifier identifier
+            version: Version number
+            turtle: UTF-8 encoded Turtle
+        """
+        rdf_path = self._get_rdf_path(signifier_id, version)
+        rdf_path.write_bytes(turtle)
+        self._rdf_cache.pop((signifier_id, version), None)
+        logger.info(f"Stored RDF graph for {signifier_id} v{version} at {rdf_path}")
+
+    def commit_signifier(
+        self,
+        signifier: Signifier,
+        rdf_data: str,
+        format: str = "turtle",
+        validated: bool = False,
+    ) -> str:
+        """Store a signifier's JSON document, property index entries and RDF.
+
+        The RDF is validated before anything is written, so invalid RDF
+        leaves the store untouched. The property index is flushed once.
+
+        Args:
+            signifier: Normalized signifier instance
+            rdf_data: RDF representation as string
+            format: RDF serialization format (default: turtle)
+            validated: Whether the caller already parsed ``rdf_data``
+                successfully (skips re-parsing Turtle input)
+
+        Returns:
+            Named graph URI
+
+        Raises:
+            ValueError: If the RDF data is invalid or storage fails
+        """
+        signifier_id, version = signifier.signifier_id, signifier.version
+        try:
+            turtle = self._to_turtle(rdf_data, format, validated)
         except Exception as e:
-            logger.error(f"Failed to store RDF graph: {e}")
+            logger.error(f"Failed to parse RDF graph: {e}")
             raise ValueError(f"Invalid RDF data: {e}")
 
+        self.store_json_document(signifier)
+        self.update_property_index(signifier)
+        self.flush()
+
+        try:
+            self._write_rdf(signifier_id, version, turtle)
+        except Exception as e:
+            logger.error(f"Failed to store RDF graph: {e}")
+            raise ValueError(f"Failed to store signifier: {e}")
+
+        return self._get_graph_uri(signifier_id, version)
+
+    def get_rdf_text(self, signifier_id: str, version: int) -> Optional[str]:
+        """Retrieve the stored Turtle text for a signifier version.
+
+        The file is returned as stored, without parsing it; use
+        :meth:`get_rdf_graph` when the graph itself is needed.
+
+        Args:
+            signifier_id: Signifier identifier
+            version: Version number
+
+        Returns:
+            Turtle string or None if not found
+        """
+        try:
+            return self._get_rdf_path(signifier_id, version).read_text(
+                encoding="utf-8"
+            )
+        except FileNotFoundError:
+            logger.debug(f"RDF text not found for {signifier_id} v{version}")
+            return None
+
     def get_rdf_graph(
         self, signifier_id: str, version: int
     ) -> Optional[Graph]:
         """Retrieve RDF graph for a signifier version.
 
+        Parsed graphs are cached (least recently used first out) and reused
+        while the file is unchanged, so the returned graph is shared and
+        must not be modified.
+
         Args:
             signifier_id: Signifier identifier
             version: Version number
@@ -162,22 +406,37 @@ class MemoryStore:
             RDF Graph or None if not found
         """
         rdf_path = self._get_rdf_path(signifier_id, version)
+        key = (signifier_id, version)
 
-        if not rdf_path.exists():
+        try:
+            stat = rdf_path.stat()
+        except OSError:
+            self._rdf_cache.pop(key, None)
             logger.debug(
                 f"RDF graph not found for {signifier_id} v{version}"
             )
             return None
 
+        file_state = (stat.st_mtime_ns, stat.st_size)
+        cached = self._rdf_cache.get(key)
+        if cached is not None and cached[0] == file_state:
+            self._rdf_cache.move_to_end(key)
+            return cached[1]
+
         try:
             graph = Graph()
             graph.parse(str(rdf_path), format="turtle")
             logger.debug(f"Retrieved RDF graph for {signifier_id} v{version}")
-            return graph
         except Exception as e:
             logger.error(f"Failed to load RDF graph: {e}")
             return None
 
+        self._rdf_cache[key] = (file_state, graph)
+        self._rdf_cache.move_to_end(key)
+        if len(self._rdf_cache) > _RDF_CACHE_SIZE:
+            self._rdf_cache.popitem(last=False)
+        return graph
+
     def store_json_document(self, signifier: Signifier) -> None:
         """Store JSON document for a signifier.
 
@@ -187,20 +446,70 @@ class MemoryStore:
         Raises:
             ValueError: If storage fails
         """
-        json_path = self._get_json_path(signifier.signifier_id)
+        self._write_document(signifier.signifier_id, signifier.to_json_doc())
+
+    def patch_json_field(
+        self, signifier_id: str, key: str, value: Any
+    ) -> Optional[Dict]:
+        """Set a single top-level field of a stored JSON document.
+
+        Args:
+            signifier_id: Signifier identifier
+            key: Document field name
+            value: JSON-serializable field value
+
+        Returns:
+            Updated JSON document or None if not found
+
+        Raises:
+            ValueError: If storage fails
+        """
+        doc = self.get_json_document(signifier_id)
+        if doc is None:
+            return None
+
+        doc[key] = value
+        self._write_document(signifier_id, doc)
+        return doc
+
+    def _write_document(self, signifier_id: str, doc: Dict) -> None:
+        """Write a JSON document and update the document indexes.
+
+        Args:
+            signifier_id: Signifier identifier
+            doc: JSON document
+
+        Raises:
+            ValueError: If storage fails
+        """
+        json_path = self._get_json_path(signifier_id)
 
         try:
-            doc = signifier.to_json_doc()
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(doc, f, indent=2)
+            indexes_current = self._document_index_epoch == self.epoch
+            json_path.write_bytes(_dump_document(doc))
+            self._bump_epoch()
+            if indexes_current:
+                self._index_document(
+                    signifier_id, doc["status"], doc["affordance_uri"]
+                )
+                self._document_index_epoch = self.epoch
 
-            logger.info(
-                f"Stored JSON document for {signifier.signifier_id} at {json_path}"
-            )
+            logger.info(f"Stored JSON document for {signifier_id} at {json_path}")
         except Exception as e:
             logger.error(f"Failed to store JSON document: {e}")
             raise ValueError(f"Failed to store signifier: {e}")
 
+    def has_signifier(self, signifier_id: str) -> bool:
+        """Check whether a signifier's JSON document exists.
+
+        Args:
+            signifier_id: Signifier identifier
+
+        Returns:
+            True if the signifier is stored
+        """
+        return self._get_json_path(signifier_id).exists()
+
     def get_json_document(self, signifier_id: str) -> Optional[Dict]:
         """Retrieve JSON document for a signifier.
 
@@ -212,15 +521,13 @@ class MemoryStore:
         """
         json_path = self._get_json_path(signifier_id)
 
-        if not json_path.exists():
-            logger.debug(f"JSON document not found for {signifier_id}")
-            return None
-
         try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                doc = json.load(f)
+            doc = _load_document(json_path.read_bytes())
             logger.debug(f"Retrieved JSON document for {signifier_id}")
             return doc
+        except FileNotFoundError:
+            logger.debug(f"JSON document not found for {signifier_id}")
+            return None
         except Exception as e:
             logger.error(f"Failed to load JSON document: {e}")
             return None
@@ -228,18 +535,19 @@ class MemoryStore:
     def update_property_index(self, signifier: Signifier) -> None:
         """Update property index catalog with signifier's properties.
 
+        The change is committed by the next :meth:`flush`.
+
         Args:
             signifier: Signifier instance
         """
         property_keys = signifier.get_property_keys()
 
-        for artifact_uri, property_uri in property_keys:
-            key = (artifact_uri, property_uri)
-            if key not in self.property_index:
-                self.property_index[key] = set()
-            self.property_index[key].add(signifier.signifier_id)
-
-        self._save_property_index()
+        signifier_id = signifier.signifier_id
+        self._begin_index_write()
+        self._index_db.executemany(
+            "INSERT OR IGNORE INTO prop_idx VALUES (?, ?, ?)",
+            [(artifact, prop, signifier_id) for artifact, prop in property_keys],
+        )
         logger.debug(
             f"Updated property index for {signifier.signifier_id}: {property_keys}"
         )
@@ -256,8 +564,13 @@ class MemoryStore:
         Returns:
             List of signifier IDs that reference this property
         """
-        key = (artifact_uri, property_uri)
-        signifier_ids = list(self.property_index.get(key, set()))
+        signifier_ids = [
+            row[0]
+            for row in self._index_db.execute(
+                "SELECT sig FROM prop_idx WHERE artifact = ? AND property = ?",
+                (artifact_uri, property_uri),
+            )
+        ]
         logger.debug(
             f"Found {len(signifier_ids)} signifiers for {artifact_uri}, {property_uri}"
         )
@@ -269,13 +582,110 @@ class MemoryStore:
         Returns:
             List of signifier IDs
         """
-        signifier_ids = []
-        for json_file in self.json_dir.glob("*.json"):
-            signifier_ids.append(json_file.stem)
+        signifier_ids = self._document_ids()
 
         logger.debug(f"Found {len(signifier_ids)} signifiers in store")
         return signifier_ids
 
+    def find_signifier_ids(
+        self, status: Optional[str] = None, affordance_uri: Optional[str] = None
+    ) -> List[str]:
+        """Find stored signifier IDs by status and affordance.
+
+        Uses the in-memory status and affordance indexes, so no documents
+        are loaded.
+
+        Args:
+            status: Status value to filter by (optional)
+            affordance_uri: Affordance URI to filter by (optional)
+
+        Returns:
+            Sorted list of matching signifier IDs
+        """
+        self._ensure_document_indexes()
+
+        if status is None and affordance_uri is None:
+            return sorted(self._document_fields)
+
+        ids: Optional[Set[str]] = None
+        if status is not None:
+            ids = self.status_index.get(status, set())
+        if affordance_uri is not None:
+            by_affordance = self.affordance_index.get(affordance_uri, set())
+            ids = by_affordance if ids is None else ids & by_affordance
+
+        return sorted(ids)
+
+    def _ensure_document_indexes(self) -> None:
+        """Rebuild the status and affordance indexes if they are stale."""
+        if self._document_index_epoch == self.epoch:
+            return
+
+        epoch = self.epoch
+        self.status_index = {}
+        self.affordance_index = {}
+        self._document_fields = {}
+        for signifier_id in self._document_ids():
+            doc = self.get_json_document(signifier_id)
+            if doc is None:
+                continue
+            self._index_document(
+                signifier_id, doc.get("status"), doc.get("affordance_uri")
+            )
+
+        self._document_index_epoch = epoch
+        logger.debug(f"Built document indexes for {len(self._document_fields)} docs")
+
+    def _index_document(
+        self, signifier_id: str, status: str, affordance_uri: str
+    ) -> None:
+        """Add or replace a document's entries in the secondary indexes.
+
+        Args:
+            signifier_id: Signifier identifier
+            status: Stored status value
+            affordance_uri: Stored affordance URI
+        """
+        self._unindex_document(signifier_id)
+        self._document_fields[signifier_id] = (status, affordance_uri)
+        self.status_index.setdefault(status, set()).add(signifier_id)
+        self.affordance_index.setdefault(affordance_uri, set()).add(signifier_id)
+
+    def _unindex_document(self, signifier_id: str) -> None:
+        """Remove a document from the secondary indexes.
+
+        Args:
+            signifier_id: Signifier identifier
+        """
+        fields = self._document_fields.pop(signifier_id, None)
+        if fields is None:
+            return
+
+        status, affordance_uri = fields
+        for index, key in (
+            (self.status_index, status),
+            (self.affordance_index, affordance_uri),
+        ):
+            ids = index[key]
+            ids.discard(signifier_id)
+            if not ids:
+                del index[key]
+
+    def _document_ids(self) -> List[str]:
+        """List the signifier IDs of the JSON documents on disk.
+
+        Returns:
+            Signifier IDs in directory order
+        """
+        with os.scandir(self.json_dir) as entries:
+            return [
+                entry.name[:-5]
+                for entry in entries
+                if entry.name.endswith(".json")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
+
     def delete_signifier(self, signifier_id: str, version: Optional[int] = None) -> bool:
         """Delete signifier data.
 
@@ -287,14 +697,18 @@ class MemoryStore:
             True if deletion succeeded
         """
         try:
+            indexes_current = self._document_index_epoch == self.epoch
             if version is not None:
                 rdf_path = self._get_rdf_path(signifier_id, version)
                 if rdf_path.exists():
                     rdf_path.unlink()
                     logger.info(f"Deleted RDF for {signifier_id} v{version}")
+                self._rdf_cache.pop((signifier_id, version), None)
             else:
                 for rdf_file in self.rdf_dir.glob(f"{signifier_id}_v*.ttl"):
                     rdf_file.unlink()
+                for key in [k for k in self._rdf_cache if k[0] == signifier_id]:
+                    del self._rdf_cache[key]
                 logger.info(f"Deleted all RDF versions for {signifier_id}")
 
                 json_path = self._get_json_path(signifier_id)
@@ -302,12 +716,16 @@ class MemoryStore:
                     json_path.unlink()
                     logger.info(f"Deleted JSON for {signifier_id}")
 
-                for key in list(self.property_index.keys()):
-                    self.property_index[key].discard(signifier_id)
-                    if not self.property_index[key]:
-                        del self.property_index[key]
-                self._save_property_index()
+                self._begin_index_write()
+                self._index_db.execute(
+                    "DELETE FROM prop_idx WHERE sig = ?", (signifier_id,)
+                )
+                self.flush()
+                self._unindex_document(signifier_id)
 
+            self._bump_epoch()
+            if indexes_current:
+                self._document_index_epoch = self.epoch
             return True
 
         except Exception as e:
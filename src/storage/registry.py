@@ -5,7 +5,9 @@ coordinating Memory Store and Representation Service.
 """
 
 import logging
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
 
 from src.models.signifier import Signifier, SignifierStatus
 from src.storage.memory_store import MemoryStore
@@ -14,6 +16,22 @@ from src.validation import AuthoringValidationError, AuthoringValidator
 
 logger = logging.getLogger(__name__)
 
+# Documents are read in parallel only for pages at least this large.
+_PARALLEL_LOAD_MIN = 8
+_LOAD_WORKERS = 16
+
+
+@lru_cache(maxsize=1)
+def _load_pool() -> ThreadPoolExecutor:
+    """Get the thread pool shared by all registries for document loads.
+
+    Returns:
+        Shared thread pool, created on first use
+    """
+    return ThreadPoolExecutor(
+        max_workers=_LOAD_WORKERS, thread_name_prefix="registry-load"
+    )
+
 
 class SignifierRegistry:
     """Registry for managing signifier lifecycle.
@@ -45,12 +63,35 @@ class SignifierRegistry:
             f"(authoring_validation={enable_authoring_validation})"
         )
 
-    def create(self, signifier: Signifier, rdf_data: Optional[str] = None) -> Signifier:
+    @property
+    def epoch(self) -> int:
+        """Version counter that changes whenever stored signifiers change.
+
+        Returns:
+            Current storage epoch
+        """
+        return self.store.epoch
+
+    def close(self) -> None:
+        """Commit pending index changes and close the underlying store.
+
+        The registry must not be used afterwards.
+        """
+        self.store.close()
+
+    def create(
+        self,
+        signifier: Signifier,
+        rdf_data: Optional[str] = None,
+        rdf_validated: bool = False,
+    ) -> Signifier:
         """Create a new signifier.
 
         Args:
             signifier: Signifier instance
             rdf_data: Optional RDF representation
+            rdf_validated: Whether ``rdf_data`` is Turtle that was already
+                parsed successfully, so the store need not parse it again
 
         Returns:
             Created signifier
@@ -58,8 +99,7 @@ class SignifierRegistry:
         Raises:
             ValueError: If signifier already exists or validation fails
         """
-        existing = self.store.get_json_document(signifier.signifier_id)
-        if existing:
+        if self.store.has_signifier(signifier.signifier_id):
             raise ValueError(
                 f"Signifier {signifier.signifier_id} already exists. Use update instead."
             )
@@ -76,23 +116,18 @@ class SignifierRegistry:
 
         normalized = self.repr_service.normalize_signifier(signifier)
 
-        self.store.store_json_document(normalized)
-
-        self.store.update_property_index(normalized)
-
         if rdf_data:
             try:
-                self.store.store_rdf_graph(
-                    normalized.signifier_id, normalized.version, rdf_data
+                self.store.commit_signifier(
+                    normalized, rdf_data, validated=rdf_validated
                 )
             except ValueError as e:
                 logger.warning(f"Failed to store RDF data: {e}")
-        else:
-            rdf_generated = self.repr_service.generate_rdf(normalized)
-            self.store.store_rdf_graph(
-                normalized.signifier_id,
-                normalized.version,
-                rdf_generated,
+                rdf_data = None
+
+        if not rdf_data:
+            self.store.commit_signifier(
+                normalized, self.repr_service.generate_rdf(normalized)
             )
 
         logger.info(f"Created signifier: {normalized.signifier_id}")
@@ -113,7 +148,10 @@ class SignifierRegistry:
         """
         signifier = self.repr_service.parse_rdf_signifier(rdf_data, format)
 
-        return self.create(signifier, rdf_data)
+        # Turtle with its own prefixes was parsed exactly as it will be
+        # stored, so the store can skip its validating parse.
+        validated = format == "turtle" and "@prefix" in rdf_data
+        return self.create(signifier, rdf_data, rdf_validated=validated)
 
     def get(self, signifier_id: str) -> Optional[Signifier]:
         """Retrieve signifier by ID.
@@ -124,7 +162,18 @@ class SignifierRegistry:
         Returns:
             Signifier instance or None if not found
         """
-        doc = self.store.get_json_document(signifier_id)
+        return self._from_doc(signifier_id, self.store.get_json_document(signifier_id))
+
+    def _from_doc(self, signifier_id: str, doc: Optional[Dict]) -> Optional[Signifier]:
+        """Build a signifier from its stored JSON document.
+
+        Args:
+            signifier_id: Signifier identifier
+            doc: JSON document (None if not found)
+
+        Returns:
+            Signifier instance or None if missing or invalid
+        """
         if not doc:
             return None
 
@@ -136,6 +185,32 @@ class SignifierRegistry:
             logger.error(f"Failed to deserialize signifier {signifier_id}: {e}")
             return None
 
+    def _get_many(self, signifier_ids: Sequence[str]) -> List[Signifier]:
+        """Retrieve several signifiers, skipping missing or invalid ones.
+
+        Documents are read on a thread pool when there are enough of them;
+        the result keeps the order of ``signifier_ids``.
+
+        Args:
+            signifier_ids: Signifier identifiers
+
+        Returns:
+            List of signifiers
+        """
+        if len(signifier_ids) < _PARALLEL_LOAD_MIN:
+            docs = [self.store.get_json_document(sid) for sid in signifier_ids]
+        else:
+            docs = list(
+                _load_pool().map(self.store.get_json_document, signifier_ids)
+            )
+
+        signifiers = []
+        for signifier_id, doc in zip(signifier_ids, docs):
+            signifier = self._from_doc(signifier_id, doc)
+            if signifier:
+                signifiers.append(signifier)
+        return signifiers
+
     def update(self, signifier: Signifier, create_new_version: bool = False) -> Signifier:
         """Update existing signifier.
 
@@ -149,7 +224,11 @@ class SignifierRegistry:
         Raises:
             ValueError: If signifier doesn't exist
         """
-        existing_doc = self.store.get_json_document(signifier.signifier_id)
+        existing_doc = (
+            self.store.get_json_document(signifier.signifier_id)
+            if create_new_version
+            else self.store.has_signifier(signifier.signifier_id)
+        )
         if not existing_doc:
             raise ValueError(
                 f"Signifier {signifier.signifier_id} not found. Use create instead."
@@ -163,15 +242,8 @@ class SignifierRegistry:
 
         normalized = self.repr_service.normalize_signifier(signifier)
 
-        self.store.store_json_document(normalized)
-
-        self.store.update_property_index(normalized)
-
-        rdf_generated = self.repr_service.generate_rdf(normalized)
-        self.store.store_rdf_graph(
-            normalized.signifier_id,
-            normalized.version,
-            rdf_generated,
+        self.store.commit_signifier(
+            normalized, self.repr_service.generate_rdf(normalized)
         )
 
         logger.info(f"Updated signifier: {normalized.signifier_id} v{normalized.version}")
@@ -202,6 +274,9 @@ class SignifierRegistry:
     ) -> List[Signifier]:
         """List signifiers with optional filtering.
 
+        Filtering uses the store's status and affordance indexes, and only
+        the requested page of signifiers is loaded, ordered by ID.
+
         Args:
             status: Filter by status (active or deprecated)
             affordance_uri: Filter by affordance URI
@@ -211,25 +286,16 @@ class SignifierRegistry:
         Returns:
             List of signifiers matching criteria
         """
-        all_ids = self.store.list_all_signifiers()
-
-        signifiers = []
-        for signifier_id in all_ids:
-            signifier = self.get(signifier_id)
-            if not signifier:
-                continue
-
-            if status and signifier.status != status:
-                continue
-
-            if affordance_uri and signifier.affordance_uri != affordance_uri:
-                continue
-
-            signifiers.append(signifier)
+        signifier_ids = self.store.find_signifier_ids(
+            status=status.value if status else None,
+            affordance_uri=affordance_uri,
+        )
 
-        signifiers = signifiers[offset : offset + limit]
+        signifiers = self._get_many(signifier_ids[offset : offset + limit])
 
-        logger.debug(f"Listed {len(signifiers)} signifiers (total: {len(all_ids)})")
+        logger.debug(
+            f"Listed {len(signifiers)} signifiers (total: {len(signifier_ids)})"
+        )
         return signifiers
 
     def find_by_property(
@@ -246,11 +312,7 @@ class SignifierRegistry:
         """
         signifier_ids = self.store.find_by_property(artifact_uri, property_uri)
 
-        signifiers = []
-        for signifier_id in signifier_ids:
-            signifier = self.get(signifier_id)
-            if signifier:
-                signifiers.append(signifier)
+        signifiers = self._get_many(signifier_ids)
 
         logger.debug(
             f"Found {len(signifiers)} signifiers for property {artifact_uri}, {property_uri}"
@@ -262,6 +324,8 @@ class SignifierRegistry:
     ) -> Optional[str]:
         """Get RDF representation of a signifier.
 
+        The stored Turtle file is returned as is, without parsing it.
+
         Args:
             signifier_id: Signifier identifier
             version: Specific version (None uses current version)
@@ -270,22 +334,21 @@ class SignifierRegistry:
             RDF data as Turtle string or None if not found
         """
         if version is None:
-            signifier = self.get(signifier_id)
-            if not signifier:
+            doc = self.store.get_json_document(signifier_id)
+            if not doc:
                 return None
-            version = signifier.version
-
-        graph = self.store.get_rdf_graph(signifier_id, version)
-        if not graph:
-            return None
+            version = doc.get("version", 1)
 
-        return graph.serialize(format="turtle")
+        return self.store.get_rdf_text(signifier_id, version)
 
     def update_status(
         self, signifier_id: str, status: SignifierStatus
     ) -> Optional[Signifier]:
         """Update signifier status.
 
+        Only the stored JSON document changes: the status is not part of
+        the RDF representation or the property index.
+
         Args:
             signifier_id: Signifier identifier
             status: New status
@@ -293,9 +356,8 @@ class SignifierRegistry:
         Returns:
             Updated signifier or None if not found
         """
-        signifier = self.get(signifier_id)
-        if not signifier:
-            return None
-
-        signifier.status = status
-        return self.update(signifier, create_new_version=False)
+        doc = self.store.patch_json_field(signifier_id, "status", status.value)
+        signifier = self._from_doc(signifier_id, doc)
+        if signifier:
+            logger.info(f"Updated status of {signifier_id} to {status.value}")
+        return signifier
@@ -7,10 +7,17 @@ and prepares signifiers for storage.
 import json
 import logging
 import re
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from rdflib import Graph, Literal, Namespace, RDF, URIRef
 from rdflib.namespace import XSD
+from rdflib.term import Node
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from src.models.signifier import (
     IntentContext,
@@ -28,6 +35,177 @@ CASHMERE = Namespace("https://aimas.cs.pub.ro/ont/cashmere#")
 SH = Namespace("http://www.w3.org/ns/shacl#")
 
 
+_PREFIX_BLOCK = (
+    "@prefix cashmere: <https://aimas.cs.pub.ro/ont/cashmere#> .\n"
+    "@prefix sh: <http://www.w3.org/ns/shacl#> .\n"
+    "@prefix hmas: <https://aimas.cs.pub.ro/ont/cashmere#> .\n"
+    "@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .\n"
+    "@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .\n"
+    "\n"
+)
+
+_STRUCTURED_DESCRIPTION_RE = re.compile(
+    r'cashmere:hasStructuredDescription\s+"(.*?)"(?:\^\^xsd:string)?', re.DOTALL
+)
+_ANGLE_IRI_RE = re.compile(r"<(http[^>]+)>")
+
+
+def _quote_description(match: "re.Match[str]") -> str:
+    """Rewrite a structured description as a long string literal.
+
+    IRIs in angle brackets are turned into quoted strings so the JSON
+    content stays valid inside the literal.
+
+    Args:
+        match: Structured description match
+
+    Returns:
+        Replacement Turtle text
+    """
+    content = _ANGLE_IRI_RE.sub(r"'\1'", match.group(1).strip())
+    return f'cashmere:hasStructuredDescription """{content}"""^^xsd:string'
+
+
+@lru_cache(maxsize=4096)
+def _parse_json_cached(text: str) -> Any:
+    """Parse JSON text, memoized by the text itself.
+
+    Uses orjson when it is installed. Text orjson rejects but the standard
+    library accepts (e.g. ``NaN``) is handed to the standard library.
+
+    Args:
+        text: JSON text
+
+    Returns:
+        Parsed value (shared, must not be mutated)
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy the dicts and lists of a parsed JSON value.
+
+    Args:
+        value: Parsed JSON value
+
+    Returns:
+        Copy sharing only the immutable leaves
+    """
+    if type(value) is dict:
+        return {key: _copy_json(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _load_json(text: str) -> Any:
+    """Parse a structured description literal.
+
+    Signifiers are re-parsed with the same description literals over and
+    over, so the parse is cached and each caller gets its own copy.
+
+    Args:
+        text: JSON text
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    return _copy_json(_parse_json_cached(text))
+
+
+@lru_cache(maxsize=65536)
+def _uri(iri: str) -> URIRef:
+    """Get a shared URIRef for an IRI.
+
+    Signifiers are regenerated with the same IRIs (notably affordance
+    URIs), so the validated URIRef instances are reused.
+
+    Args:
+        iri: IRI string
+
+    Returns:
+        URIRef for the IRI
+    """
+    return URIRef(iri)
+
+
+def _to_ntriples(graph: Graph) -> str:
+    """Serialize a graph as N-Triples, which is also valid Turtle.
+
+    Writing each triple directly is much cheaper than rdflib's Turtle
+    serializer, which groups subjects and resolves prefixed names.
+
+    Args:
+        graph: RDF Graph
+
+    Returns:
+        One line per triple, sorted so a subject's triples are adjacent
+    """
+    return "".join(sorted(f"{s.n3()} {p.n3()} {o.n3()} .\n" for s, p, o in graph))
+
+
+def _build_spo(graph: Graph) -> Dict[Node, List[Tuple[Node, Node]]]:
+    """Index a graph's triples by subject in a single sweep.
+
+    Args:
+        graph: RDF Graph
+
+    Returns:
+        Mapping of subject to its (predicate, object) pairs
+    """
+    spo: Dict[Node, List[Tuple[Node, Node]]] = {}
+    for subject, predicate, obj in graph:
+        pairs = spo.get(subject)
+        if pairs is None:
+            spo[subject] = [(predicate, obj)]
+        else:
+            pairs.append((predicate, obj))
+    return spo
+
+
+def _objects(
+    spo: Dict[Node, List[Tuple[Node, Node]]], subject: Node, predicate: Node
+) -> List[Node]:
+    """Get the objects of a subject and predicate from a subject index.
+
+    Args:
+        spo: Index built by :func:`_build_spo`
+        subject: Subject node
+        predicate: Predicate node
+
+    Returns:
+        Object nodes (empty if there are none)
+    """
+    return [o for p, o in spo.get(subject, ()) if p == predicate]
+
+
+def _first(
+    spo: Dict[Node, List[Tuple[Node, Node]]], subject: Node, predicate: Node
+) -> Optional[Node]:
+    """Get one object for a subject and predicate, like ``Graph.value``.
+
+    Args:
+        spo: Index built by :func:`_build_spo`
+        subject: Subject node
+        predicate: Predicate node
+
+    Returns:
+        An object node or None if there is none
+    """
+    for p, o in spo.get(subject, ()):
+        if p == predicate:
+            return o
+    return None
+
+
 class RepresentationService:
     """Service for normalizing and converting signifier representations.
 
@@ -48,36 +226,13 @@ class RepresentationService:
         Returns:
             Preprocessed RDF data
         """
-        prefixes = [
-            "@prefix cashmere: <https://aimas.cs.pub.ro/ont/cashmere#> .",
-            "@prefix sh: <http://www.w3.org/ns/shacl#> .",
-            "@prefix hmas: <https://aimas.cs.pub.ro/ont/cashmere#> .",
-            "@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .",
-            "@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .",
-            "",
-        ]
-
-        lines = []
-        for line in rdf_data.split("\n"):
-            if "//" in line:
-                comment_pos = line.find("//")
-                line = line[:comment_pos].rstrip()
-
-            if line.strip():
-                lines.append(line)
-
-        processed = "\n".join(lines)
-
-        pattern = r'cashmere:hasStructuredDescription\s+"(.*?)"(?:\^\^xsd:string)?'
-
-        def replace_multiline_string(match):
-            content = match.group(1).strip()
-            content_fixed = re.sub(r'<(http[^>]+)>', r"'\1'", content)
-            return f'cashmere:hasStructuredDescription """{content_fixed}"""^^xsd:string'
-
-        processed = re.sub(pattern, replace_multiline_string, processed, flags=re.DOTALL)
-
-        return "\n".join(prefixes) + "\n" + processed
+        lines = (
+            line.partition("//")[0].rstrip() if "//" in line else line
+            for line in rdf_data.split("\n")
+        )
+        processed = "\n".join(line for line in lines if line and not line.isspace())
+        processed = _STRUCTURED_DESCRIPTION_RE.sub(_quote_description, processed)
+        return _PREFIX_BLOCK + processed
 
     @staticmethod
     def parse_rdf_signifier(rdf_data: str, format: str = "turtle") -> Signifier:
@@ -97,47 +252,53 @@ class RepresentationService:
             if "@prefix" not in rdf_data:
                 rdf_data = RepresentationService._preprocess_rdf(rdf_data)
 
-            graph = Graph()
+            # Parse-only graphs skip binding rdflib's ~30 default prefixes,
+            # which otherwise costs about as much as parsing a signifier.
+            graph = Graph(bind_namespaces="none")
             graph.parse(data=rdf_data, format=format)
+            spo = _build_spo(graph)
 
-            signifier_nodes = list(graph.subjects(RDF.type, CASHMERE.Signifier))
+            signifier_type = (RDF.type, CASHMERE.Signifier)
+            signifier_nodes = [
+                subject for subject, pairs in spo.items() if signifier_type in pairs
+            ]
             if not signifier_nodes:
                 raise ValueError("No Signifier found in RDF data")
 
             signifier_node = signifier_nodes[0]
             signifier_id = str(signifier_node).split("#")[-1]
 
-            affordance_uri = graph.value(signifier_node, CASHMERE.signifies)
+            affordance_uri = _first(spo, signifier_node, CASHMERE.signifies)
             if not affordance_uri:
                 raise ValueError("Missing cashmere:signifies property")
 
-            intent_node = graph.value(
-                signifier_node, CASHMERE.hasIntentionDescription
+            intent_node = _first(
+                spo, signifier_node, CASHMERE.hasIntentionDescription
             )
             if not intent_node:
                 raise ValueError("Missing cashmere:hasIntentionDescription")
 
-            intent_nl = graph.value(intent_node, CASHMERE.hasStructuredDescription)
+            intent_nl = _first(spo, intent_node, CASHMERE.hasStructuredDescription)
             if not intent_nl:
                 raise ValueError("Missing intent description")
 
-            intent_dict = json.loads(str(intent_nl))
+            intent_dict = _load_json(str(intent_nl))
             intent = IntentionDescription(
                 nl_text=intent_dict.get("intent", ""),
                 structured=intent_dict,
             )
 
-            context_node = graph.value(signifier_node, CASHMERE.recommendsContext)
+            context_node = _first(spo, signifier_node, CASHMERE.recommendsContext)
             context = IntentContext()
 
             if context_node:
-                context_nl = graph.value(
-                    context_node, CASHMERE.hasStructuredDescription
+                context_nl = _first(
+                    spo, context_node, CASHMERE.hasStructuredDescription
                 )
                 if context_nl:
                     context.nl_description = str(context_nl)
                     try:
-                        context_dict = json.loads(str(context_nl))
+                        context_dict = _load_json(str(context_nl))
                         conditions = context_dict.get("conditions", [])
                         context.structured_conditions = [
                             RepresentationService._parse_structured_condition(c)
@@ -146,13 +307,13 @@ class RepresentationService:
                     except json.JSONDecodeError as e:
                         logger.warning(f"Failed to parse context description: {e}")
 
-                shacl_shapes = list(
-                    graph.objects(context_node, CASHMERE.hasShaclCondition)
-                )
+                shacl_shapes = _objects(spo, context_node, CASHMERE.hasShaclCondition)
                 if shacl_shapes:
-                    context.shacl_shapes = RepresentationService._extract_shacl_shapes(
-                        graph, shacl_shapes
+                    shapes_graph = RepresentationService._extract_shacl_shapes(
+                        spo, shacl_shapes
                     )
+                    context.shacl_shapes = _to_ntriples(shapes_graph)
+                    context.attach_shapes_graph(shapes_graph)
 
             provenance = Provenance(
                 created_by="system",
@@ -203,30 +364,35 @@ class RepresentationService:
         )
 
     @staticmethod
-    def _extract_shacl_shapes(graph: Graph, shape_nodes: list) -> str:
-        """Extract SHACL shapes as Turtle string.
+    def _extract_shacl_shapes(
+        spo: Dict[Node, List[Tuple[Node, Node]]], shape_nodes: List[Node]
+    ) -> Graph:
+        """Extract SHACL shapes into their own graph.
 
         Args:
-            graph: RDF Graph
+            spo: Subject index of the signifier graph (see :func:`_build_spo`)
             shape_nodes: List of SHACL NodeShape nodes
 
         Returns:
-            SHACL shapes serialized as Turtle
+            Graph holding the shapes and their property shapes
         """
-        shapes_graph = Graph()
-        shapes_graph.bind("sh", SH)
-        shapes_graph.bind("xsd", XSD)
+        shapes_graph = Graph(bind_namespaces="none")
+        sh_property = SH.property
+        quads = []
 
         for shape_node in shape_nodes:
-            for s, p, o in graph.triples((shape_node, None, None)):
-                shapes_graph.add((s, p, o))
-
-            property_shapes = graph.objects(shape_node, SH.property)
-            for prop_shape in property_shapes:
-                for s, p, o in graph.triples((prop_shape, None, None)):
-                    shapes_graph.add((s, p, o))
+            pairs = spo.get(shape_node, ())
+            quads.extend((shape_node, p, o, shapes_graph) for p, o in pairs)
+
+            for p, prop_shape in pairs:
+                if p == sh_property:
+                    quads.extend(
+                        (prop_shape, pp, oo, shapes_graph)
+                        for pp, oo in spo.get(prop_shape, ())
+                    )
 
-        return shapes_graph.serialize(format="turtle")
+        shapes_graph.addN(quads)
+        return shapes_graph
 
     @staticmethod
     def generate_rdf(signifier: Signifier, base_uri: str = "") -> str:
@@ -247,37 +413,29 @@ class RepresentationService:
         if not base_uri:
             base_uri = f"http://example.org/signifiers"
 
-        signifier_uri = URIRef(f"{base_uri}#{signifier.signifier_id}")
+        signifier_iri = f"{base_uri}#{signifier.signifier_id}"
+        signifier_uri = _uri(signifier_iri)
+        intent_node = _uri(f"{signifier_iri}-intent")
 
-        graph.add((signifier_uri, RDF.type, CASHMERE.Signifier))
-
-        graph.add(
-            (signifier_uri, CASHMERE.signifies, URIRef(signifier.affordance_uri))
-        )
-
-        intent_node = URIRef(f"{base_uri}#{signifier.signifier_id}-intent")
-        graph.add((signifier_uri, CASHMERE.hasIntentionDescription, intent_node))
-        graph.add((intent_node, RDF.type, CASHMERE.IntentionDescription))
-
-        intent_json = json.dumps(
-            signifier.intent.structured
-            or {"intent": signifier.intent.nl_text}
-        )
-        graph.add(
+        triples = [
+            (signifier_uri, RDF.type, CASHMERE.Signifier),
+            (signifier_uri, CASHMERE.signifies, _uri(signifier.affordance_uri)),
+            (signifier_uri, CASHMERE.hasIntentionDescription, intent_node),
+            (intent_node, RDF.type, CASHMERE.IntentionDescription),
             (
                 intent_node,
                 CASHMERE.hasStructuredDescription,
-                Literal(intent_json, datatype=XSD.string),
-            )
-        )
+                Literal(signifier.intent.structured_json(), datatype=XSD.string),
+            ),
+        ]
 
         if signifier.context:
-            context_node = URIRef(f"{base_uri}#{signifier.signifier_id}-context")
-            graph.add((signifier_uri, CASHMERE.recommendsContext, context_node))
-            graph.add((context_node, RDF.type, CASHMERE.IntentContext))
+            context_node = _uri(f"{signifier_iri}-context")
+            triples.append((signifier_uri, CASHMERE.recommendsContext, context_node))
+            triples.append((context_node, RDF.type, CASHMERE.IntentContext))
 
             if signifier.context.nl_description:
-                graph.add(
+                triples.append(
                     (
                         context_node,
                         CASHMERE.hasStructuredDescription,
@@ -288,21 +446,29 @@ class RepresentationService:
                 )
 
             if signifier.context.shacl_shapes:
-                shapes_graph = Graph()
-                shapes_graph.parse(
-                    data=signifier.context.shacl_shapes, format="turtle"
+                shapes_graph = signifier.context.shapes_graph
+                if shapes_graph is None:
+                    shapes_graph = Graph(bind_namespaces="none")
+                    shapes_graph.parse(
+                        data=signifier.context.shacl_shapes, format="turtle"
+                    )
+                triples.extend(shapes_graph)
+                triples.extend(
+                    (context_node, CASHMERE.hasShaclCondition, shape)
+                    for shape in shapes_graph.subjects(RDF.type, SH.NodeShape)
                 )
-                for s, p, o in shapes_graph:
-                    graph.add((s, p, o))
-                    if (s, RDF.type, SH.NodeShape) in shapes_graph:
-                        graph.add((context_node, CASHMERE.hasShaclCondition, s))
+
+        graph.addN((s, p, o, graph) for s, p, o in triples)
 
         logger.debug(f"Generated RDF for signifier {signifier.signifier_id}")
         return graph.serialize(format="turtle")
 
     @staticmethod
     def normalize_signifier(signifier: Signifier) -> Signifier:
-        """Normalize signifier data (placeholder for future enhancements).
+        """Normalize signifier data and populate system-generated indexes.
+
+        Stores the precomputed matcher text under ``indexes["match_text"]``
+        so intent matchers can skip per-signifier text extraction.
 
         Args:
             signifier: Signifier instance
@@ -310,5 +476,6 @@ class RepresentationService:
         Returns:
             Normalized signifier
         """
+        signifier.indexes["match_text"] = signifier.intent.match_text()
         logger.debug(f"Normalized signifier {signifier.signifier_id}")
         return signifier
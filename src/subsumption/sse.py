@@ -5,15 +5,57 @@ This module implements the SSE which evaluates structured conditions
 """
 
 import logging
+import operator as _op
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from src.models.signifier import StructuredCondition, ValueCondition
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Exact types (not bool) that compare without coercion.
+_NUMERIC_TYPES = frozenset((int, float))
+
+_OPERATORS = {
+    "greaterThan": _op.gt,
+    "lessThan": _op.lt,
+    "greaterEqual": _op.ge,
+    "lessEqual": _op.le,
+    "equals": _op.eq,
+    "notEquals": _op.ne,
+}
+
+# Vectorized counterparts of _OPERATORS for evaluate_batch.
+_UFUNCS = {
+    "greaterThan": np.greater,
+    "lessThan": np.less,
+    "greaterEqual": np.greater_equal,
+    "lessEqual": np.less_equal,
+    "equals": np.equal,
+    "notEquals": np.not_equal,
+}
+
+# Batches smaller than this are evaluated context by context.
+_BATCH_MIN = 16
+
+# Integers beyond this magnitude are not exactly representable as float64.
+_EXACT_FLOAT_INT = 2**53
+
+_MISSING = object()
+
+_OPERATOR_TEXT = {
+    "greaterThan": "greater than",
+    "lessThan": "less than",
+    "greaterEqual": "greater than or equal to",
+    "lessEqual": "less than or equal to",
+    "equals": "equal to",
+    "notEquals": "not equal to",
+}
+
+
+@dataclass(slots=True)
 class SSEViolation:
     """SSE violation details.
 
@@ -34,7 +76,7 @@ class SSEViolation:
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SSEResult:
     """Result of SSE evaluation.
 
@@ -76,6 +118,21 @@ class SSEResult:
         }
 
 
+def _is_exact_number(value: Any) -> bool:
+    """Check whether a value compares identically as a float64.
+
+    Args:
+        value: Value to check
+
+    Returns:
+        True for floats and for ints (not bools) within float64 precision
+    """
+    value_type = type(value)
+    if value_type is float:
+        return True
+    return value_type is int and -_EXACT_FLOAT_INT <= value <= _EXACT_FLOAT_INT
+
+
 class SSE:
     """Structured Subsumption Engine for fast numeric pre-filtering.
 
@@ -110,12 +167,16 @@ class SSE:
         self,
         structured_conditions: List[StructuredCondition],
         context_features: Dict[str, Dict[str, Any]],
+        short_circuit: bool = False,
     ) -> SSEResult:
         """Evaluate structured conditions against context features.
 
         Args:
             structured_conditions: List of conditions from signifier
             context_features: Context as {artifact_uri: {property_uri: value}}
+            short_circuit: Stop at the first violation. The result then
+                holds only that violation, and conditions_checked and
+                missing_properties cover only what was evaluated so far.
 
         Returns:
             SSEResult with pass/fail and violations
@@ -127,11 +188,17 @@ class SSE:
         missing_properties = []
         conditions_checked = 0
 
+        # Conditions on the same artifact are usually adjacent; reuse its
+        # context entry instead of looking it up again.
+        artifact = None
+        artifact_data: Dict[str, Any] = {}
+
         for condition in structured_conditions:
-            artifact = condition.artifact
             property_affordance = condition.property_affordance
+            if condition.artifact is not artifact:
+                artifact = condition.artifact
+                artifact_data = context_features.get(artifact, {})
 
-            artifact_data = context_features.get(artifact, {})
             if property_affordance not in artifact_data:
                 missing_properties.append((artifact, property_affordance))
 
@@ -147,18 +214,24 @@ class SSE:
                             f"on artifact {artifact}",
                         )
                     )
+                    if short_circuit:
+                        break
                 elif self.missing_value_policy == "ignore":
                     continue
                 continue
 
             actual_value = artifact_data[property_affordance]
+            actual_is_number = type(actual_value) in _NUMERIC_TYPES
 
             for value_condition in condition.value_conditions:
                 conditions_checked += 1
 
-                passed = self._evaluate_condition(
-                    value_condition, actual_value
-                )
+                if actual_is_number and type(value_condition.value) in _NUMERIC_TYPES:
+                    passed = self._compare(
+                        value_condition.operator, actual_value, value_condition.value
+                    )
+                else:
+                    passed = self._evaluate_condition(value_condition, actual_value)
 
                 if not passed:
                     violations.append(
@@ -173,6 +246,11 @@ class SSE:
                             ),
                         )
                     )
+                    if short_circuit:
+                        break
+
+            if short_circuit and violations:
+                break
 
         sse_pass = len(violations) == 0
 
@@ -188,6 +266,164 @@ class SSE:
             missing_properties=missing_properties,
         )
 
+    def evaluate_batch(
+        self,
+        structured_conditions: List[StructuredCondition],
+        contexts: List[Dict[str, Dict[str, Any]]],
+    ) -> List[SSEResult]:
+        """Evaluate the same structured conditions against many contexts.
+
+        Plain numeric comparisons are evaluated for all contexts at once
+        with NumPy; other values use the scalar comparison. Results are
+        identical to calling :meth:`evaluate` per context.
+
+        Args:
+            structured_conditions: List of conditions from signifier
+            contexts: Contexts as {artifact_uri: {property_uri: value}}
+
+        Returns:
+            One SSEResult per context, in order
+        """
+        if len(contexts) < _BATCH_MIN or not structured_conditions:
+            return [
+                self.evaluate(structured_conditions, context) for context in contexts
+            ]
+
+        n = len(contexts)
+        violations: List[List[SSEViolation]] = [[] for _ in range(n)]
+        missing_properties: List[List[tuple[str, str]]] = [[] for _ in range(n)]
+        conditions_checked = [0] * n
+
+        for condition in structured_conditions:
+            artifact = condition.artifact
+            property_affordance = condition.property_affordance
+
+            present = []
+            actual_values = []
+            for i, context in enumerate(contexts):
+                actual = context.get(artifact, {}).get(property_affordance, _MISSING)
+                if actual is _MISSING:
+                    missing_properties[i].append((artifact, property_affordance))
+                    if self.missing_value_policy == "fail":
+                        violations[i].append(
+                            SSEViolation(
+                                artifact=artifact,
+                                property_affordance=property_affordance,
+                                operator="missing",
+                                expected_value="<present>",
+                                actual_value=None,
+                                message=f"Missing property {property_affordance} "
+                                f"on artifact {artifact}",
+                            )
+                        )
+                    continue
+                present.append(i)
+                actual_values.append(actual)
+
+            if not present:
+                continue
+
+            for i in present:
+                conditions_checked[i] += len(condition.value_conditions)
+
+            numeric = np.fromiter(
+                (_is_exact_number(v) for v in actual_values), dtype=bool
+            )
+            numeric_values = np.array(
+                [v for v, ok in zip(actual_values, numeric) if ok], dtype=np.float64
+            )
+
+            for value_condition in condition.value_conditions:
+                expected = value_condition.value
+                ufunc = _UFUNCS.get(value_condition.operator)
+                if _is_exact_number(expected) and ufunc is not None:
+                    passed = np.ones(len(present), dtype=bool)
+                    passed[numeric] = ufunc(numeric_values, expected)
+                    scalar = np.flatnonzero(~numeric)
+                else:
+                    passed = np.ones(len(present), dtype=bool)
+                    scalar = range(len(present))
+
+                for j in scalar:
+                    passed[j] = bool(
+                        self._evaluate_condition(value_condition, actual_values[j])
+                    )
+
+                for j in np.flatnonzero(~passed):
+                    actual = actual_values[j]
+                    violations[present[j]].append(
+                        SSEViolation(
+                            artifact=artifact,
+                            property_affordance=property_affordance,
+                            operator=value_condition.operator,
+                            expected_value=expected,
+                            actual_value=actual,
+                            message=self._format_violation_message(
+                                value_condition, actual
+                            ),
+                        )
+                    )
+
+        logger.debug(
+            f"SSE batch evaluation: {n} contexts, "
+            f"{sum(1 for v in violations if not v)} passed"
+        )
+
+        return [
+            SSEResult(
+                sse_pass=not violations[i],
+                violations=violations[i],
+                conditions_checked=conditions_checked[i],
+                missing_properties=missing_properties[i],
+            )
+            for i in range(n)
+        ]
+
+    def missing_result(
+        self, structured_conditions: List[StructuredCondition]
+    ) -> SSEResult:
+        """Build the result for conditions whose properties are all absent.
+
+        Equivalent to :meth:`evaluate` when none of the conditions'
+        (artifact, property) pairs occur in the context, without looking
+        the context up.
+
+        Args:
+            structured_conditions: List of conditions from signifier
+
+        Returns:
+            SSEResult reporting every condition as missing
+        """
+        if not structured_conditions:
+            return SSEResult(sse_pass=True, conditions_checked=0)
+
+        missing_properties = [
+            (condition.artifact, condition.property_affordance)
+            for condition in structured_conditions
+        ]
+
+        violations = []
+        if self.missing_value_policy == "fail":
+            violations = [
+                SSEViolation(
+                    artifact=artifact,
+                    property_affordance=property_affordance,
+                    operator="missing",
+                    expected_value="<present>",
+                    actual_value=None,
+                    message=f"Missing property {property_affordance} "
+                    f"on artifact {artifact}",
+                )
+                for artifact, property_affordance in missing_properties
+            ]
+
+        return SSEResult(
+            sse_pass=not violations,
+            violations=violations,
+            conditions_checked=0,
+            missing_properties=missing_properties,
+        )
+
     def _evaluate_condition(
         self, condition: ValueCondition, actual_value: Any
     ) -> bool:
@@ -219,22 +455,27 @@ class SSE:
                     f"to {type(expected_value)}"
                 )
 
+        return self._compare(operator, actual_value, expected_value)
+
+    @staticmethod
+    def _compare(operator: str, actual_value: Any, expected_value: Any) -> bool:
+        """Apply a comparison operator to already coerced values.
+
+        Args:
+            operator: Operator name
+            actual_value: The actual value from context
+            expected_value: The expected value from the condition
+
+        Returns:
+            True if the comparison holds, False otherwise
+        """
+        compare = _OPERATORS.get(operator)
+        if compare is None:
+            logger.warning(f"Unknown operator: {operator}")
+            return False
+
         try:
-            if operator == "greaterThan":
-                return actual_value > expected_value
-            elif operator == "lessThan":
-                return actual_value < expected_value
-            elif operator == "greaterEqual":
-                return actual_value >= expected_value
-            elif operator == "lessEqual":
-                return actual_value <= expected_value
-            elif operator == "equals":
-                return actual_value == expected_value
-            elif operator == "notEquals":
-                return actual_value != expected_value
-            else:
-                logger.warning(f"Unknown operator: {operator}")
-                return False
+            return compare(actual_value, expected_value)
         except TypeError as e:
             logger.warning(
                 f"Comparison failed: {actual_value} {operator} "
@@ -254,14 +495,7 @@ class SSE:
         Returns:
             Formatted message
         """
-        operator_text = {
-            "greaterThan": "greater than",
-            "lessThan": "less than",
-            "greaterEqual": "greater than or equal to",
-            "lessEqual": "less than or equal to",
-            "equals": "equal to",
-            "notEquals": "not equal to",
-        }.get(condition.operator, condition.operator)
+        operator_text = _OPERATOR_TEXT.get(condition.operator, condition.operator)
 
         return (
             f"Expected value to be {operator_text} {condition.value}, "
@@ -8,18 +8,21 @@ from src.validation.authoring_validator import (
     AuthoringValidationError,
     AuthoringValidator,
 )
-from src.validation.context_builder import ContextGraphBuilder
+from src.validation.context_builder import ContextGraphBuilder, LazyFeatures
 from src.validation.shacl_validator import (
     SHACLValidator,
     ValidationResult,
+    ViolationBatch,
     ViolationDetail,
 )
 
 __all__ = [
     "SHACLValidator",
     "ValidationResult",
+    "ViolationBatch",
     "ViolationDetail",
     "ContextGraphBuilder",
+    "LazyFeatures",
     "AuthoringValidator",
     "AuthoringValidationError",
 ]
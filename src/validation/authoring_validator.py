@@ -5,7 +5,8 @@ they have required properties and valid SHACL shapes.
 """
 
 import logging
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from rdflib import Graph, SH, URIRef
 
@@ -13,6 +14,111 @@ from src.models.signifier import Signifier
 
 logger = logging.getLogger(__name__)
 
+_NODE_SHAPE = SH.NodeShape
+_PROPERTY = SH.property
+_PATH = SH.path
+_DATATYPE = SH.datatype
+_TARGET_PREDICATES = frozenset((SH.targetNode, SH.targetClass, SH.targetSubjectsOf))
+_XSD_NAMESPACE = "http://www.w3.org/2001/XMLSchema#"
+
+
+@lru_cache(maxsize=1024)
+def _validate_shapes(shacl_shapes: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Parse SHACL shapes and validate each NodeShape, memoized by text.
+
+    Warnings are returned rather than logged so callers can log them on
+    every check, not only when the result is first computed.
+
+    Args:
+        shacl_shapes: SHACL shapes as Turtle string
+
+    Returns:
+        Tuple of (error messages, warning messages)
+    """
+    try:
+        # Skip binding rdflib's default prefixes; the graph is only read.
+        shapes_graph = Graph(bind_namespaces="none")
+        shapes_graph.parse(data=shacl_shapes, format="turtle")
+    except Exception as e:
+        return (f"Failed to parse SHACL shapes: {e}",), ()
+    errors, warnings = _check_shapes_graph(shapes_graph)
+    return tuple(errors), tuple(warnings)
+
+
+def _check_shapes_graph(shapes_graph: Graph) -> Tuple[List[str], List[str]]:
+    """Validate each NodeShape of a parsed shapes graph.
+
+    Args:
+        shapes_graph: The shapes graph
+
+    Returns:
+        Tuple of (error messages, warning messages)
+    """
+    errors: List[str] = []
+    warnings: List[str] = []
+
+    try:
+        node_shapes = list(shapes_graph.subjects(predicate=None, object=_NODE_SHAPE))
+
+        if not node_shapes:
+            errors.append("No sh:NodeShape found in SHACL shapes")
+            return errors, warnings
+
+        for shape in node_shapes:
+            errors.extend(_validate_node_shape(shapes_graph, shape, warnings))
+
+    except Exception as e:
+        errors.append(f"Failed to parse SHACL shapes: {e}")
+
+    return errors, warnings
+
+
+def _validate_node_shape(
+    graph: Graph, shape_node: URIRef, warnings: List[str]
+) -> List[str]:
+    """Validate a single NodeShape.
+
+    Args:
+        graph: The shapes graph
+        shape_node: The NodeShape to validate
+        warnings: List that non-fatal findings are appended to
+
+    Returns:
+        List of error messages
+    """
+    errors = []
+
+    shape_objects = list(graph.predicate_objects(shape_node))
+
+    if _TARGET_PREDICATES.isdisjoint(p for p, _ in shape_objects):
+        errors.append(
+            f"NodeShape {shape_node} has no target "
+            "(sh:targetNode, sh:targetClass, etc.)"
+        )
+
+    property_shapes = [o for p, o in shape_objects if p == _PROPERTY]
+
+    for prop_shape in property_shapes:
+        prop_values = dict(graph.predicate_objects(prop_shape))
+
+        path = prop_values.get(_PATH)
+        if not path:
+            errors.append(
+                f"Property shape {prop_shape} missing sh:path"
+            )
+            continue
+
+        if not isinstance(path, URIRef):
+            errors.append(
+                f"sh:path must be a valid IRI, got: {path}"
+            )
+
+        datatype = prop_values.get(_DATATYPE)
+        if datatype and not str(datatype).startswith(_XSD_NAMESPACE):
+            warnings.append(f"Unusual datatype for {path}: {datatype}")
+
+    return errors
+
 
 class AuthoringValidationError(Exception):
     """Exception raised when signifier authoring validation fails."""
@@ -58,7 +164,11 @@ class AuthoringValidator:
         errors.extend(self._check_required_fields(signifier))
 
         if enable_shacl_check and signifier.context.shacl_shapes:
-            errors.extend(self._check_shacl_shapes(signifier.context.shacl_shapes))
+            errors.extend(
+                self._check_shacl_shapes(
+                    signifier.context.shacl_shapes, signifier.context.shapes_graph
+                )
+            )
 
         if self.strict_mode:
             errors.extend(self._check_optional_fields(signifier))
@@ -119,83 +229,30 @@ class AuthoringValidator:
 
         return warnings
 
-    def _check_shacl_shapes(self, shacl_shapes: str) -> List[str]:
+    def _check_shacl_shapes(
+        self, shacl_shapes: str, shapes_graph: Optional[Graph] = None
+    ) -> List[str]:
         """Validate SHACL shapes are well-formed.
 
-        Args:
-            shacl_shapes: SHACL shapes as Turtle string
-
-        Returns:
-            List of error messages
-        """
-        errors = []
-
-        try:
-            shapes_graph = Graph()
-            shapes_graph.parse(data=shacl_shapes, format="turtle")
-
-            node_shapes = list(
-                shapes_graph.subjects(predicate=None, object=SH.NodeShape)
-            )
-
-            if not node_shapes:
-                errors.append("No sh:NodeShape found in SHACL shapes")
-                return errors
-
-            for shape in node_shapes:
-                errors.extend(self._validate_node_shape(shapes_graph, shape))
-
-        except Exception as e:
-            errors.append(f"Failed to parse SHACL shapes: {e}")
-
-        return errors
-
-    def _validate_node_shape(
-        self, graph: Graph, shape_node: URIRef
-    ) -> List[str]:
-        """Validate a single NodeShape.
+        An already parsed graph is checked directly. Otherwise results are
+        cached by shapes text across validators, so validating the same
+        shapes again does not re-parse them. Warnings are logged on every
+        check, cached or not.
 
         Args:
-            graph: The shapes graph
-            shape_node: The NodeShape to validate
+            shacl_shapes: SHACL shapes as Turtle string
+            shapes_graph: Already parsed shapes, used instead of parsing
 
         Returns:
             List of error messages
         """
-        errors = []
-
-        has_target = False
-        for target_pred in [SH.targetNode, SH.targetClass, SH.targetSubjectsOf]:
-            if (shape_node, target_pred, None) in graph:
-                has_target = True
-                break
-
-        if not has_target:
-            errors.append(
-                f"NodeShape {shape_node} has no target (sh:targetNode, sh:targetClass, etc.)"
-            )
-
-        property_shapes = list(graph.objects(shape_node, SH.property))
-
-        for prop_shape in property_shapes:
-            path = graph.value(prop_shape, SH.path)
-            if not path:
-                errors.append(
-                    f"Property shape {prop_shape} missing sh:path"
-                )
-                continue
-
-            if not isinstance(path, URIRef):
-                errors.append(
-                    f"sh:path must be a valid IRI, got: {path}"
-                )
-
-            datatype = graph.value(prop_shape, SH.datatype)
-            if datatype and not str(datatype).startswith("http://www.w3.org/2001/XMLSchema#"):
-                logger.warning(
-                    f"Unusual datatype for {path}: {datatype}"
-                )
-
+        if shapes_graph is not None:
+            errors, warnings = _check_shapes_graph(shapes_graph)
+        else:
+            cached_errors, warnings = _validate_shapes(shacl_shapes)
+            errors = list(cached_errors)
+        for warning in warnings:
+            logger.warning(warning)
         return errors
 
     def validate_and_raise(
@@ -5,16 +5,156 @@ suitable for SHACL validation.
 """
 
 import logging
-from typing import Any, Dict, List, Tuple
+import sys
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from rdflib import Graph, Literal, Namespace, RDF, URIRef
 from rdflib.namespace import XSD
 
+try:
+    import oxrdflib  # registers the "Oxigraph" rdflib store plugin
+except ImportError:
+    oxrdflib = None
+
 logger = logging.getLogger(__name__)
 
+_BACKENDS = ("oxigraph", "memory")
+
 RDF_NS = Namespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#")
 XSD_NS = Namespace("http://www.w3.org/2001/XMLSchema#")
 
+# rdflib terms are immutable, so identical URIs and values recurring across
+# context snapshots can share one term object.
+_uri = lru_cache(maxsize=65536)(URIRef)
+
+
+@lru_cache(maxsize=65536)
+def _integer_literal(value: int) -> Literal:
+    """Build an xsd:integer literal, memoized by value."""
+    return Literal(value, datatype=XSD.integer)
+
+
+@lru_cache(maxsize=65536)
+def _string_literal(value: str) -> Literal:
+    """Build an xsd:string literal, memoized by value."""
+    return Literal(value, datatype=XSD.string)
+
+
+@lru_cache(maxsize=65536)
+def _cached_double_literal(value: float) -> Literal:
+    """Build an xsd:double literal, memoized by value."""
+    return Literal(value, datatype=XSD.double)
+
+
+def _double_literal(value: float) -> Literal:
+    """Build an xsd:double literal, memoizing all but zeros and NaN.
+
+    -0.0 equals 0.0 as a cache key but has its own lexical form, and NaN
+    never matches itself.
+    """
+    if value == 0.0 or value != value:
+        return Literal(value, datatype=XSD.double)
+    return _cached_double_literal(value)
+
+
+_BOOLEAN_LITERALS = {
+    True: Literal(True, datatype=XSD.boolean),
+    False: Literal(False, datatype=XSD.boolean),
+}
+
+# Exact-type dispatch; subclasses fall back to the isinstance chain.
+_LITERAL_FACTORIES: Dict[type, Callable[[Any], Literal]] = {
+    bool: _BOOLEAN_LITERALS.__getitem__,
+    int: _integer_literal,
+    float: _double_literal,
+    str: _string_literal,
+}
+
+
+def resolve_graph_store(backend: str) -> str:
+    """Map a backend name to an rdflib store plugin name.
+
+    Args:
+        backend: "oxigraph" or "memory"
+
+    Returns:
+        rdflib store plugin name
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown graph backend: {backend}")
+    if backend == "oxigraph" and oxrdflib is not None:
+        return "Oxigraph"
+    return "default"
+
+
+class LazyFeatures(Mapping):
+    """Read-only (artifact, property) -> value view of a context graph.
+
+    Single lookups query the graph directly and are memoized; iterating or
+    taking the length extracts every feature once. The view reflects the
+    graph as it is when first read, so callers should not mutate it
+    meanwhile.
+
+    Args:
+        graph: Context graph to read features from
+        extract: Function building the full features dict from the graph
+    """
+
+    def __init__(
+        self,
+        graph: Graph,
+        extract: Callable[[Graph], Dict[Tuple[str, str], Any]],
+    ):
+        self._graph = graph
+        self._extract = extract
+        self._features: Optional[Dict[Tuple[str, str], Any]] = None
+        self._lookups: Dict[Tuple[str, str], Any] = {}
+
+    def _materialize(self) -> Dict[Tuple[str, str], Any]:
+        """Extract all features on first use.
+
+        Returns:
+            Full features dictionary
+        """
+        if self._features is None:
+            self._features = self._extract(self._graph)
+        return self._features
+
+    def __getitem__(self, key: Tuple[str, str]) -> Any:
+        if self._features is not None:
+            return self._features[key]
+        if key in self._lookups:
+            return self._lookups[key]
+
+        try:
+            artifact_uri, property_uri = key
+        except (TypeError, ValueError):
+            raise KeyError(key)
+        if not isinstance(artifact_uri, str) or not isinstance(property_uri, str):
+            raise KeyError(key)
+
+        # Later triples overwrite earlier ones in the eager extraction.
+        obj = None
+        for obj in self._graph.objects(URIRef(artifact_uri), URIRef(property_uri)):
+            pass
+        if obj is None:
+            raise KeyError(key)
+
+        value = obj.toPython() if isinstance(obj, Literal) else str(obj)
+        self._lookups[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
 
 class ContextGraphBuilder:
     """Builder for converting context snapshots to RDF graphs.
@@ -23,9 +163,19 @@ class ContextGraphBuilder:
     RDF graphs with proper typing and structure for SHACL validation.
     """
 
-    def __init__(self):
-        """Initialize the Context Graph Builder."""
-        logger.info("Context Graph Builder initialized")
+    def __init__(self, backend: str = "memory"):
+        """Initialize the Context Graph Builder.
+
+        Args:
+            backend: Triple store for built graphs, "memory" (default) or
+                "oxigraph"; "oxigraph" falls back to rdflib's in-memory
+                store when oxrdflib is not installed
+
+        Raises:
+            ValueError: If the backend is unknown
+        """
+        self._store = resolve_graph_store(backend)
+        logger.info(f"Context Graph Builder initialized (store={self._store})")
 
     def build_from_kv(
         self, context_features: Dict[str, Dict[str, Any]]
@@ -53,18 +203,16 @@ class ContextGraphBuilder:
         if not isinstance(context_features, dict):
             raise ValueError("context_features must be a dictionary")
 
-        graph = Graph()
-        graph.bind("rdf", RDF)
-        graph.bind("xsd", XSD)
-
+        graph = self._new_graph()
         extracted_features: Dict[Tuple[str, str], Any] = {}
+        quads: List[Tuple[URIRef, URIRef, Literal, Graph]] = []
 
         for artifact_uri, properties in context_features.items():
             if not isinstance(artifact_uri, str):
                 logger.warning(f"Skipping non-string artifact URI: {artifact_uri}")
                 continue
 
-            artifact_node = URIRef(artifact_uri)
+            artifact_node = _uri(artifact_uri)
 
             if not isinstance(properties, dict):
                 logger.warning(
@@ -79,18 +227,14 @@ class ContextGraphBuilder:
                     )
                     continue
 
-                property_node = URIRef(property_uri)
+                property_node = _uri(property_uri)
 
                 literal_value = self._convert_to_literal(value)
-                graph.add((artifact_node, property_node, literal_value))
+                quads.append((artifact_node, property_node, literal_value, graph))
 
                 extracted_features[(artifact_uri, property_uri)] = value
 
-        logger.info(
-            f"Built context graph with {len(graph)} triples from "
-            f"{len(extracted_features)} features"
-        )
-        return graph, extracted_features
+        return self._finish_graph(graph, quads, extracted_features)
 
     def build_from_flat_dict(
         self, context_snapshot: Dict[str, Any]
@@ -110,49 +254,98 @@ class ContextGraphBuilder:
             ... }
             >>> graph, extracted = builder.build_from_flat_dict(snapshot)
         """
-        context_features: Dict[str, Dict[str, Any]] = {}
+        graph = self._new_graph()
+        extracted_features: Dict[Tuple[str, str], Any] = {}
+        quads: List[Tuple[URIRef, URIRef, Literal, Graph]] = []
 
+        # Distinct keys always split into distinct (artifact, property)
+        # pairs, so triples can be emitted without regrouping by artifact.
         for key, value in context_snapshot.items():
-            if "::" in key:
-                artifact_uri, property_uri = key.split("::", 1)
-            else:
+            artifact_uri, separator, property_uri = key.partition("::")
+            if not separator:
                 logger.warning(
                     f"Skipping key without '::' separator: {key}"
                 )
                 continue
 
-            if artifact_uri not in context_features:
-                context_features[artifact_uri] = {}
+            quads.append(
+                (
+                    _uri(artifact_uri),
+                    _uri(property_uri),
+                    self._convert_to_literal(value),
+                    graph,
+                )
+            )
+            extracted_features[(artifact_uri, property_uri)] = value
+
+        return self._finish_graph(graph, quads, extracted_features)
+
+    def _new_graph(self) -> Graph:
+        """Create an empty context graph with the rdf and xsd prefixes bound.
 
-            context_features[artifact_uri][property_uri] = value
+        Returns:
+            Empty RDF Graph on the configured store
+        """
+        graph = Graph(store=self._store)
+        graph.bind("rdf", RDF)
+        graph.bind("xsd", XSD)
+        return graph
 
-        return self.build_from_kv(context_features)
+    @staticmethod
+    def _finish_graph(
+        graph: Graph,
+        quads: List[Tuple[URIRef, URIRef, Literal, Graph]],
+        extracted_features: Dict[Tuple[str, str], Any],
+    ) -> Tuple[Graph, Dict[Tuple[str, str], Any]]:
+        """Insert collected triples into the context graph in one batch.
+
+        Args:
+            graph: Context graph the quads target
+            quads: Collected (artifact, property, literal, graph) quads
+            extracted_features: Features backing the quads
+
+        Returns:
+            Tuple of (RDF Graph, extracted features dict)
+        """
+        graph.addN(quads)
+
+        # len() may scan the store on some backends; skip it when unlogged.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Built context graph with {len(graph)} triples from "
+                f"{len(extracted_features)} features"
+            )
+        return graph, extracted_features
 
     def normalize_context(
         self, context_input: Any
-    ) -> Tuple[Graph, Dict[Tuple[str, str], Any]]:
+    ) -> Tuple[Graph, Mapping[Tuple[str, str], Any]]:
         """Normalize context input and convert to RDF graph.
 
         This method accepts various context input formats and normalizes
-        them into a canonical RDF graph.
+        them into a canonical RDF graph. A dict is assumed to use a single
+        format throughout, so only its first key decides whether it is a
+        flat ``artifact::property`` snapshot or a nested map.
 
         Args:
             context_input: Context in various formats (dict, Graph, etc.)
 
         Returns:
-            Tuple of (RDF Graph, extracted features dict)
+            Tuple of (RDF Graph, extracted features mapping); features of a
+            Graph input are a :class:`LazyFeatures` view
 
         Raises:
             ValueError: If context format is not supported
         """
         if isinstance(context_input, Graph):
             logger.debug("Context input is already an RDF Graph")
-            return context_input, self._extract_features_from_graph(
-                context_input
+            return context_input, LazyFeatures(
+                context_input, self._extract_features_from_graph
             )
 
         if isinstance(context_input, dict):
-            if any("::" in key for key in context_input.keys()):
+            first_key = next(iter(context_input), None)
+            if isinstance(first_key, str) and "::" in first_key:
                 logger.debug("Parsing flat dict context format")
                 return self.build_from_flat_dict(context_input)
             else:
@@ -172,6 +365,10 @@ class ContextGraphBuilder:
         Returns:
             RDF Literal with proper XSD datatype
         """
+        factory = _LITERAL_FACTORIES.get(type(value))
+        if factory is not None:
+            return factory(value)
+
         if isinstance(value, bool):
             return Literal(value, datatype=XSD.boolean)
         elif isinstance(value, int):
@@ -198,11 +395,14 @@ class ContextGraphBuilder:
             Dictionary of extracted features
         """
         features: Dict[Tuple[str, str], Any] = {}
+        intern = sys.intern
 
         for s, p, o in graph:
             if isinstance(s, URIRef) and isinstance(p, URIRef):
-                artifact_uri = str(s)
-                property_uri = str(p)
+                # Interned plain strings: artifacts and properties repeat
+                # across triples, so keys share one string each.
+                artifact_uri = intern(str(s))
+                property_uri = intern(str(p))
 
                 if isinstance(o, Literal):
                     value = o.toPython()
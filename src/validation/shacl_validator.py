@@ -6,14 +6,76 @@ It validates context graphs against SHACL shapes defined in signifiers.
 
 import hashlib
 import logging
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from pyshacl import validate
-from rdflib import Graph
+from rdflib import RDF, RDFS, SH, Graph
+from rdflib.term import Node, URIRef
+
+from src.validation.context_builder import resolve_graph_store
 
 logger = logging.getLogger(__name__)
 
+_SH_RESULT_SEVERITY = SH.resultSeverity
+_SH_VIOLATION = SH.Violation
+_SH_FOCUS_NODE = SH.focusNode
+_SH_RESULT_PATH = SH.resultPath
+_SH_RESULT_MESSAGE = SH.resultMessage
+_SH_SOURCE_CONSTRAINT = SH.sourceConstraintComponent
+_SH_VALUE = SH.value
+_RESULT_FIELDS = frozenset(
+    {
+        _SH_FOCUS_NODE,
+        _SH_RESULT_PATH,
+        _SH_RESULT_MESSAGE,
+        _SH_SOURCE_CONSTRAINT,
+        _SH_VALUE,
+    }
+)
+
+# Schema axioms RDFS inference would act on.
+_RDFS_AXIOM_PREDICATES = (
+    RDFS.subClassOf,
+    RDFS.subPropertyOf,
+    RDFS.domain,
+    RDFS.range,
+)
+_RDF_NIL = RDF.nil
+_RDF_NAMESPACES = (
+    "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "http://www.w3.org/2000/01/rdf-schema#",
+)
+
+
+def _shapes_need_inference(shapes_graph: Graph) -> bool:
+    """Check whether RDFS inference could change results for these shapes.
+
+    Inference matters when the shapes carry schema axioms, or when they
+    mention RDF/RDFS vocabulary (e.g. ``sh:path rdf:type`` or
+    ``sh:targetClass rdfs:Resource``) whose extension inference enlarges.
+
+    Args:
+        shapes_graph: Parsed SHACL shapes
+
+    Returns:
+        True if validation should run RDFS inference
+    """
+    if any((None, p, None) in shapes_graph for p in _RDFS_AXIOM_PREDICATES):
+        return True
+    for obj in shapes_graph.objects():
+        if (
+            isinstance(obj, URIRef)
+            and obj != _RDF_NIL
+            and any(obj.startswith(ns) for ns in _RDF_NAMESPACES)
+        ):
+            return True
+    return False
+
 
 @dataclass
 class ViolationDetail:
@@ -51,19 +113,130 @@ class ViolationDetail:
         }
 
 
+@dataclass(slots=True)
+class ViolationBatch(Sequence):
+    """Violations stored column-wise, one list per ViolationDetail field.
+
+    Behaves as a read-only sequence of :class:`ViolationDetail`; rows are
+    built on access, so large batches hold only the field strings.
+
+    Args:
+        focus_nodes: Focus node of each violation
+        result_paths: Result path of each violation
+        messages: Message of each violation
+        severities: Severity of each violation
+        source_constraint_components: Constraint component of each violation
+        values: Offending value of each violation
+    """
+
+    focus_nodes: List[str] = field(default_factory=list)
+    result_paths: List[Optional[str]] = field(default_factory=list)
+    messages: List[str] = field(default_factory=list)
+    severities: List[str] = field(default_factory=list)
+    source_constraint_components: List[Optional[str]] = field(
+        default_factory=list
+    )
+    values: List[Optional[str]] = field(default_factory=list)
+
+    def append(
+        self,
+        focus_node: str,
+        result_path: Optional[str],
+        message: str,
+        severity: str = "Violation",
+        source_constraint_component: Optional[str] = None,
+        value: Optional[str] = None,
+    ) -> None:
+        """Add one violation to the batch.
+
+        Args:
+            focus_node: The node that failed validation
+            result_path: The property path that was violated
+            message: Human-readable violation message
+            severity: Severity level (Violation, Warning, Info)
+            source_constraint_component: The SHACL constraint that failed
+            value: The actual value that caused the violation
+        """
+        self.focus_nodes.append(focus_node)
+        self.result_paths.append(result_path)
+        self.messages.append(message)
+        self.severities.append(severity)
+        self.source_constraint_components.append(source_constraint_component)
+        self.values.append(value)
+
+    def _columns(self) -> Tuple[List, ...]:
+        """Field columns in ViolationDetail constructor order."""
+        return (
+            self.focus_nodes,
+            self.result_paths,
+            self.messages,
+            self.severities,
+            self.source_constraint_components,
+            self.values,
+        )
+
+    def __len__(self) -> int:
+        return len(self.focus_nodes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return ViolationDetail(*(column[index] for column in self._columns()))
+
+    def __iter__(self) -> Iterator[ViolationDetail]:
+        for row in zip(*self._columns()):
+            yield ViolationDetail(*row)
+
+    def to_dict(self) -> Dict[str, List[Optional[str]]]:
+        """Convert the batch to a column-oriented dictionary.
+
+        Returns:
+            Mapping of plural field names to their value lists
+        """
+        return {
+            "focus_nodes": self.focus_nodes,
+            "result_paths": self.result_paths,
+            "messages": self.messages,
+            "severities": self.severities,
+            "source_constraint_components": self.source_constraint_components,
+            "values": self.values,
+        }
+
+    def to_dicts(self) -> List[Dict]:
+        """Convert the batch to per-violation dictionaries.
+
+        Returns:
+            Same rows as calling ViolationDetail.to_dict on each violation
+        """
+        return [
+            dict(zip(_VIOLATION_KEYS, row)) for row in zip(*self._columns())
+        ]
+
+
+_VIOLATION_KEYS = (
+    "focus_node",
+    "result_path",
+    "message",
+    "severity",
+    "source_constraint_component",
+    "value",
+)
+
+
 @dataclass
 class ValidationResult:
     """Result of SHACL validation.
 
     Args:
         conforms: Whether the data graph conforms to the shapes
-        violations: List of violation details
+        violations: Violation details; a :class:`ViolationBatch` when
+            produced by the validator
         validation_report_text: Full validation report as text
         validation_report_graph: Validation report as RDF graph
     """
 
     conforms: bool
-    violations: List[ViolationDetail]
+    violations: Sequence[ViolationDetail]
     validation_report_text: Optional[str] = None
     validation_report_graph: Optional[Graph] = None
 
@@ -73,10 +246,15 @@ class ValidationResult:
         Returns:
             Dictionary representation suitable for API responses
         """
+        violations = self.violations
+        if isinstance(violations, ViolationBatch):
+            rows = violations.to_dicts()
+        else:
+            rows = [v.to_dict() for v in violations]
         return {
             "conforms": self.conforms,
-            "violations": [v.to_dict() for v in self.violations],
-            "violation_count": len(self.violations),
+            "violations": rows,
+            "violation_count": len(violations),
         }
 
 
@@ -85,23 +263,62 @@ class SHACLValidator:
 
     This validator uses pyshacl to validate RDF graphs against SHACL shapes.
     It supports caching of validation results and provides detailed violation reports.
+    Validation results are kept in a bounded, thread-safe LRU cache.
+    Parsed shapes graphs are memoized by content digest for the lifetime of
+    the validator, so callers must treat them as read-only.
     """
 
-    def __init__(self, enable_caching: bool = True):
+    def __init__(
+        self,
+        enable_caching: bool = True,
+        cache_size: int = 256,
+        store_report_graph: bool = False,
+        backend: str = "memory",
+        shapes_cache_size: int = 1024,
+    ):
         """Initialize the SHACL Validator.
 
         Args:
             enable_caching: Enable validation result caching
+            cache_size: Maximum cached validation results (0 disables)
+            store_report_graph: Keep the report graph and text in cached
+                results; by default only conformance and violations are kept
+            backend: Triple store for parsed shapes, "memory" (default) or
+                "oxigraph"; "oxigraph" falls back to rdflib's in-memory
+                store when oxrdflib is not installed
+            shapes_cache_size: Maximum memoized parsed shapes graphs
+
+        Raises:
+            ValueError: If the backend is unknown
         """
-        self.enable_caching = enable_caching
-        self._cache: Dict[str, ValidationResult] = {}
+        self._store = resolve_graph_store(backend)
+        self.enable_caching = enable_caching and cache_size > 0
+        self.cache_size = cache_size
+        self.store_report_graph = store_report_graph
+        self._cache: "OrderedDict[str, ValidationResult]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self.shapes_cache_size = shapes_cache_size
+        self._shape_cache: "OrderedDict[Tuple[bytes, str], Graph]" = OrderedDict()
+        self._shape_digests: Dict[int, str] = {}
+        self._shape_inference: Dict[int, bool] = {}
+        # Serialization hashes of live graphs, keyed by id() and checked
+        # against a weak reference so a reused id never matches.
+        self._graph_hashes: Dict[int, Tuple["weakref.ref[Graph]", str]] = {}
         logger.info("SHACL Validator initialized")
 
-    def parse_shapes(self, shapes_data: str, format: str = "turtle") -> Graph:
+    def parse_shapes(
+        self, shapes_data: Union[str, bytes], format: str = "turtle"
+    ) -> Graph:
         """Parse SHACL shapes from string into RDF Graph.
 
+        Parsed graphs are memoized in a bounded LRU keyed by a digest of the
+        text. Windows line endings are normalized first, so shapes that
+        differ only in line endings share one graph.
+
         Args:
-            shapes_data: SHACL shapes as string
+            shapes_data: SHACL shapes as string or UTF-8 bytes
             format: RDF serialization format
 
         Returns:
@@ -110,29 +327,71 @@ class SHACLValidator:
         Raises:
             ValueError: If shapes parsing fails
         """
+        if isinstance(shapes_data, bytes):
+            shapes_data = shapes_data.decode("utf-8")
+        if "\r" in shapes_data:
+            shapes_data = shapes_data.replace("\r\n", "\n")
+
+        key = (
+            hashlib.blake2b(shapes_data.encode(), digest_size=16).digest(),
+            format,
+        )
+        with self._cache_lock:
+            shapes_graph = self._shape_cache.get(key)
+            if shapes_graph is not None:
+                self._shape_cache.move_to_end(key)
+                return shapes_graph
+
         try:
-            shapes_graph = Graph()
+            shapes_graph = Graph(store=self._store)
             shapes_graph.parse(data=shapes_data, format=format)
-            logger.debug(
-                f"Parsed {len(shapes_graph)} triples from SHACL shapes"
-            )
-            return shapes_graph
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Parsed {len(shapes_graph)} triples from SHACL shapes"
+                )
         except Exception as e:
             logger.error(f"Failed to parse SHACL shapes: {e}")
             raise ValueError(f"Invalid SHACL shapes: {e}")
 
+        needs_inference = _shapes_need_inference(shapes_graph)
+        with self._cache_lock:
+            existing = self._shape_cache.get(key)
+            if existing is not None:
+                return existing
+            self._shape_cache[key] = shapes_graph
+            self._shape_digests[id(shapes_graph)] = f"{key[0].hex()}:{format}"
+            self._shape_inference[id(shapes_graph)] = needs_inference
+            if len(self._shape_cache) > self.shapes_cache_size:
+                _, evicted = self._shape_cache.popitem(last=False)
+                self._shape_digests.pop(id(evicted), None)
+                self._shape_inference.pop(id(evicted), None)
+        return shapes_graph
+
     def validate(
         self,
         data_graph: Graph,
         shapes_graph: Graph,
         use_cache: bool = True,
+        stable_identity: bool = False,
+        force_inference: Optional[str] = None,
     ) -> ValidationResult:
         """Validate data graph against SHACL shapes.
 
+        Cached results carry the validation report graph and text only when
+        the validator was created with ``store_report_graph=True``.
+
+        RDFS inference is skipped for shapes parsed by :meth:`parse_shapes`
+        that neither carry schema axioms nor mention RDF/RDFS vocabulary,
+        unless the data graph carries schema axioms itself.
+
         Args:
             data_graph: The RDF graph to validate
             shapes_graph: The SHACL shapes graph
             use_cache: Use cached result if available
+            stable_identity: The caller will not modify data_graph while it
+                is alive, so its cache-key hash can be computed once
+            force_inference: pyshacl inference mode to use instead of the
+                automatic choice (e.g. "rdfs" or "none")
 
         Returns:
             ValidationResult with conforms status and violations
@@ -140,18 +399,27 @@ class SHACLValidator:
         Raises:
             ValueError: If validation execution fails
         """
-        cache_key = self._compute_cache_key(data_graph, shapes_graph)
-
-        if use_cache and self.enable_caching and cache_key in self._cache:
-            logger.debug("Returning cached validation result")
-            return self._cache[cache_key]
+        cache_key = self._compute_cache_key(
+            data_graph, shapes_graph, stable_identity
+        )
+        if force_inference is not None:
+            cache_key = f"{cache_key}:{force_inference}"
+
+        if use_cache and self.enable_caching:
+            cached = self._lookup_result(cache_key)
+            if cached is not None:
+                logger.debug("Returning cached validation result")
+                return cached
 
         try:
-            logger.debug("Executing SHACL validation")
+            inference = force_inference or self._inference_mode(
+                data_graph, shapes_graph
+            )
+            logger.debug(f"Executing SHACL validation (inference={inference})")
             conforms, results_graph, results_text = validate(
                 data_graph,
                 shacl_graph=shapes_graph,
-                inference="rdfs",
+                inference=inference,
                 abort_on_first=False,
                 allow_infos=True,
                 allow_warnings=True,
@@ -167,7 +435,7 @@ class SHACLValidator:
             )
 
             if self.enable_caching:
-                self._cache[cache_key] = result
+                self._store_result(cache_key, result)
 
             logger.info(
                 f"Validation complete: conforms={conforms}, "
@@ -179,11 +447,65 @@ class SHACLValidator:
             logger.error(f"SHACL validation failed: {e}")
             raise ValueError(f"Validation execution failed: {e}")
 
+    def _inference_mode(self, data_graph: Graph, shapes_graph: Graph) -> str:
+        """Choose the pyshacl inference mode for a validation.
+
+        Args:
+            data_graph: The data graph
+            shapes_graph: The shapes graph
+
+        Returns:
+            "rdfs" or "none"
+        """
+        if self._shape_inference.get(id(shapes_graph), True):
+            return "rdfs"
+        if any((None, p, None) in data_graph for p in _RDFS_AXIOM_PREDICATES):
+            return "rdfs"
+        return "none"
+
+    def _lookup_result(self, cache_key: str) -> Optional[ValidationResult]:
+        """Fetch a validation result from the LRU cache.
+
+        Args:
+            cache_key: Key from :meth:`_compute_cache_key`
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+        return cached
+
+    def _store_result(self, cache_key: str, result: ValidationResult) -> None:
+        """Insert a validation result into the LRU cache.
+
+        Args:
+            cache_key: Key from :meth:`_compute_cache_key`
+            result: Validation result to cache
+        """
+        if not self.store_report_graph:
+            result = ValidationResult(
+                conforms=result.conforms, violations=result.violations
+            )
+
+        with self._cache_lock:
+            self._cache[cache_key] = result
+            self._cache.move_to_end(cache_key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
     def validate_signifier_context(
         self,
         context_graph: Graph,
         shapes_data: str,
         format: str = "turtle",
+        stable_identity: bool = False,
+        force_inference: Optional[str] = None,
     ) -> ValidationResult:
         """Validate context graph against signifier's SHACL shapes.
 
@@ -191,6 +513,8 @@ class SHACLValidator:
             context_graph: The context graph to validate
             shapes_data: SHACL shapes as string
             format: RDF serialization format
+            stable_identity: See :meth:`validate`
+            force_inference: See :meth:`validate`
 
         Returns:
             ValidationResult
@@ -199,33 +523,41 @@ class SHACLValidator:
             ValueError: If validation fails
         """
         shapes_graph = self.parse_shapes(shapes_data, format)
-        return self.validate(context_graph, shapes_graph)
-
-    def _parse_violations(self, results_graph: Graph) -> List[ViolationDetail]:
+        return self.validate(
+            context_graph,
+            shapes_graph,
+            stable_identity=stable_identity,
+            force_inference=force_inference,
+        )
+
+    def _parse_violations(self, results_graph: Graph) -> ViolationBatch:
         """Parse violations from validation results graph.
 
         Args:
             results_graph: RDF graph containing validation results
 
         Returns:
-            List of ViolationDetail objects
+            Column-wise batch of the violations
         """
-        from rdflib import SH
-
-        violations = []
+        violations = ViolationBatch()
 
         for result_node in results_graph.subjects(
-            SH.resultSeverity, SH.Violation
+            _SH_RESULT_SEVERITY, _SH_VIOLATION
         ):
-            focus_node = results_graph.value(result_node, SH.focusNode)
-            result_path = results_graph.value(result_node, SH.resultPath)
-            message = results_graph.value(result_node, SH.resultMessage)
-            constraint = results_graph.value(
-                result_node, SH.sourceConstraintComponent
-            )
-            value = results_graph.value(result_node, SH.value)
-
-            violation = ViolationDetail(
+            # One sweep per result; the first object of each field wins,
+            # matching Graph.value().
+            fields: Dict[Node, Node] = {}
+            for predicate, obj in results_graph.predicate_objects(result_node):
+                if predicate in _RESULT_FIELDS and predicate not in fields:
+                    fields[predicate] = obj
+
+            focus_node = fields.get(_SH_FOCUS_NODE)
+            result_path = fields.get(_SH_RESULT_PATH)
+            message = fields.get(_SH_RESULT_MESSAGE)
+            constraint = fields.get(_SH_SOURCE_CONSTRAINT)
+            value = fields.get(_SH_VALUE)
+
+            violations.append(
                 focus_node=str(focus_node) if focus_node else "unknown",
                 result_path=str(result_path) if result_path else None,
                 message=str(message) if message else "Validation failed",
@@ -235,35 +567,90 @@ class SHACLValidator:
                 ),
                 value=str(value) if value else None,
             )
-            violations.append(violation)
 
         logger.debug(f"Parsed {len(violations)} violations from results")
         return violations
 
     def _compute_cache_key(
-        self, data_graph: Graph, shapes_graph: Graph
+        self, data_graph: Graph, shapes_graph: Graph, stable_identity: bool = False
     ) -> str:
         """Compute cache key for validation result.
 
+        Shapes graphs produced by :meth:`parse_shapes` are identified by
+        their source digest instead of being re-serialized. Other shapes
+        graphs, which are read-only like parsed ones, are hashed once per
+        graph; data graphs only when the caller vouches for them.
+
         Args:
             data_graph: The data graph
             shapes_graph: The shapes graph
+            stable_identity: Memoize the data graph's hash by identity
 
         Returns:
             Cache key as hex string
         """
-        data_hash = hashlib.sha256(
-            data_graph.serialize(format="turtle").encode()
-        ).hexdigest()
-        shapes_hash = hashlib.sha256(
-            shapes_graph.serialize(format="turtle").encode()
-        ).hexdigest()
+        data_hash = self._graph_hash(data_graph, memoize=stable_identity)
+        shapes_hash = self._shape_digests.get(id(shapes_graph))
+        if shapes_hash is None:
+            shapes_hash = self._graph_hash(shapes_graph, memoize=True)
 
         return f"{data_hash}:{shapes_hash}"
 
+    def _graph_hash(self, graph: Graph, memoize: bool) -> str:
+        """Hash a graph's triples.
+
+        Args:
+            graph: Graph to hash
+            memoize: Reuse the hash computed for this graph object earlier
+
+        Returns:
+            Hex digest of the graph
+        """
+        key = id(graph)
+        if memoize:
+            entry = self._graph_hashes.get(key)
+            if entry is not None and entry[0]() is graph:
+                return entry[1]
+
+        digest = self._graph_digest(graph).hex()
+
+        if memoize:
+            hashes = self._graph_hashes
+            try:
+                ref = weakref.ref(graph, lambda _: hashes.pop(key, None))
+            except TypeError:
+                return digest
+            hashes[key] = (ref, digest)
+        return digest
+
+    @staticmethod
+    def _graph_digest(graph: Graph) -> bytes:
+        """Digest a graph's triples in canonical order.
+
+        Triples are hashed as sorted N-Triples lines, which is independent
+        of insertion order and avoids running the Turtle serializer.
+
+        Args:
+            graph: Graph to digest
+
+        Returns:
+            16-byte BLAKE2b digest
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for line in sorted(f"{s.n3()} {p.n3()} {o.n3()} .\n" for s, p, o in graph):
+            digest.update(line.encode())
+        return digest.digest()
+
     def clear_cache(self) -> None:
-        """Clear the validation cache."""
-        self._cache.clear()
+        """Clear the validation and parsed shapes caches."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+            self._shape_cache.clear()
+            self._shape_digests.clear()
+            self._shape_inference.clear()
+        self._graph_hashes.clear()
         logger.info("Validation cache cleared")
 
     def get_cache_stats(self) -> Dict:
@@ -272,7 +659,17 @@ class SHACLValidator:
         Returns:
             Dictionary with cache size and other stats
         """
+        with self._cache_lock:
+            size = len(self._cache)
+            hits = self._cache_hits
+            misses = self._cache_misses
+
         return {
             "enabled": self.enable_caching,
-            "size": len(self._cache),
+            "size": size,
+            "maxsize": self.cache_size,
+            "currsize": size,
+            "hits": hits,
+            "misses": misses,
+            "shapes_size": len(self._shape_cache),
         }
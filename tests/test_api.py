@@ -0,0 +1,129 @@
+"""Tests for the mounted API routes."""
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.api.routes import retrieval, simple_signifiers
+from src.matching import IntentMatcherRegistry
+from src.orchestrator import RetrievalOrchestrator
+from src.storage.registry import SignifierRegistry
+
+_LAB = "http://example.org/precis/workspaces/lab308/artifacts/"
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    """Serve a registry holding the example signifiers plus a shapes twin."""
+    registry = SignifierRegistry(
+        storage_dir=str(tmp_path), enable_authoring_validation=False
+    )
+    base_path = Path(__file__).parent.parent / "signifiers"
+    for file_path in sorted(base_path.glob("*.ttl")):
+        registry.create_from_rdf(file_path.read_text(encoding="utf-8"))
+    twin = registry.get("raise-blinds-signifier").model_copy(
+        update={"signifier_id": "raise-blinds-twin"}
+    )
+    registry.create(twin)
+    monkeypatch.setattr(simple_signifiers, "registry", registry)
+    yield registry
+    registry.close()
+
+
+class TestBatchValidation:
+    """Tests for POST /validate/shacl/batch."""
+
+    def test_validates_once_per_unique_shapes(self, registry, monkeypatch):
+        """Test signifiers sharing shapes text are validated together."""
+        validator = simple_signifiers.shacl_validator
+        calls = []
+        validate = validator.validate_signifier_context
+
+        def counting_validate(context_graph, shapes, *args, **kwargs):
+            calls.append(shapes)
+            return validate(context_graph, shapes, *args, **kwargs)
+
+        monkeypatch.setattr(
+            validator, "validate_signifier_context", counting_validate
+        )
+
+        signifier_ids = [
+            "raise-blinds-signifier",
+            "lower-blinds-signifier",
+            "raise-blinds-twin",
+        ]
+        response = TestClient(app).post(
+            "/validate/shacl/batch",
+            json={
+                "context": {
+                    _LAB + "external_light_sensing308": {
+                        "http://example.org/LightSensor#hasLuminosityLevel": 15000
+                    },
+                    _LAB + "temperature_sensor308": {
+                        "http://example.org/TemperatureSensor#hasTemperatureLevel": 20
+                    },
+                },
+                "signifier_ids": signifier_ids,
+            },
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [r["signifier_id"] for r in body["results"]] == signifier_ids
+        assert body["total_count"] == 3
+        assert len(calls) == 2
+        assert len(set(calls)) == 2
+        raise_result, _, twin_result = body["results"]
+        assert raise_result["conforms"] is True
+        assert twin_result["conforms"] == raise_result["conforms"]
+        assert twin_result["violations"] == raise_result["violations"]
+
+    def test_missing_signifier_returns_404(self, registry):
+        """Test unknown signifier IDs are reported as not found."""
+        response = TestClient(app).post(
+            "/validate/shacl/batch",
+            json={
+                "context": {},
+                "signifier_ids": ["raise-blinds-signifier", "missing"],
+            },
+        )
+
+        assert response.status_code == 404
+        assert "missing" in response.json()["detail"]
+
+
+class TestRetrievalCache:
+    """Tests for POST /retrieve/clear-cache."""
+
+    def test_clears_responses_and_validation_results(self, registry, monkeypatch):
+        """Test both the response cache and the validator cache are emptied."""
+        orchestrator = RetrievalOrchestrator(
+            registry,
+            matcher_registry=IntentMatcherRegistry(default_version="v0"),
+        )
+        monkeypatch.setattr(retrieval, "orchestrator", orchestrator)
+        client = TestClient(app)
+
+        response = client.post(
+            "/retrieve/match",
+            json={
+                "intent_query": "increase luminosity in the room",
+                "context_input": {
+                    _LAB + "external_light_sensing308": {
+                        "http://example.org/LightSensor#hasLuminosityLevel": 15000
+                    },
+                },
+                "matcher_version": "v0",
+            },
+        )
+        assert response.status_code == 200
+        assert orchestrator._response_cache
+        assert orchestrator.shacl_validator.get_cache_stats()["size"] > 0
+
+        response = client.post("/retrieve/clear-cache")
+
+        assert response.status_code == 200
+        assert not orchestrator._response_cache
+        assert orchestrator.shacl_validator.get_cache_stats()["size"] == 0
@@ -4,13 +4,21 @@ This module tests string matching, embedding matching,
 and the matcher registry.
 """
 
+import numpy as np
 import pytest
 
 from src.matching import (
     EmbeddingMatcher,
+    IndexedStringContainsMatcher,
     IntentMatcherRegistry,
     StringContainsMatcher,
 )
+from src.models.signifier import (
+    IntentContext,
+    IntentionDescription,
+    Provenance,
+    Signifier,
+)
 
 
 class TestStringContainsMatcher:
@@ -149,6 +157,52 @@ class TestStringContainsMatcher:
 
         assert len(results) == 1
 
+    def test_structured_keys_not_matched(self):
+        """Test that structured field names are not treated as tokens."""
+        matcher = StringContainsMatcher()
+
+        signifiers = [
+            {
+                "signifier_id": "sig1",
+                "intent": {
+                    "nl_text": "turn on device",
+                    "structured": {"action": "activate", "target": ["lamp"]}
+                }
+            }
+        ]
+
+        assert matcher.match("target action", signifiers, k=5) == []
+        assert len(matcher.match("lamp", signifiers, k=5)) == 1
+
+    def test_signifier_models_match_like_dicts(self):
+        """Test Signifier models can be matched without dumping them."""
+        matcher = StringContainsMatcher()
+
+        signifiers = [
+            Signifier(
+                signifier_id=f"sig{i}",
+                intent=IntentionDescription(
+                    nl_text=text, structured={"action": action}
+                ),
+                context=IntentContext(),
+                affordance_uri="http://example.org/affordance",
+                provenance=Provenance(created_by="test"),
+            )
+            for i, (text, action) in enumerate(
+                [("raise the blinds", "open"), ("open the window", "ventilate")]
+            )
+        ]
+
+        from_models = matcher.match("open window", signifiers, k=5)
+        from_dicts = matcher.match(
+            "open window", [s.model_dump() for s in signifiers], k=5
+        )
+
+        assert [r.to_dict() for r in from_models] == [
+            r.to_dict() for r in from_dicts
+        ]
+        assert from_models[0].signifier_id == "sig1"
+
     def test_top_k_limiting(self):
         """Test that results are limited to top k."""
         matcher = StringContainsMatcher()
@@ -182,6 +236,63 @@ class TestStringContainsMatcher:
         assert len(results) == 0
 
 
+class TestIndexedStringContainsMatcher:
+    """Tests for Indexed String Contains Matcher (IM v2)."""
+
+    SIGNIFIERS = [
+        {
+            "signifier_id": "sig1",
+            "intent": {"nl_text": "increase luminosity in a room"},
+        },
+        {
+            "signifier_id": "sig2",
+            "intent": {"nl_text": "decrease temperature level"},
+        },
+        {
+            "signifier_id": "sig3",
+            "intent": {
+                "nl_text": "increase temperature",
+                "structured": {"intent": "heat the room"},
+            },
+        },
+    ]
+
+    def test_initialization(self):
+        """Test matcher initialization."""
+        matcher = IndexedStringContainsMatcher()
+
+        assert matcher.get_version() == "v2"
+        assert "Indexed" in matcher.get_info()["name"]
+
+    def test_matches_linear_matcher(self):
+        """Test that results equal the linear scan matcher."""
+        linear = StringContainsMatcher()
+        indexed = IndexedStringContainsMatcher()
+
+        for query in ["increase temperature", "room luminosity", "nothing here"]:
+            expected = linear.match(query, self.SIGNIFIERS, k=5)
+            actual = indexed.match(query, self.SIGNIFIERS, k=5)
+
+            assert [r.signifier_id for r in actual] == [
+                r.signifier_id for r in expected
+            ]
+            assert [r.similarity for r in actual] == [
+                r.similarity for r in expected
+            ]
+
+    def test_index_reused_for_same_corpus_version(self):
+        """Test that the index is only rebuilt when the version changes."""
+        matcher = IndexedStringContainsMatcher()
+
+        matcher.match("increase", self.SIGNIFIERS, corpus_version=1)
+        index = matcher._index
+        matcher.match("temperature", self.SIGNIFIERS, corpus_version=1)
+        assert matcher._index is index
+
+        matcher.match("temperature", self.SIGNIFIERS, corpus_version=2)
+        assert matcher._index is not index
+
+
 class TestEmbeddingMatcher:
     """Tests for Embedding Matcher (IM v1)."""
 
@@ -298,6 +409,65 @@ class TestEmbeddingMatcher:
         except ImportError:
             pytest.skip("sentence-transformers not installed")
 
+    def test_batched_cache_misses(self):
+        """Test that uncached signifiers are all embedded and cached."""
+        try:
+            matcher = EmbeddingMatcher(cache_embeddings=True)
+
+            signifiers = [
+                {
+                    "signifier_id": f"sig{i}",
+                    "intent": {"nl_text": f"intent number {i}"},
+                    "indexes": {"match_text": f"intent number {i}"},
+                }
+                for i in range(5)
+            ]
+
+            results = matcher.match("intent", signifiers, k=10)
+
+            assert len(results) == 5
+            assert matcher.get_cache_stats()["size"] == 5
+
+        except ImportError:
+            pytest.skip("sentence-transformers not installed")
+
+
+    def test_index_reused_for_same_corpus_version(self):
+        """Test the embedding matrix is only rebuilt when the version changes."""
+
+        class _CountingModel:
+            def __init__(self):
+                self.batches = 0
+
+            def encode(self, texts, **kwargs):
+                if isinstance(texts, str):
+                    return np.array([1.0, 0.0])
+                self.batches += 1
+                return np.array(
+                    [[1.0, 0.0] if "up" in text else [0.0, 1.0] for text in texts]
+                )
+
+        matcher = EmbeddingMatcher()
+        matcher._model = model = _CountingModel()
+        signifiers = [
+            {"signifier_id": "sig1", "intent": {"nl_text": "go up"}},
+            {"signifier_id": "sig2", "intent": {"nl_text": "go down"}},
+        ]
+
+        first = matcher.match("up", signifiers, corpus_version=1)
+        index = matcher._index
+        second = matcher.match("up", signifiers, corpus_version=1)
+        assert matcher._index is index
+        assert [r.to_dict() for r in second] == [r.to_dict() for r in first]
+        assert [r.signifier_id for r in first] == ["sig1", "sig2"]
+
+        matcher.match("up", signifiers, corpus_version=2)
+        assert matcher._index is not index
+        assert model.batches == 1
+
+        matcher.clear_cache()
+        assert matcher._index is None
+
 
 class TestIntentMatcherRegistry:
     """Tests for Intent Matcher Registry."""
@@ -339,6 +509,16 @@ class TestIntentMatcherRegistry:
         registry.set_default_version("v0")
         assert registry.get_default_version() == "v0"
 
+    def test_default_match_rebound_on_register(self):
+        """Test that re-registering the default version updates dispatch."""
+        registry = IntentMatcherRegistry(default_version="v0")
+        replacement = StringContainsMatcher()
+
+        registry.register(replacement)
+
+        assert registry.get_matcher() is replacement
+        assert registry._default_match == replacement.match
+
     def test_set_invalid_default_version(self):
         """Test setting invalid default version."""
         registry = IntentMatcherRegistry()
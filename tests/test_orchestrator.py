@@ -0,0 +1,73 @@
+"""Tests for the retrieval orchestrator."""
+
+from pathlib import Path
+
+import pytest
+
+from src.matching import IntentMatcherRegistry
+from src.orchestrator.orchestrator import RetrievalOrchestrator, RetrievalRequest
+from src.ranking import Ranker
+from src.storage.registry import SignifierRegistry
+
+_LAB = "http://example.org/precis/workspaces/lab308/artifacts/"
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """Create a registry holding the example signifiers."""
+    registry = SignifierRegistry(storage_dir=str(tmp_path))
+    base_path = Path(__file__).parent.parent / "signifiers"
+    for file_path in sorted(base_path.glob("*.ttl")):
+        registry.create_from_rdf(file_path.read_text(encoding="utf-8"))
+    yield registry
+    registry.close()
+
+
+class TestRetrievalOrchestrator:
+    """Tests for RetrievalOrchestrator."""
+
+    @pytest.mark.parametrize("sse_gate", [False, True])
+    def test_fused_matches_separate_modules(self, registry, sse_gate):
+        """Test the fused SSE+SV pass reports the same module metadata."""
+        orchestrator = RetrievalOrchestrator(
+            registry,
+            matcher_registry=IntentMatcherRegistry(default_version="v0"),
+            ranker=Ranker(enable_sse_gate=sse_gate),
+            response_cache_size=0,
+        )
+        request = RetrievalRequest(
+            intent_query="increase luminosity in the room",
+            context_input={
+                _LAB + "external_light_sensing308": {
+                    "http://example.org/LightSensor#hasLuminosityLevel": 15000
+                },
+                _LAB + "temperature_sensor308": {
+                    "http://example.org/TemperatureSensor#hasTemperatureLevel": 30
+                },
+            },
+        )
+
+        im_result = orchestrator._execute_intent_matching(request)
+        im_candidates = im_result.metadata["candidates"]
+        im_snapshot = [dict(candidate) for candidate in im_candidates]
+        fused_sse, fused_sv = orchestrator._execute_fused(request, im_candidates)
+        assert im_candidates == im_snapshot
+
+        sse_result = orchestrator._execute_sse(request, im_candidates)
+        sv_result = orchestrator._execute_shacl_validation(
+            request, sse_result.metadata["candidates"]
+        )
+        assert fused_sse.metadata == sse_result.metadata
+        if not sse_gate:
+            assert fused_sv.metadata == sv_result.metadata
+
+        response = orchestrator.retrieve(request)
+        im_metadata = response.module_results[0].metadata
+        assert all("sse_pass" not in c for c in im_metadata["candidates"])
+        assert all("shacl_conforms" not in c for c in im_metadata["candidates"])
+        assert [m.module_name for m in response.module_results] == [
+            "IM",
+            "SSE",
+            "SV",
+            "RP",
+        ]
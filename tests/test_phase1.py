@@ -6,11 +6,20 @@ using the three example signifiers.
 
 import json
 import logging
+import sqlite3
+import threading
 from pathlib import Path
 
 import pytest
+from rdflib import Graph
+from rdflib.compare import isomorphic
 
+from src.models import signifier as signifier_module
 from src.models.signifier import Signifier, SignifierStatus
+from src.storage import memory_store, representation
+from src.storage import registry as registry_module
+from src.storage.memory_store import MemoryStore
+from src.storage.representation import RepresentationService
 from src.storage.registry import SignifierRegistry
 
 logging.basicConfig(level=logging.INFO)
@@ -58,6 +67,24 @@ def signifier_files():
     }
 
 
+def test_preprocess_rdf():
+    """Test comment stripping and structured description quoting."""
+    raw = (
+        "ex:s a cashmere:Signifier ;  // trailing comment\n"
+        "   \n"
+        "// full line comment\n"
+        '  cashmere:hasStructuredDescription " {a: <http:x>} "^^xsd:string .'
+    )
+
+    processed = RepresentationService._preprocess_rdf(raw)
+
+    assert processed.startswith("@prefix cashmere:")
+    assert processed.split("\n")[6:] == [
+        "ex:s a cashmere:Signifier ;",
+        "  cashmere:hasStructuredDescription \"\"\"{a: 'http:x'}\"\"\"^^xsd:string .",
+    ]
+
+
 def test_create_signifier_from_rdf(registry, signifier_files):
     """Test creating signifiers from RDF files.
 
@@ -129,6 +156,74 @@ def test_list_signifiers(registry, signifier_files):
     assert len(active_signifiers) == 3
 
 
+def test_list_signifiers_filters(registry, test_storage_dir, signifier_files):
+    """Test status/affordance filtering follows writes from any registry.
+
+    Args:
+        registry: SignifierRegistry instance
+        test_storage_dir: Test storage directory path
+        signifier_files: Dictionary of signifier file paths
+    """
+    created = []
+    for file_path in signifier_files.values():
+        with open(file_path, "r", encoding="utf-8") as f:
+            created.append(registry.create_from_rdf(f.read(), format="turtle"))
+    assert [s.signifier_id for s in registry.list_signifiers()] == sorted(
+        s.signifier_id for s in created
+    )
+
+    other = SignifierRegistry(storage_dir=test_storage_dir)
+    other.update_status(created[0].signifier_id, SignifierStatus.DEPRECATED)
+
+    deprecated = registry.list_signifiers(status=SignifierStatus.DEPRECATED)
+    assert [s.signifier_id for s in deprecated] == [created[0].signifier_id]
+    assert len(registry.list_signifiers(status=SignifierStatus.ACTIVE)) == 2
+
+    affordance = created[1].affordance_uri
+    by_affordance = registry.list_signifiers(
+        status=SignifierStatus.ACTIVE, affordance_uri=affordance
+    )
+    assert [s.signifier_id for s in by_affordance] == sorted(
+        s.signifier_id for s in created[1:] if s.affordance_uri == affordance
+    )
+
+    registry.delete(created[1].signifier_id)
+    assert len(other.list_signifiers(offset=1)) == 1
+
+
+def test_list_signifiers_parallel_load(registry, signifier_files):
+    """Test large pages are loaded in order and skip unreadable documents.
+
+    Args:
+        registry: SignifierRegistry instance
+        signifier_files: Dictionary of signifier file paths
+    """
+    with open(signifier_files["raise_blinds"], "r", encoding="utf-8") as f:
+        template = registry.repr_service.parse_rdf_signifier(f.read())
+    for i in range(12):
+        registry.create(template.model_copy(update={"signifier_id": f"sig-{i:02d}"}))
+    registry.store._get_json_path("sig-05").write_text("{", encoding="utf-8")
+
+    listed = [s.signifier_id for s in registry.list_signifiers()]
+    assert listed == [f"sig-{i:02d}" for i in range(12) if i != 5]
+
+
+def test_list_all_signifiers_skips_other_entries(registry, signifier_files):
+    """Test only JSON document files count as stored signifiers.
+
+    Args:
+        registry: SignifierRegistry instance
+        signifier_files: Dictionary of signifier file paths
+    """
+    with open(signifier_files["raise_blinds"], "r", encoding="utf-8") as f:
+        signifier = registry.create_from_rdf(f.read(), format="turtle")
+    json_dir = registry.store.json_dir
+    (json_dir / "notes.txt").write_text("x", encoding="utf-8")
+    (json_dir / "nested.json").mkdir()
+
+    assert registry.store.list_all_signifiers() == [signifier.signifier_id]
+
+
 def test_update_signifier_status(registry, signifier_files):
     """Test updating signifier status.
 
@@ -148,6 +243,63 @@ def test_update_signifier_status(registry, signifier_files):
     assert updated.status == SignifierStatus.DEPRECATED
     logger.info(f"Updated status to DEPRECATED for {signifier.signifier_id}")
 
+    stored = registry.get(signifier.signifier_id)
+    assert stored.status == SignifierStatus.DEPRECATED
+    assert stored.to_json_doc() == updated.to_json_doc()
+    assert registry.get_rdf_representation(signifier.signifier_id) == rdf_data
+    assert registry.update_status("missing", SignifierStatus.ACTIVE) is None
+
+
+def test_update_in_place_nested_edit(registry, signifier_files):
+    """Test update() persists in-place edits to nested fields.
+
+    Args:
+        registry: SignifierRegistry instance
+        signifier_files: Dictionary of signifier file paths
+    """
+    file_path = signifier_files["lower_blinds"]
+    with open(file_path, "r", encoding="utf-8") as f:
+        rdf_data = f.read()
+    signifier = registry.create_from_rdf(rdf_data, format="turtle")
+    rebuilt = Signifier.model_validate(signifier.model_dump())
+    assert signifier == rebuilt
+
+    signifier.to_json_doc()
+    signifier.intent.nl_text = "updated intent"
+    signifier.context.structured_conditions[0].value_conditions[0].value = 42
+    assert signifier.to_json_doc()["intent"]["nl_text"] == "updated intent"
+
+    registry.update(signifier, create_new_version=False)
+    retrieved = registry.get(signifier.signifier_id)
+    assert retrieved.intent.nl_text == "updated intent"
+    condition = retrieved.context.structured_conditions[0]
+    assert condition.value_conditions[0].value == 42
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_document_round_trip(
+    registry, signifier_files, monkeypatch, use_orjson
+):
+    """Test JSON documents round-trip with and without orjson.
+
+    Args:
+        registry: SignifierRegistry instance
+        signifier_files: Dictionary of signifier file paths
+        monkeypatch: Pytest monkeypatch fixture
+        use_orjson: Whether orjson is used for encoding
+    """
+    if not use_orjson:
+        monkeypatch.setattr(memory_store, "orjson", None)
+    elif memory_store.orjson is None:
+        pytest.skip("orjson not installed")
+
+    with open(signifier_files["turn_light_on"], "r", encoding="utf-8") as f:
+        signifier = registry.create_from_rdf(f.read(), format="turtle")
+
+    doc = registry.store.get_json_document(signifier.signifier_id)
+    assert doc == signifier.to_json_doc()
+    assert registry.store.get_json_document("missing") is None
+
 
 def test_property_index(registry, signifier_files):
     """Test property index functionality.
@@ -172,6 +324,101 @@ def test_property_index(registry, signifier_files):
     )
 
 
+def test_property_index_persisted(registry, test_storage_dir, signifier_files):
+    """Test the property index survives reopening and deletes are applied.
+
+    Args:
+        registry: SignifierRegistry instance
+        test_storage_dir: Test storage directory path
+        signifier_files: Dictionary of signifier file paths
+    """
+    created = []
+    for file_path in signifier_files.values():
+        with open(file_path, "r", encoding="utf-8") as f:
+            created.append(registry.create_from_rdf(f.read(), format="turtle"))
+    registry.delete(created[0].signifier_id)
+
+    store = registry.store
+    index = store.property_index
+    assert index
+    assert created[0].signifier_id not in set().union(*index.values())
+    assert store.find_by_property("urn:missing", "urn:missing") == []
+    assert SignifierRegistry(storage_dir=test_storage_dir).store.property_index == (
+        index
+    )
+
+
+def test_property_index_legacy_import(tmp_path):
+    """Test a legacy JSON property index seeds a new sqlite property index.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture
+    """
+    index_dir = tmp_path / "indexes"
+    index_dir.mkdir()
+    snapshot = {"urn:a|urn:p": ["sig1", "sig2"], "urn:b|urn:q": ["sig2"]}
+    (index_dir / "property_index.json").write_text(json.dumps(snapshot, indent=2))
+
+    store = MemoryStore(storage_dir=str(tmp_path))
+    expected = {("urn:a", "urn:p"): {"sig1", "sig2"}, ("urn:b", "urn:q"): {"sig2"}}
+    assert store.property_index == expected
+    store.close()
+
+    assert MemoryStore(storage_dir=str(tmp_path)).property_index == expected
+
+
+def test_registry_close(registry, test_storage_dir, signifier_files):
+    """Test closed registries release their index and share the load pool.
+
+    Args:
+        registry: SignifierRegistry instance
+        test_storage_dir: Test storage directory path
+        signifier_files: Dictionary of signifier file paths
+    """
+    with open(signifier_files["raise_blinds"], "r", encoding="utf-8") as f:
+        template = registry.repr_service.parse_rdf_signifier(f.read())
+    for i in range(10):
+        registry.create(template.model_copy(update={"signifier_id": f"sig-{i}"}))
+    registry.list_signifiers()
+
+    for _ in range(3):
+        replacement = SignifierRegistry(storage_dir=test_storage_dir)
+        assert len(replacement.list_signifiers()) == 10
+        replacement.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            replacement.find_by_property("urn:a", "urn:p")
+
+    load_threads = [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("registry-load")
+    ]
+    assert len(load_threads) <= registry_module._LOAD_WORKERS
+
+
+def test_registry_epoch(registry, test_storage_dir, signifier_files):
+    """Test that the storage epoch changes on writes and is shared.
+
+    Args:
+        registry: SignifierRegistry instance
+        test_storage_dir: Test storage directory path
+        signifier_files: Dictionary of signifier file paths
+    """
+    other = SignifierRegistry(storage_dir=test_storage_dir)
+    epoch = registry.epoch
+    assert other.epoch == epoch
+
+    with open(signifier_files["raise_blinds"], "r", encoding="utf-8") as f:
+        signifier = registry.create_from_rdf(f.read(), format="turtle")
+
+    assert registry.epoch != epoch
+    assert other.epoch == registry.epoch
+
+    epoch = registry.epoch
+    other.delete(signifier.signifier_id)
+    assert registry.epoch != epoch
+
+
 def test_rdf_round_trip(registry, signifier_files):
     """Test RDF storage and retrieval.
 
@@ -190,6 +437,153 @@ def test_rdf_round_trip(registry, signifier_files):
     logger.info(f"Retrieved RDF for {signifier.signifier_id}")
 
 
+def test_parsed_descriptions_not_shared(signifier_files):
+    """Test cached description parses hand out independent copies.
+
+    Args:
+        signifier_files: Dictionary of signifier file paths
+    """
+    rdf_data = Path(signifier_files["raise_blinds"]).read_text(encoding="utf-8")
+
+    first = RepresentationService.parse_rdf_signifier(rdf_data)
+    first.intent.structured["intent"] = "changed"
+    first.context.structured_conditions[0].value_conditions.clear()
+    second = RepresentationService.parse_rdf_signifier(rdf_data)
+
+    assert second.intent.structured["intent"] != "changed"
+    assert second.context.structured_conditions[0].value_conditions
+
+    assert json.loads(second.intent.structured_json()) == second.intent.structured
+    second.intent.structured["intent"] = "other"
+    assert json.loads(second.intent.structured_json()) == {"intent": "other"}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_generated_rdf_round_trip(monkeypatch, signifier_files, use_orjson):
+    """Test generated RDF parses back to the same descriptions.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture
+        signifier_files: Dictionary of signifier file paths
+        use_orjson: Whether orjson handles the JSON literals
+    """
+    if not use_orjson:
+        monkeypatch.setattr(representation, "orjson", None)
+        monkeypatch.setattr(signifier_module, "orjson", None)
+        representation._parse_json_cached.cache_clear()
+
+    for file_path in signifier_files.values():
+        original = RepresentationService.parse_rdf_signifier(
+            Path(file_path).read_text(encoding="utf-8")
+        )
+        original.intent.structured["limit"] = 2**70
+
+        generated = RepresentationService.generate_rdf(original)
+        parsed = RepresentationService.parse_rdf_signifier(generated)
+
+        assert parsed.intent.structured == original.intent.structured
+
+
+def test_store_rdf_graph_formats(registry, signifier_files):
+    """Test Turtle is stored verbatim and other formats are converted.
+
+    Args:
+        registry: SignifierRegistry instance
+        signifier_files: Dictionary of signifier file paths
+    """
+    with open(signifier_files["raise_blinds"], "r", encoding="utf-8") as f:
+        turtle = f.read()
+    store = registry.store
+
+    store.store_rdf_graph("sig-ttl", 1, turtle)
+    assert store._get_rdf_path("sig-ttl", 1).read_text(encoding="utf-8") == turtle
+
+    original = Graph().parse(data=turtle, format="turtle")
+    store.store_rdf_graph("sig-nt", 1, original.serialize(format="nt"), format="nt")
+    assert isomorphic(store.get_rdf_graph("sig-nt", 1), original)
+
+    with pytest.raises(ValueError):
+        store.store_rdf_graph("sig-bad", 1, "not turtle")
+    assert not store._get_rdf_path("sig-bad", 1).exists()
+
+
+def test_rdf_graph_cache(registry, signifier_files):
+    """Test parsed graphs are reused until the stored RDF changes.
+
+    Args:
+        registry: SignifierRegistry instance
+        signifier_files: Dictionary of signifier file paths
+    """
+    with open(signifier_files["raise_blinds"], "r", encoding="utf-8") as f:
+        turtle = f.read()
+    signifier = registry.create_from_rdf(turtle, format="turtle")
+    sig_id, version = signifier.signifier_id, signifier.version
+    store = registry.store
+
+    graph = store.get_rdf_graph(sig_id, version)
+    assert store.get_rdf_graph(sig_id, version) is graph
+    assert registry.get_rdf_representation(sig_id) == turtle
+    assert store.get_rdf_text(sig_id, version) == turtle
+
+    with open(signifier_files["lower_blinds"], "r", encoding="utf-8") as f:
+        store.store_rdf_graph(sig_id, version, f.read())
+    assert not isomorphic(store.get_rdf_graph(sig_id, version), graph)
+
+    registry.delete(sig_id)
+    assert store.get_rdf_graph(sig_id, version) is None
+    assert registry.get_rdf_representation(sig_id, version) is None
+
+
+def test_commit_signifier(registry, signifier_files):
+    """Test commits are all-or-nothing and create falls back to generated RDF.
+
+    Args:
+        registry: SignifierRegistry instance
+        signifier_files: Dictionary of signifier file paths
+    """
+    with open(signifier_files["raise_blinds"], "r", encoding="utf-8") as f:
+        turtle = f.read()
+    signifier = registry.repr_service.parse_rdf_signifier(turtle)
+    store = registry.store
+
+    with pytest.raises(ValueError):
+        store.commit_signifier(signifier, "not turtle")
+    assert not store.has_signifier(signifier.signifier_id)
+    assert not store.property_index
+
+    created = registry.create(signifier, "not turtle")
+    assert store.has_signifier(created.signifier_id)
+    assert store.property_index
+    assert store.get_rdf_graph(created.signifier_id, created.version) is not None
+
+
+def test_create_from_rdf_parses_once(registry, signifier_files, monkeypatch):
+    """Test Turtle with its own prefixes is parsed once and stored verbatim.
+
+    Args:
+        registry: SignifierRegistry instance
+        signifier_files: Dictionary of signifier file paths
+        monkeypatch: Pytest monkeypatch fixture
+    """
+    with open(signifier_files["raise_blinds"], "r", encoding="utf-8") as f:
+        turtle = f.read()
+    parses = []
+    original_parse = Graph.parse
+
+    def counting_parse(self, *args, **kwargs):
+        parses.append(kwargs.get("format"))
+        return original_parse(self, *args, **kwargs)
+
+    monkeypatch.setattr(Graph, "parse", counting_parse)
+    signifier = registry.create_from_rdf(turtle, format="turtle")
+
+    assert parses == ["turtle"]
+    assert (
+        registry.store.get_rdf_text(signifier.signifier_id, signifier.version)
+        == turtle
+    )
+
+
 def test_delete_signifier(registry, signifier_files):
     """Test deleting signifiers.
 
@@ -0,0 +1,87 @@
+"""Tests for the Ranker & Policy module."""
+
+import random
+
+import pytest
+
+from src.ranking import Ranker
+
+
+def _random_candidates(seed, n=200):
+    """Build random candidates covering every optional signal combination."""
+    rng = random.Random(seed)
+    candidates = []
+    for i in range(n):
+        candidate = {
+            "signifier_id": f"sig{i}",
+            "intent_similarity": rng.choice([0.0, 0.5, 1.0, rng.random()]),
+            "constraint_count": rng.choice([0, 0, 1, 3, 50]),
+        }
+        if rng.random() < 0.7:
+            candidate["shacl_has_shapes"] = rng.random() < 0.6
+            candidate["shacl_conforms"] = rng.random() < 0.6
+        if rng.random() < 0.7:
+            candidate["sse_pass"] = rng.random() < 0.6
+        candidates.append(candidate)
+    return candidates
+
+
+class TestRanker:
+    """Tests for Ranker."""
+
+    def test_gates_zero_score(self):
+        """Test failed SHACL gate yields a zero score."""
+        ranker = Ranker()
+        results = ranker.rank(
+            [
+                {
+                    "signifier_id": "ok",
+                    "intent_similarity": 0.9,
+                    "shacl_has_shapes": True,
+                    "shacl_conforms": True,
+                },
+                {
+                    "signifier_id": "bad",
+                    "intent_similarity": 1.0,
+                    "shacl_has_shapes": True,
+                    "shacl_conforms": False,
+                },
+            ]
+        )
+
+        assert [r.signifier_id for r in results] == ["ok", "bad"]
+        assert results[1].final_score == 0.0
+        assert results[1].passed_gates is False
+
+    @pytest.mark.parametrize("seed", range(4))
+    @pytest.mark.parametrize(
+        "shacl_gate,sse_gate", [(True, False), (False, True), (False, False)]
+    )
+    def test_rank_batch_matches_rank(self, seed, shacl_gate, sse_gate):
+        """Test vectorized ranking reproduces the scalar ranking exactly."""
+        ranker = Ranker(
+            weights={"intent_similarity": 0.6, "shacl": 0.3, "sse": 0.1},
+            enable_shacl_gate=shacl_gate,
+            enable_sse_gate=sse_gate,
+        )
+        candidates = _random_candidates(seed)
+
+        expected = [r.to_dict() for r in ranker.rank(candidates)]
+        actual = [r.to_dict() for r in ranker.rank_batch(candidates)]
+
+        assert actual == expected
+
+    def test_explanation_built_on_access(self):
+        """Test signals and explanation are materialized lazily."""
+        result = Ranker().rank(
+            [{"signifier_id": "sig", "intent_similarity": 0.5, "constraint_count": 2}]
+        )[0]
+
+        assert "explanation" not in vars(result)
+        assert result.explanation[0].startswith("Intent similarity: 0.5000")
+        assert result.explanation[-1].startswith("Specificity boost")
+        assert [s.name for s in result.signals] == ["intent_similarity"]
+
+    def test_rank_batch_empty(self):
+        """Test vectorized ranking of no candidates."""
+        assert Ranker().rank_batch([]) == []
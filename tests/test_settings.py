@@ -0,0 +1,74 @@
+"""Tests for application settings loading."""
+
+import dataclasses
+
+import pytest
+
+from src.config.settings import Settings
+
+
+class TestSettings:
+    """Tests for environment-backed Settings."""
+
+    def test_defaults(self):
+        """Test defaults when no environment overrides are present."""
+        settings = Settings.from_env(env_file=None)
+
+        assert settings.storage_dir
+        assert settings.latency_budgets_ms["total"] == 150
+
+    def test_environment_overrides(self, monkeypatch):
+        """Test that typed values are read from the environment."""
+        monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+        monkeypatch.setenv("ENABLE_AUTHORING_VALIDATION", "true")
+        monkeypatch.setenv("EMBEDDING_NUM_THREADS", "2")
+        monkeypatch.setenv("ENABLED_MODULES", '["sr:v2"]')
+
+        settings = Settings.from_env(env_file=None)
+
+        assert settings.log_level == "DEBUG"
+        assert settings.enable_authoring_validation is True
+        assert settings.embedding_num_threads == 2
+        assert settings.enabled_modules == ["sr:v2"]
+
+    def test_env_file(self, tmp_path, monkeypatch):
+        """Test reading values from a dotenv file."""
+        monkeypatch.delenv("STORAGE_DIR", raising=False)
+        env_file = tmp_path / ".env"
+        env_file.write_text('# comment\nSTORAGE_DIR="/tmp/signifiers"\n')
+
+        settings = Settings.from_env(env_file=str(env_file))
+
+        assert settings.storage_dir == "/tmp/signifiers"
+
+    def test_invalid_value(self, monkeypatch):
+        """Test that unconvertible values raise ValueError."""
+        monkeypatch.setenv("EMBEDDING_NUM_THREADS", "many")
+
+        with pytest.raises(ValueError, match="embedding_num_threads"):
+            Settings.from_env(env_file=None)
+
+    @pytest.mark.parametrize(
+        "raw,expected", [("TRUE", True), ("on", True), ("0", False), (" no ", False)]
+    )
+    def test_bool_values(self, monkeypatch, raw, expected):
+        """Test the accepted true and false spellings."""
+        monkeypatch.setenv("ENABLE_AUTHORING_VALIDATION", raw)
+
+        settings = Settings.from_env(env_file=None)
+
+        assert settings.enable_authoring_validation is expected
+
+    def test_invalid_bool(self, monkeypatch):
+        """Test that unrecognized booleans raise instead of meaning False."""
+        monkeypatch.setenv("ENABLE_AUTHORING_VALIDATION", "ture")
+
+        with pytest.raises(ValueError, match="enable_authoring_validation"):
+            Settings.from_env(env_file=None)
+
+    def test_frozen(self):
+        """Test that settings are immutable."""
+        settings = Settings()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            settings.log_level = "DEBUG"
@@ -0,0 +1,187 @@
+"""Tests for the Structured Subsumption Engine."""
+
+import random
+import sys
+
+import pytest
+
+from src.models.signifier import (
+    _ALLOWED_OPERATORS,
+    IntentContext,
+    StructuredCondition,
+    ValueCondition,
+)
+from src.subsumption import SSE
+
+
+@pytest.fixture
+def conditions():
+    """Structured conditions on two light sensor properties."""
+    return [
+        StructuredCondition(
+            artifact="http://example.org/artifacts/sensor1",
+            property_affordance="http://example.org/LightSensor#hasLuminosity",
+            value_conditions=[ValueCondition(operator="lessThan", value=100)],
+        ),
+        StructuredCondition(
+            artifact="http://example.org/artifacts/sensor1",
+            property_affordance="http://example.org/LightSensor#isOn",
+            value_conditions=[ValueCondition(operator="equals", value=True)],
+        ),
+    ]
+
+
+class TestSSE:
+    """Tests for SSE evaluation."""
+
+    @pytest.mark.parametrize("policy", ["fail", "ignore", "pass"])
+    def test_missing_result_matches_evaluate(self, conditions, policy):
+        """Test missing_result equals evaluating against an unrelated context."""
+        sse = SSE(missing_value_policy=policy)
+        context = {"http://example.org/artifacts/other": {"http://ex/p": 1}}
+
+        expected = sse.evaluate(conditions, context)
+        result = sse.missing_result(conditions)
+
+        assert result.to_dict() == expected.to_dict()
+
+    def test_property_keys_follow_conditions(self, conditions):
+        """Test property_keys is rebuilt when conditions change."""
+        context = IntentContext(structured_conditions=conditions[:1])
+
+        assert context.property_keys == {
+            (conditions[0].artifact, conditions[0].property_affordance)
+        }
+
+        context.structured_conditions.append(conditions[1])
+        assert len(context.property_keys) == 2
+
+        context.structured_conditions = []
+        assert context.property_keys == frozenset()
+
+    def test_cached_values_ignored_in_equality(self, conditions):
+        """Test memoized derived values do not affect model equality."""
+        shapes = "ex:Shape sh:property [ sh:path ex:p ] ."
+        context = IntentContext(structured_conditions=conditions, shacl_shapes=shapes)
+        other = context.model_copy(deep=True)
+
+        assert context.constraint_count == 1
+        assert context.property_keys
+        context.attach_shapes_graph(object())
+        assert context == other
+
+    def test_invalid_operator_rejected(self):
+        """Test ValueCondition validates its operator at construction."""
+        with pytest.raises(ValueError):
+            ValueCondition(operator="between", value=1)
+
+    @pytest.mark.parametrize("coercion", [True, False])
+    def test_numeric_fast_path_matches_generic(self, coercion):
+        """Test plain numeric comparisons agree with the coercing path."""
+        sse = SSE(enable_type_coercion=coercion)
+        values = [0, 1, 2.5, -3, True, False, "2.5", "abc", None]
+        operators = [
+            "greaterThan",
+            "lessThan",
+            "greaterEqual",
+            "lessEqual",
+            "equals",
+            "notEquals",
+        ]
+
+        for expected in values:
+            for actual in values:
+                conditions = [
+                    StructuredCondition(
+                        artifact="urn:a",
+                        property_affordance="urn:p",
+                        value_conditions=[
+                            ValueCondition(operator=op, value=expected)
+                            for op in operators
+                        ],
+                    )
+                ]
+                result = sse.evaluate(conditions, {"urn:a": {"urn:p": actual}})
+
+                failed = {v.operator for v in result.violations}
+                generic = {
+                    vc.operator
+                    for vc in conditions[0].value_conditions
+                    if not sse._evaluate_condition(vc, actual)
+                }
+                assert failed == generic
+
+    def test_operator_interned(self):
+        """Test operators and URIs built at runtime share interned strings."""
+        operator = "".join(["less", "Than"])
+        artifact = "".join(["urn:", "artifact"])
+
+        assert ValueCondition(operator=operator, value=1).operator is sys.intern(
+            operator
+        )
+        datatype = "".join(["xsd:", "integer"])
+        value_condition = ValueCondition(operator="equals", value=1, datatype=datatype)
+        assert value_condition.datatype is sys.intern(datatype)
+        condition = StructuredCondition(artifact=artifact, property_affordance="p")
+        assert condition.artifact is sys.intern(artifact)
+
+    @pytest.mark.parametrize("policy", ["fail", "ignore", "pass"])
+    def test_evaluate_batch_matches_evaluate(self, policy):
+        """Test batch evaluation reproduces per-context evaluation."""
+        rng = random.Random(policy)
+        sse = SSE(missing_value_policy=policy)
+        values = [0, 1, 7, 2.5, -3.0, 2**60, True, "5", "abc", None, float("nan")]
+        operators = sorted(_ALLOWED_OPERATORS)
+        conditions = [
+            StructuredCondition(
+                artifact=f"urn:a{i % 2}",
+                property_affordance=f"urn:p{i}",
+                value_conditions=[
+                    ValueCondition(operator=rng.choice(operators), value=v)
+                    for v in rng.sample(values, 3)
+                ],
+            )
+            for i in range(4)
+        ]
+        contexts = []
+        for _ in range(64):
+            context = {"urn:a0": {}, "urn:a1": {}}
+            for i in range(4):
+                if rng.random() < 0.8:
+                    context[f"urn:a{i % 2}"][f"urn:p{i}"] = rng.choice(values)
+            contexts.append(context)
+
+        expected = [sse.evaluate(conditions, c).to_dict() for c in contexts]
+        actual = [r.to_dict() for r in sse.evaluate_batch(conditions, contexts)]
+
+        assert repr(actual) == repr(expected)
+
+    @pytest.mark.parametrize("policy", ["fail", "ignore", "pass"])
+    def test_short_circuit_stops_at_first_violation(self, conditions, policy):
+        """Test short-circuit evaluation reports the first violation only."""
+        sse = SSE(missing_value_policy=policy)
+        contexts = [
+            {},
+            {"http://example.org/artifacts/sensor1": {}},
+            {
+                "http://example.org/artifacts/sensor1": {
+                    "http://example.org/LightSensor#hasLuminosity": 500,
+                    "http://example.org/LightSensor#isOn": False,
+                }
+            },
+            {
+                "http://example.org/artifacts/sensor1": {
+                    "http://example.org/LightSensor#hasLuminosity": 50,
+                    "http://example.org/LightSensor#isOn": True,
+                }
+            },
+        ]
+
+        for context in contexts:
+            full = sse.evaluate(conditions, context)
+            short = sse.evaluate(conditions, context, short_circuit=True)
+
+            assert short.sse_pass == full.sse_pass
+            assert short.violations == full.violations[:1]
+            if full.sse_pass:
+                assert short.to_dict() == full.to_dict()
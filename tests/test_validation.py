@@ -4,8 +4,12 @@ This module tests SHACL validation, context graph building,
 and authoring validation.
 """
 
+import gc
+import sys
+
 import pytest
 from rdflib import Graph
+from rdflib.namespace import XSD
 
 from src.models.signifier import (
     IntentContext,
@@ -18,6 +22,9 @@ from src.validation import (
     AuthoringValidator,
     ContextGraphBuilder,
     SHACLValidator,
+    ViolationBatch,
+    authoring_validator,
+    context_builder,
 )
 
 
@@ -76,6 +83,104 @@ class TestContextGraphBuilder:
 
         assert len(graph) == 2
 
+    def test_literals_shared_and_typed(self):
+        """Test cached literals keep datatypes and lexical forms."""
+        builder = ContextGraphBuilder()
+
+        assert builder._convert_to_literal(7) is builder._convert_to_literal(7)
+        assert builder._convert_to_literal(True).datatype == XSD.boolean
+        assert builder._convert_to_literal(1).datatype == XSD.integer
+        assert builder._convert_to_literal(1.0).datatype == XSD.double
+        assert str(builder._convert_to_literal(0.0)) == "0.0"
+        assert str(builder._convert_to_literal(-0.0)) == "-0.0"
+
+    def test_normalize_context_detects_format(self):
+        """Test flat and nested dicts are told apart by their keys."""
+        builder = ContextGraphBuilder()
+
+        flat, flat_features = builder.normalize_context({"urn:a::urn:p": 1})
+        nested, nested_features = builder.normalize_context({"urn:a": {"urn:p": 1}})
+        empty, empty_features = builder.normalize_context({})
+
+        assert set(flat) == set(nested)
+        assert flat_features == nested_features == {("urn:a", "urn:p"): 1}
+        assert len(empty) == 0 and empty_features == {}
+
+    def test_backend_falls_back_to_memory(self, monkeypatch):
+        """Test the Oxigraph backend degrades to rdflib's memory store."""
+        monkeypatch.setattr(context_builder, "oxrdflib", None)
+
+        builder = ContextGraphBuilder(backend="oxigraph")
+        graph, _ = builder.build_from_kv({"urn:a": {"urn:p": 1}})
+        shapes = SHACLValidator(backend="oxigraph").parse_shapes("<urn:s> <urn:p> 1 .")
+
+        assert type(graph.store) is type(Graph().store)
+        assert type(shapes.store) is type(Graph().store)
+        with pytest.raises(ValueError):
+            ContextGraphBuilder(backend="sqlite")
+
+    def test_oxigraph_backend_matches_memory(self):
+        """Test Oxigraph-backed graphs validate exactly like memory graphs."""
+        if context_builder.oxrdflib is None:
+            pytest.skip("oxrdflib not installed")
+
+        shapes = """
+        @prefix sh: <http://www.w3.org/ns/shacl#> .
+        @prefix ex: <http://example.org/> .
+        @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+        ex:LevelShape a sh:NodeShape ;
+            sh:targetNode ex:sensor ;
+            sh:property [
+                sh:path ex:level ;
+                sh:datatype xsd:integer ;
+                sh:minInclusive 100
+            ] , [
+                sh:path ex:label ;
+                sh:datatype xsd:string ;
+                sh:minLength 3
+            ] , [
+                sh:path ex:ratio ;
+                sh:maxInclusive 0.5
+            ] , [
+                sh:path ex:on ;
+                sh:hasValue true
+            ] .
+        """
+        contexts = [
+            {
+                "http://example.org/sensor": {
+                    "http://example.org/level": 150,
+                    "http://example.org/on": True,
+                }
+            },
+            {
+                "http://example.org/sensor": {
+                    "http://example.org/level": 50,
+                    "http://example.org/label": "ab",
+                    "http://example.org/ratio": 0.75,
+                    "http://example.org/on": False,
+                }
+            },
+        ]
+
+        outcomes = {}
+        for backend in ("memory", "oxigraph"):
+            builder = ContextGraphBuilder(backend=backend)
+            validator = SHACLValidator(enable_caching=False, backend=backend)
+            shapes_graph = validator.parse_shapes(shapes)
+            outcomes[backend] = []
+            for context in contexts:
+                graph, _ = builder.build_from_kv(context)
+                result = validator.validate(graph, shapes_graph, use_cache=False)
+                violations = sorted(
+                    result.violations.to_dicts(), key=lambda v: sorted(v.items())
+                )
+                outcomes[backend].append((result.conforms, violations))
+
+        assert [conforms for conforms, _ in outcomes["memory"]] == [True, False]
+        assert outcomes["oxigraph"] == outcomes["memory"]
+
     def test_normalize_context_graph_input(self):
         """Test normalizing context when input is already a graph."""
         builder = ContextGraphBuilder()
@@ -85,6 +190,31 @@ class TestContextGraphBuilder:
 
         assert result_graph == input_graph
 
+    def test_graph_features_lazy(self):
+        """Test features of a graph input match eager extraction."""
+        builder = ContextGraphBuilder()
+        graph = Graph().parse(
+            data="""
+            @prefix ex: <http://example.org/> .
+            ex:sensor1 ex:level 15000 ; ex:on true ; ex:kind ex:Light .
+            _:b ex:level 3 .
+            """,
+            format="turtle",
+        )
+
+        _, features = builder.normalize_context(graph)
+        key = ("http://example.org/sensor1", "http://example.org/level")
+
+        assert features[key] == 15000
+        assert features._features is None
+        assert ("http://example.org/sensor1", "urn:missing") not in features
+        assert "not-a-pair" not in features
+        assert features == builder._extract_features_from_graph(graph)
+        assert len(features) == 3
+        artifact, prop = next(iter(features))
+        assert type(artifact) is str and artifact is sys.intern(artifact)
+        assert type(prop) is str and prop is sys.intern(prop)
+
 
 class TestSHACLValidator:
     """Tests for SHACL Validator."""
@@ -111,6 +241,46 @@ class TestSHACLValidator:
 
         assert len(shapes_graph) > 0
 
+    def test_parsed_shapes_memoized(self):
+        """Test identical shapes text is parsed only once."""
+        validator = SHACLValidator(enable_caching=False)
+
+        shapes = """
+        @prefix sh: <http://www.w3.org/ns/shacl#> .
+        @prefix ex: <http://example.org/> .
+
+        ex:TestShape a sh:NodeShape ;
+            sh:targetNode ex:artifact1 .
+        """
+
+        first = validator.parse_shapes(shapes)
+        second = validator.parse_shapes(shapes)
+
+        assert first is second
+        assert validator.get_cache_stats()["shapes_size"] == 1
+
+        crlf = shapes.replace("\n", "\r\n")
+        assert validator.parse_shapes(crlf) is first
+        assert validator.parse_shapes(crlf.encode()) is first
+
+        validator.clear_cache()
+        assert validator.parse_shapes(shapes) is not first
+
+    def test_parsed_shapes_bounded(self):
+        """Test the parsed shapes memo evicts least recently used graphs."""
+        validator = SHACLValidator(enable_caching=False, shapes_cache_size=2)
+        texts = [f"<urn:s> <urn:p> {i} ." for i in range(3)]
+
+        first = validator.parse_shapes(texts[0])
+        validator.parse_shapes(texts[1])
+        assert validator.parse_shapes(texts[0]) is first
+        validator.parse_shapes(texts[2])
+
+        assert validator.get_cache_stats()["shapes_size"] == 2
+        assert validator.parse_shapes(texts[0]) is first
+        assert id(first) in validator._shape_digests
+        assert len(validator._shape_digests) == 2
+
     def test_validate_conforming(self):
         """Test validation with conforming data."""
         validator = SHACLValidator(enable_caching=False)
@@ -178,6 +348,18 @@ class TestSHACLValidator:
 
         assert result.conforms is False
         assert len(result.violations) > 0
+        assert isinstance(result.violations, ViolationBatch)
+        assert result.violations[:1] == [result.violations[0]]
+        assert result.to_dict()["violations"] == [
+            v.to_dict() for v in result.violations
+        ]
+        violation = result.violations[0]
+        assert violation.focus_node == "http://example.org/artifact1"
+        assert violation.result_path == "http://example.org/prop1"
+        assert violation.value == "50"
+        assert violation.source_constraint_component.endswith(
+            "MinInclusiveConstraintComponent"
+        )
 
     def test_validation_caching(self):
         """Test validation result caching."""
@@ -213,6 +395,155 @@ class TestSHACLValidator:
         stats = validator.get_cache_stats()
         assert stats["size"] > 0
 
+    @pytest.mark.parametrize("store_report_graph", [False, True])
+    def test_validation_cache_bounded(self, store_report_graph):
+        """Test the validation cache evicts least recently used results."""
+        validator = SHACLValidator(
+            cache_size=2, store_report_graph=store_report_graph
+        )
+        shapes_graph = validator.parse_shapes(
+            """
+            @prefix sh: <http://www.w3.org/ns/shacl#> .
+            @prefix ex: <http://example.org/> .
+
+            ex:TestShape a sh:NodeShape ;
+                sh:targetNode ex:artifact1 .
+            """
+        )
+        graphs = [
+            Graph().parse(data=f"<urn:a> <urn:p> {i} .", format="turtle")
+            for i in range(3)
+        ]
+
+        first = validator.validate(graphs[0], shapes_graph)
+        assert first.validation_report_graph is not None
+        validator.validate(graphs[1], shapes_graph)
+        cached = validator.validate(graphs[0], shapes_graph)
+        validator.validate(graphs[2], shapes_graph)
+
+        assert cached.conforms is first.conforms
+        assert (cached.validation_report_graph is not None) is store_report_graph
+        stats = validator.get_cache_stats()
+        assert (stats["currsize"], stats["maxsize"]) == (2, 2)
+        assert (stats["hits"], stats["misses"]) == (1, 3)
+
+        validator.validate(graphs[0], shapes_graph)
+        validator.validate(graphs[1], shapes_graph)
+        stats = validator.get_cache_stats()
+        assert (stats["hits"], stats["misses"]) == (2, 4)
+
+    def test_inference_only_when_needed(self):
+        """Test RDFS inference runs only when shapes or data need it."""
+        validator = SHACLValidator(enable_caching=False)
+        prefixes = """
+        @prefix sh: <http://www.w3.org/ns/shacl#> .
+        @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+        @prefix ex: <http://example.org/> .
+        """
+        plain = validator.parse_shapes(
+            prefixes + "ex:S a sh:NodeShape ; sh:targetNode ex:a ."
+        )
+        typed = validator.parse_shapes(
+            prefixes
+            + "ex:S a sh:NodeShape ; sh:targetNode ex:a ;"
+            + " sh:property [ sh:path rdf:type ; sh:maxCount 1 ] ."
+        )
+        data = Graph().parse(data=prefixes + "ex:a ex:p 1 .", format="turtle")
+        schema = Graph().parse(
+            data=prefixes + "ex:a ex:p 1 . ex:p rdfs:domain ex:C .",
+            format="turtle",
+        )
+
+        assert validator._inference_mode(data, plain) == "none"
+        assert validator._inference_mode(schema, plain) == "rdfs"
+        assert validator._inference_mode(data, typed) == "rdfs"
+        assert validator._inference_mode(data, Graph()) == "rdfs"
+
+        by_class = validator.parse_shapes(
+            prefixes
+            + "ex:S a sh:NodeShape ; sh:targetClass ex:C ;"
+            + " sh:property [ sh:path ex:q ; sh:minCount 1 ] ."
+        )
+        forced = validator.validate(schema, by_class, force_inference="none")
+        assert forced.conforms is True
+        assert validator.validate(schema, by_class).conforms is False
+
+    def test_cache_key_graph_hash_memoized(self, monkeypatch):
+        """Test graph hashes are reused only for graphs vouched stable."""
+        validator = SHACLValidator(enable_caching=True)
+        data_graph = Graph().parse(data="<urn:a> <urn:p> 1 .", format="turtle")
+        shapes_graph = Graph().parse(data="<urn:s> <urn:p> 2 .", format="turtle")
+
+        serialized = []
+        digest = SHACLValidator._graph_digest
+
+        def counting_digest(graph):
+            serialized.append(graph)
+            return digest(graph)
+
+        monkeypatch.setattr(validator, "_graph_digest", counting_digest)
+
+        key = validator._compute_cache_key(data_graph, shapes_graph, True)
+        assert validator._compute_cache_key(data_graph, shapes_graph, True) == key
+        assert serialized == [data_graph, shapes_graph]
+
+        validator._compute_cache_key(data_graph, shapes_graph)
+        assert serialized == [data_graph, shapes_graph, data_graph]
+
+        serialized.clear()
+        del data_graph
+        gc.collect()
+        assert len(validator._graph_hashes) == 1
+
+    def test_graph_digest_canonical(self):
+        """Test graph digests ignore triple insertion order."""
+        data = "<urn:a> <urn:p> 1, 2 .\n<urn:b> <urn:p> \"x\"@en ."
+        first = Graph().parse(data=data, format="turtle")
+        second = Graph()
+        for triple in sorted(first, reverse=True):
+            second.add(triple)
+
+        assert SHACLValidator._graph_digest(first) == SHACLValidator._graph_digest(
+            second
+        )
+        second.remove((None, None, None))
+        assert SHACLValidator._graph_digest(first) != SHACLValidator._graph_digest(
+            second
+        )
+
+    def test_constraint_count_follows_shapes(self):
+        """Test constraint_count is recomputed when shapes are reassigned."""
+        context = IntentContext(
+            shacl_shapes="ex:S sh:property [ ] ; sh:property [ sh:class ex:C ] ."
+        )
+
+        assert context.constraint_count == 3
+        assert context.constraint_count == 3
+
+        context.shacl_shapes = "ex:S sh:property [ ] ."
+        assert context.constraint_count == 1
+
+        context.shacl_shapes = (
+            "_:s <http://www.w3.org/ns/shacl#property> _:p .\n"
+            "_:p <http://www.w3.org/ns/shacl#class> <urn:C> .\n"
+        )
+        assert context.constraint_count == 2
+
+        assert IntentContext().constraint_count == 0
+
+    def test_shapes_graph_follows_shapes(self):
+        """Test an attached shapes graph is dropped when shapes change."""
+        context = IntentContext(shacl_shapes="ex:S sh:property [ ] .")
+        assert context.shapes_graph is None
+
+        shapes_graph = Graph()
+        context.attach_shapes_graph(shapes_graph)
+        assert context.shapes_graph is shapes_graph
+
+        context.shacl_shapes = "ex:S sh:property [ ] ; sh:class ex:C ."
+        assert context.shapes_graph is None
+
 
 class TestAuthoringValidator:
     """Tests for Authoring Validator."""
@@ -276,6 +607,42 @@ class TestAuthoringValidator:
         assert len(errors) > 0
         assert any("parse" in err.lower() for err in errors)
 
+    def test_shacl_shape_check_cached(self):
+        """Test repeated shapes are checked once and results are not shared."""
+        shapes = """
+        @prefix sh: <http://www.w3.org/ns/shacl#> .
+        <#S> a sh:NodeShape ; sh:property [ sh:datatype <urn:t> ] .
+        """
+
+        first = AuthoringValidator()._check_shacl_shapes(shapes)
+        first.append("extra")
+        hits = authoring_validator._validate_shapes.cache_info().hits
+        second = AuthoringValidator()._check_shacl_shapes(shapes)
+
+        assert authoring_validator._validate_shapes.cache_info().hits == hits + 1
+        assert len(second) == 2
+        assert "no target" in second[0]
+        assert "missing sh:path" in second[1]
+
+        shapes_graph = Graph().parse(data=shapes, format="turtle")
+        from_graph = AuthoringValidator()._check_shacl_shapes("", shapes_graph)
+        assert len(from_graph) == 2
+
+    def test_shacl_shape_warnings_logged_each_check(self, caplog):
+        """Test warnings from cached shape checks are logged on every call."""
+        shapes = """
+        @prefix sh: <http://www.w3.org/ns/shacl#> .
+        <urn:S> a sh:NodeShape ; sh:targetNode <urn:n> ;
+            sh:property [ sh:path <urn:p> ; sh:datatype <urn:custom> ] .
+        """
+
+        with caplog.at_level("WARNING", logger=authoring_validator.__name__):
+            for _ in range(2):
+                assert AuthoringValidator()._check_shacl_shapes(shapes) == []
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert messages.count("Unusual datatype for urn:p: urn:custom") == 2
+
     def test_validate_and_raise_strict_mode(self):
         """Test strict mode raises exception on validation failure."""
         validator = AuthoringValidator(strict_mode=True)